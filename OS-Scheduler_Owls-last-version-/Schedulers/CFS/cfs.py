@@ -0,0 +1,362 @@
+import os
+import sys
+
+# Add the project root to the path for the shared profiling hooks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Schedulers.profiling import phase
+import heapq
+from collections import deque
+
+# Linux sched_prio_to_weight: load weight of nice -20 .. 19 (nice 0 = 1024, ~1.25x per level)
+NICE_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15
+]
+NICE_0_WEIGHT = 1024
+
+# Priority that maps to nice 0; lower priority numbers are more important, like nice levels
+NICE_0_PRIORITY = 10
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority):
+        self.pid = pid
+        self.arrival_time = float(arrival_time)
+        self.burst_time = float(burst_time)
+        self.priority = int(priority)
+        self.remaining_time = float(burst_time)
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+
+def read_processes(file_path):
+    """Read processes from the processes.txt file."""
+    processes = []
+    try:
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            # Read each process
+            for line in file:
+                # Split by whitespace and remove empty strings
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    pid = data[0]
+                    arrival_time = float(data[1])
+                    burst_time = float(data[2])
+                    priority = int(data[3])
+                    processes.append(Process(pid, arrival_time, burst_time, priority))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    return processes
+
+def priority_to_weight(priority):
+    """Load weight of a process: priority NICE_0_PRIORITY is nice 0, clamped to nice -20..19."""
+    nice = min(max(priority - NICE_0_PRIORITY, -20), 19)
+    return NICE_TO_WEIGHT[nice + 20]
+
+class RunQueue:
+    """
+    Runnable processes ordered by virtual runtime.
+    - A binary heap of (vruntime, sequence, process) entries gives O(log n) pick-next
+    - Changing a process' vruntime or removing it only bumps its version; entries
+      with an old version are skipped (lazy deletion) when they reach the top
+    - The running process stays in the queue, as the sum of weights includes it
+    """
+    def __init__(self):
+        self.heap = []
+        self.count = 0
+        self.total_weight = 0
+        self.sequence = 0
+
+    def _push_entry(self, process):
+        process['version'] += 1
+        self.sequence += 1
+        heapq.heappush(self.heap, (process['vruntime'], self.sequence, process['version'], process))
+
+    def push(self, process):
+        self.count += 1
+        self.total_weight += process['weight']
+        self._push_entry(process)
+
+    def update(self, process):
+        """Re-key a queued process after its vruntime changed."""
+        self._push_entry(process)
+
+    def remove(self, process):
+        self.count -= 1
+        self.total_weight -= process['weight']
+        process['version'] += 1
+
+    def peek(self):
+        """Queued process with the smallest vruntime (None when empty)."""
+        heap = self.heap
+        while heap and heap[0][2] != heap[0][3]['version']:
+            heapq.heappop(heap)
+        return heap[0][3] if heap else None
+
+    def __len__(self):
+        return self.count
+
+def cfs_scheduling(processes, target_latency=6.0, min_granularity=0.75, wakeup_granularity=1.0,
+                   context_switch=0.0, cache_penalty=0.0, verbose=True, return_history=False):
+    """
+    Implement a Completely Fair Scheduler (CFS) like algorithm.
+    - Every process has a weight derived from its priority (like a nice level);
+      running for t time units advances its virtual runtime by t * 1024 / weight
+    - The process with the smallest virtual runtime runs next
+    - Each process runs for a slice of the scheduling period proportional to its
+      weight; the period is target_latency, stretched so no slice is shorter than
+      min_granularity when many processes are runnable
+    - A new process starts at the queue's minimum virtual runtime and preempts the
+      running one when it is more than wakeup_granularity behind it
+    - context_switch and cache_penalty model the dispatch overhead like Round Robin;
+      switches are recorded as 'kind': 'switch' slices in the execution history
+    - verbose=False suppresses the execution trace
+    - return_history=True also returns the execution slices: (results, execution_history)
+    """
+    if not processes:
+        return ([], []) if return_history else []
+    if target_latency <= 0 or min_granularity <= 0:
+        raise ValueError("Target latency and minimum granularity must be positive.")
+
+    # Create working copies of processes
+    process_list = []
+    for p in processes:
+        process_list.append({
+            'pid': p.pid,
+            'arrival': p.arrival_time,
+            'burst': p.burst_time,
+            'priority': p.priority,
+            'weight': priority_to_weight(p.priority),
+            'remaining': p.burst_time,
+            'vruntime': 0.0,
+            'version': 0,
+            'completion': 0,
+            'first_response': -1,  # Track when process first gets CPU
+            'last_execution': p.arrival_time,  # End of the last slice, used for waiting time
+            'waiting': 0
+        })
+
+    # Sort processes by arrival time
+    process_list.sort(key=lambda x: x['arrival'])
+    process_list = deque(process_list)
+
+    current_time = process_list[0]['arrival']  # Start with first arrival
+    min_vruntime = 0.0
+    completed = []
+    run_queue = RunQueue()
+    execution_history = []
+    current_process = None
+    slice_length = 0.0
+    slice_used = 0.0
+    last_pid = None
+
+    if verbose:
+        print(f"\nCFS Execution Sequence (Target Latency = {target_latency}, Min Granularity = {min_granularity}):")
+        print("=" * 80)
+
+    while process_list or len(run_queue):
+        # Add newly arrived processes at the current minimum virtual runtime
+        arrived = False
+        while process_list and process_list[0]['arrival'] <= current_time:
+            new_process = process_list.popleft()
+            new_process['vruntime'] = max(new_process['vruntime'], min_vruntime)
+            run_queue.push(new_process)
+            arrived = True
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived "
+                      f"(Weight: {new_process['weight']}, Vruntime: {new_process['vruntime']:.2f})")
+
+        if not len(run_queue):
+            if process_list:
+                current_time = process_list[0]['arrival']
+                continue
+            break
+
+        # Pick next: keep the running process until its slice ends, unless a new
+        # arrival is far enough behind it in virtual runtime
+        leftmost = run_queue.peek()
+        if current_process is None or slice_used >= slice_length:
+            next_process = leftmost
+        elif arrived and current_process['vruntime'] - leftmost['vruntime'] > wakeup_granularity:
+            next_process = leftmost
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {leftmost['pid']} preempts {current_process['pid']}")
+        else:
+            next_process = current_process
+
+        if next_process is not current_process or slice_used >= slice_length:
+            # Weighted share of the scheduling period
+            period = max(target_latency, len(run_queue) * min_granularity)
+            slice_length = max(period * next_process['weight'] / run_queue.total_weight, min_granularity)
+            slice_used = 0.0
+        current_process = next_process
+
+        # Pay the context switch cost when the CPU moves to a different process
+        if last_pid is not None and last_pid != current_process['pid']:
+            overhead = context_switch
+            if current_process['remaining'] < current_process['burst']:
+                overhead += cache_penalty
+            if overhead > 0:
+                execution_history.append({
+                    'pid': current_process['pid'],
+                    'start': current_time,
+                    'end': current_time + overhead,
+                    'kind': 'switch'
+                })
+                if verbose:
+                    print(f"Time {current_time:.1f}-{current_time + overhead:.1f}: "
+                          f"Context switch to {current_process['pid']}")
+                current_time += overhead
+        last_pid = current_process['pid']
+
+        # Track first response time
+        if current_process['first_response'] == -1:
+            current_process['first_response'] = current_time
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} gets CPU first time")
+
+        # Run until the slice ends, the process finishes or the next process arrives
+        execution_time = min(slice_length - slice_used, current_process['remaining'])
+        if process_list:
+            execution_time = min(execution_time, max(process_list[0]['arrival'] - current_time, 0.0))
+        execution_end = current_time + execution_time
+
+        if execution_time > 0:
+            execution_history.append({
+                'pid': current_process['pid'],
+                'start': current_time,
+                'end': execution_end
+            })
+            if verbose:
+                print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {current_process['pid']} "
+                      f"(Vruntime: {current_process['vruntime']:.2f}, Remaining: {current_process['remaining']:.1f})")
+
+        # Update process state (waiting time is the gap since its previous slice)
+        current_process['waiting'] += current_time - current_process['last_execution']
+        current_process['last_execution'] = execution_end
+        current_process['remaining'] -= execution_time
+        current_process['vruntime'] += execution_time * NICE_0_WEIGHT / current_process['weight']
+        slice_used += execution_time
+        current_time = execution_end
+
+        # Handle process completion or re-key it in the run queue
+        if current_process['remaining'] <= 0:
+            current_process['completion'] = current_time
+            run_queue.remove(current_process)
+            completed.append(current_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} completed")
+            current_process = None
+        else:
+            run_queue.update(current_process)
+
+        # min_vruntime only moves forward, so new arrivals cannot claim a backlog of CPU time
+        leftmost = run_queue.peek()
+        if leftmost is not None:
+            min_vruntime = max(min_vruntime, leftmost['vruntime'])
+
+    if verbose:
+        print("=" * 80)
+
+    # Calculate timing metrics
+    results = []
+    for process in completed:
+        turnaround_time = process['completion'] - process['arrival']
+
+        results.append({
+            "Process ID": process['pid'],
+            "Arrival Time": process['arrival'],
+            "Burst Time": process['burst'],
+            "Completion Time": process['completion'],
+            "Turnaround Time": turnaround_time,
+            "Waiting Time": process['waiting'],
+            "First Response": process['first_response']
+        })
+
+    results = sorted(results, key=lambda x: x["Process ID"])
+    if return_history:
+        return results, execution_history
+    return results
+
+def print_results(results):
+    """Print the scheduling results in a formatted manner."""
+    if not results:
+        print("No processes to schedule.")
+        return
+
+    print("\nCFS Scheduling Results:")
+    print("=" * 100)
+    print(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+        f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}")
+    print("-" * 100)
+
+    total_waiting = 0
+    total_turnaround = 0
+
+    for process in results:
+        print(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+            f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+            f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}")
+
+        total_waiting += process['Waiting Time']
+        total_turnaround += process['Turnaround Time']
+
+    n = len(results)
+    avg_waiting = total_waiting / n
+    avg_turnaround = total_turnaround / n
+
+    print("=" * 100)
+    print(f"Average Waiting Time: {avg_waiting:.2f}")
+    print(f"Average Turnaround Time: {avg_turnaround:.2f}")
+
+    # Write results to file
+    try:
+        # Get the base directory path
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result_path = os.path.join(base_dir, 'Schedulers', 'CFS', 'cfs_results.txt')
+
+        with open(result_path, 'w') as f:
+            f.write(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+                f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}\n")
+            f.write("-" * 100 + "\n")
+
+            for process in results:
+                f.write(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+                    f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+                    f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}\n")
+
+            f.write("\nAverage Waiting Time: {:.2f}\n".format(avg_waiting))
+            f.write("Average Turnaround Time: {:.2f}\n".format(avg_turnaround))
+    except Exception as e:
+        print(f"Error writing results to file: {e}")
+
+def main():
+    # Get the base directory path
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Path to the processes.txt file
+    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+
+    # Read processes from file
+    with phase('parse'):
+        processes = read_processes(file_path)
+
+    # Apply CFS scheduling
+    with phase('schedule'):
+        results = cfs_scheduling(processes)
+
+    # Print results
+    with phase('write'):
+        print_results(results)
+
+if __name__ == "__main__":
+    main()
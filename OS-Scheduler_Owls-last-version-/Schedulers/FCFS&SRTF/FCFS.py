@@ -1,11 +1,14 @@
 import os
 import sys
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from Schedulers.metrics import system_metrics
+from Schedulers.profiling import phase, count
+from Schedulers.artifacts import default_store
+
 class Process:
     def __init__(self, pid, arrival_time, burst_time, priority):
         self.pid = pid
@@ -48,6 +51,9 @@ def read_processes(file_path):
 
 def create_gantt_chart(execution_history, processes):
     """Create a Gantt chart for the FCFS scheduling."""
+    # matplotlib is only needed for the chart, so importing the scheduler stays cheap
+    import matplotlib.pyplot as plt
+
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(12, 6))
     
@@ -90,42 +96,45 @@ def create_gantt_chart(execution_history, processes):
     # Adjust layout
     plt.tight_layout()
     
-    # Save the chart
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    chart_path = os.path.join(base_dir, 'Schedulers', 'FCFS&SRTF', 'fcfs_gantt.png')
-    
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(chart_path), exist_ok=True)
-    
-    # Save the chart
+    # Save the chart into the artifact store (served from there by the web app)
+    store = default_store()
+    chart_path = store.path('gantt/fcfs_gantt.png')
     plt.savefig(chart_path, bbox_inches='tight', dpi=300)
     plt.close()
+    store.add('gantt/fcfs_gantt.png')
     
     return chart_path
 
-def fcfs_scheduling(processes):
+def fcfs_scheduling(processes, verbose=True):
     """
     Implement First Come First Serve (FCFS) scheduling algorithm.
     - Processes are executed in order of arrival
     - Non-preemptive: Once a process starts, it runs to completion
+    - verbose=False suppresses the execution trace and the Gantt chart
     """
     if not processes:
         return []
 
     # Sort processes by arrival time
-    processes.sort(key=lambda x: x['arrival'])
+    with phase('sort'):
+        processes.sort(key=lambda x: x['arrival'])
     current_time = processes[0]['arrival']
     completed = []
     execution_history = []
     
-    print("\nFCFS Scheduling Execution Sequence:")
-    print("=" * 80)
+    if verbose:
+        print("\nFCFS Scheduling Execution Sequence:")
+        print("=" * 80)
     
     for process in processes:
+        # The CPU idles until the next process arrives
+        current_time = max(current_time, process['arrival'])
+
         # Track first response time
         if process['response'] == -1:
             process['response'] = current_time
-            print(f"Time {current_time:.1f}: Process {process['pid']} starts execution")
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {process['pid']} starts execution")
         
         # Calculate execution time
         execution_time = process['burst']
@@ -138,7 +147,8 @@ def fcfs_scheduling(processes):
             'end': execution_end
         })
         
-        print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {process['pid']}")
+        if verbose:
+            print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {process['pid']}")
         
         # Update process state
         process['completion'] = execution_end
@@ -147,18 +157,25 @@ def fcfs_scheduling(processes):
         completed.append(process)
         current_time = execution_end
         
-        print(f"Time {current_time:.1f}: Process {process['pid']} completed")
+        if verbose:
+            print(f"Time {current_time:.1f}: Process {process['pid']} completed")
     
-    print("=" * 80)
+    if verbose:
+        print("=" * 80)
     
-    # Create Gantt chart
-    create_gantt_chart(execution_history, completed)
+    # Create Gantt chart (skipped for quiet batch runs)
+    if verbose:
+        with phase('render'):
+            create_gantt_chart(execution_history, completed)
     
     # Calculate averages
-    total_waiting = sum(p['waiting'] for p in completed)
-    total_turnaround = sum(p['turnaround'] for p in completed)
-    total_response = sum(p['response'] - p['arrival'] for p in completed)
-    n = len(completed)
+    with phase('metrics'):
+        total_waiting = sum(p['waiting'] for p in completed)
+        total_turnaround = sum(p['turnaround'] for p in completed)
+        total_response = sum(p['response'] - p['arrival'] for p in completed)
+        n = len(completed)
+        system = system_metrics(execution_history, arrivals=[p['arrival'] for p in completed])
+    count('slices', len(execution_history))
     
     return {
         'processes': completed,
@@ -166,7 +183,9 @@ def fcfs_scheduling(processes):
             'waiting': total_waiting / n if n > 0 else 0,
             'turnaround': total_turnaround / n if n > 0 else 0,
             'response': total_response / n if n > 0 else 0
-        }
+        },
+        'execution_history': execution_history,
+        'system': system
     }
 
 def print_results(results):
@@ -184,14 +203,14 @@ def print_results(results):
         with open(result_path, 'w') as f:
             # Write header
             f.write(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
-                f"{'Turnaround':<12} {'Waiting':<12}\n")
+                f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}\n")
             f.write("-" * 100 + "\n")
             
             # Write process data
             for process in results['processes']:
                 f.write(f"{process['pid']:<12} {process['arrival']:<14.2f} {process['burst']:<12.2f} "
                     f"{process['completion']:<12.2f} {process['turnaround']:<12.2f} "
-                    f"{process['waiting']:<12.2f}\n")
+                    f"{process['waiting']:<12.2f} {process['response']:<12.2f}\n")
             
             # Write averages
             f.write("\nAverage Waiting Time: {:.2f}\n".format(results['averages']['waiting']))
@@ -209,15 +228,18 @@ def main():
     file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
     
     # Read processes from file
-    processes = read_processes(file_path)
+    with phase('parse'):
+        processes = read_processes(file_path)
     
     # Run FCFS scheduling
     print("\nRunning FCFS Scheduling...")
-    results = fcfs_scheduling(processes)
+    with phase('schedule'):
+        results = fcfs_scheduling(processes)
     
     # Print and save results
     if results['processes']:
-        print_results(results)
+        with phase('write'):
+            print_results(results)
     else:
         print("No processes to schedule.")
 
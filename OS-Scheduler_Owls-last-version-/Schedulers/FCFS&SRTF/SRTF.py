@@ -1,8 +1,15 @@
 import os
-import matplotlib.pyplot as plt
+import sys
 import numpy as np
 from heapq import heappush, heappop
 
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Schedulers.metrics import system_metrics
+from Schedulers.profiling import phase, count
+from Schedulers.artifacts import default_store
+
 class Process:
     def __init__(self, pid, arrival_time, burst_time, priority):
         self.pid = pid
@@ -48,6 +55,9 @@ def read_processes(file_path):
 
 def create_gantt_chart(execution_history, processes):
     """Create a Gantt chart for the SRTF scheduling."""
+    # matplotlib is only needed for the chart, so importing the scheduler stays cheap
+    import matplotlib.pyplot as plt
+
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(12, 6))
     
@@ -66,6 +76,12 @@ def create_gantt_chart(execution_history, processes):
         end = exec_slice['end']
         duration = end - start
         
+        # Context switch overhead is drawn as a grey hatched bar on the incoming process' row
+        if exec_slice.get('kind') == 'switch':
+            ax.barh(y_pos[pid], duration, left=start, height=0.6,
+                    color='lightgrey', edgecolor='black', linewidth=1, hatch='//')
+            continue
+        
         # Create the bar
         ax.barh(y_pos[pid], duration, left=start, height=0.6, 
                 color=color_map[pid], edgecolor='black', linewidth=1)
@@ -90,44 +106,48 @@ def create_gantt_chart(execution_history, processes):
     # Adjust layout
     plt.tight_layout()
     
-    # Save the chart
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    chart_path = os.path.join(base_dir, 'Schedulers', 'FCFS&SRTF', 'srtf_gantt.png')
-    
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(chart_path), exist_ok=True)
-    
-    # Save the chart
+    # Save the chart into the artifact store (served from there by the web app)
+    store = default_store()
+    chart_path = store.path('gantt/srtf_gantt.png')
     plt.savefig(chart_path, bbox_inches='tight', dpi=300)
     plt.close()
+    store.add('gantt/srtf_gantt.png')
     
     return chart_path
 
-def srtf_scheduling(processes):
+def srtf_scheduling(processes, verbose=True, context_switch=0.0, cache_penalty=0.0):
     """
     Implement Shortest Remaining Time First (SRTF) scheduling algorithm.
     - Preemptive: Process with shortest remaining time gets CPU
     - If a new process arrives with shorter remaining time, it preempts current process
+    - verbose=False suppresses the execution trace and the Gantt chart
+    - context_switch is the time the CPU spends switching to a different process;
+      cache_penalty is added when the incoming process was preempted earlier (cold cache)
+    - Switch overhead is recorded as 'kind': 'switch' slices in the execution history
     """
     if not processes:
         return []
 
     # Sort processes by arrival time
-    processes.sort(key=lambda x: x['arrival'])
+    with phase('sort'):
+        processes.sort(key=lambda x: x['arrival'])
     current_time = processes[0]['arrival']
     completed = []
     ready_queue = []
     execution_history = []
+    last_pid = None
     
-    print("\nSRTF Scheduling Execution Sequence:")
-    print("=" * 80)
+    if verbose:
+        print("\nSRTF Scheduling Execution Sequence:")
+        print("=" * 80)
     
     while processes or ready_queue:
         # Add newly arrived processes to ready queue
         while processes and processes[0]['arrival'] <= current_time:
             new_process = processes.pop(0)
             ready_queue.append(new_process)
-            print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived")
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived")
         
         if not ready_queue:
             if processes:
@@ -141,10 +161,35 @@ def srtf_scheduling(processes):
         # Get the process with shortest remaining time
         current_process = ready_queue[0]
         
+        # Pay the dispatch overhead when the CPU moves to a different process
+        if last_pid is not None and last_pid != current_process['pid']:
+            overhead = context_switch
+            if current_process['remaining'] < current_process['burst']:
+                overhead += cache_penalty
+            if overhead > 0:
+                execution_history.append({
+                    'pid': current_process['pid'],
+                    'start': current_time,
+                    'end': current_time + overhead,
+                    'kind': 'switch'
+                })
+                if verbose:
+                    print(f"Time {current_time:.1f}-{current_time + overhead:.1f}: "
+                          f"Context switch to {current_process['pid']}")
+                current_time += overhead
+                # Arrivals during the switch are considered at the next decision point
+                while processes and processes[0]['arrival'] <= current_time:
+                    new_process = processes.pop(0)
+                    ready_queue.append(new_process)
+                    if verbose:
+                        print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived")
+        last_pid = current_process['pid']
+        
         # Track first response time
         if current_process['response'] == -1:
             current_process['response'] = current_time
-            print(f"Time {current_time:.1f}: Process {current_process['pid']} starts execution")
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} starts execution")
         
         # Calculate execution time until next event
         next_arrival = processes[0]['arrival'] if processes else float('inf')
@@ -158,7 +203,8 @@ def srtf_scheduling(processes):
             'end': execution_end
         })
         
-        print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {current_process['pid']}")
+        if verbose:
+            print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {current_process['pid']}")
         
         # Update process state
         current_process['remaining'] -= execution_time
@@ -169,20 +215,27 @@ def srtf_scheduling(processes):
             current_process['completion'] = current_time
             current_process['turnaround'] = current_time - current_process['arrival']
             current_process['waiting'] = current_process['turnaround'] - current_process['burst']
-            ready_queue.pop(0)
+            ready_queue.remove(current_process)
             completed.append(current_process)
-            print(f"Time {current_time:.1f}: Process {current_process['pid']} completed")
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} completed")
     
-    print("=" * 80)
+    if verbose:
+        print("=" * 80)
     
-    # Create Gantt chart
-    create_gantt_chart(execution_history, completed)
+    # Create Gantt chart (skipped for quiet batch runs)
+    if verbose:
+        with phase('render'):
+            create_gantt_chart(execution_history, completed)
     
     # Calculate averages
-    total_waiting = sum(p['waiting'] for p in completed)
-    total_turnaround = sum(p['turnaround'] for p in completed)
-    total_response = sum(p['response'] - p['arrival'] for p in completed)
-    n = len(completed)
+    with phase('metrics'):
+        total_waiting = sum(p['waiting'] for p in completed)
+        total_turnaround = sum(p['turnaround'] for p in completed)
+        total_response = sum(p['response'] - p['arrival'] for p in completed)
+        n = len(completed)
+        system = system_metrics(execution_history, arrivals=[p['arrival'] for p in completed])
+    count('slices', len(execution_history))
     
     return {
         'processes': completed,
@@ -190,7 +243,9 @@ def srtf_scheduling(processes):
             'waiting': total_waiting / n if n > 0 else 0,
             'turnaround': total_turnaround / n if n > 0 else 0,
             'response': total_response / n if n > 0 else 0
-        }
+        },
+        'execution_history': execution_history,
+        'system': system
     }
 
 def print_results(results):
@@ -208,14 +263,14 @@ def print_results(results):
         with open(result_path, 'w') as f:
             # Write header
             f.write(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
-                f"{'Turnaround':<12} {'Waiting':<12}\n")
+                f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}\n")
             f.write("-" * 100 + "\n")
             
             # Write process data
             for process in results['processes']:
                 f.write(f"{process['pid']:<12} {process['arrival']:<14.2f} {process['burst']:<12.2f} "
                     f"{process['completion']:<12.2f} {process['turnaround']:<12.2f} "
-                    f"{process['waiting']:<12.2f}\n")
+                    f"{process['waiting']:<12.2f} {process['response']:<12.2f}\n")
             
             # Write averages
             f.write("\nAverage Waiting Time: {:.2f}\n".format(results['averages']['waiting']))
@@ -233,15 +288,18 @@ def main():
     file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
     
     # Read processes from file
-    processes = read_processes(file_path)
+    with phase('parse'):
+        processes = read_processes(file_path)
     
     # Run SRTF scheduling
     print("\nRunning SRTF Scheduling...")
-    results = srtf_scheduling(processes)
+    with phase('schedule'):
+        results = srtf_scheduling(processes)
     
     # Print and save results
     if results['processes']:
-        print_results(results)
+        with phase('write'):
+            print_results(results)
     else:
         print("No processes to schedule.")
 
@@ -0,0 +1,347 @@
+import os
+import sys
+
+# Add the project root to the path for the shared profiling hooks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Schedulers.profiling import phase
+from collections import deque
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority):
+        self.pid = pid
+        self.arrival_time = float(arrival_time)
+        self.burst_time = float(burst_time)
+        self.priority = int(priority)
+        self.remaining_time = float(burst_time)
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+
+def read_processes(file_path):
+    """Read processes from the processes.txt file."""
+    processes = []
+    try:
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            # Read each process
+            for line in file:
+                # Split by whitespace and remove empty strings
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    pid = data[0]
+                    arrival_time = float(data[1])
+                    burst_time = float(data[2])
+                    priority = int(data[3])
+                    processes.append(Process(pid, arrival_time, burst_time, priority))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    return processes
+
+class LevelQueues:
+    """
+    Ready queues of the MLFQ, one per level.
+    - A bitmap with bit i set when level i is non-empty makes finding the highest
+      non-empty level O(1) (lowest set bit) no matter how many processes are ready
+    - Each level is a deque of FIFO segments so a priority boost moves whole
+      lower level queues to level 0 in O(levels) instead of O(processes)
+    - Processes remember the boost epoch they were queued in; the quantum used at
+      their old level is reset lazily when a boosted process is dispatched
+    """
+    def __init__(self, levels):
+        self.queues = [deque() for _ in range(levels)]
+        self.bitmap = 0
+        self.epoch = 0
+
+    def push(self, level, process):
+        segments = self.queues[level]
+        if not segments:
+            segments.append(deque())
+        segments[-1].append(process)
+        process['epoch'] = self.epoch
+        self.bitmap |= 1 << level
+
+    def pop(self):
+        """Remove and return (level, process) from the highest non-empty level."""
+        level = (self.bitmap & -self.bitmap).bit_length() - 1
+        segments = self.queues[level]
+        process = segments[0].popleft()
+        if not segments[0]:
+            segments.popleft()
+            if not segments:
+                self.bitmap &= ~(1 << level)
+        if process['epoch'] != self.epoch:
+            process['used'] = 0.0
+        return level, process
+
+    def boost(self):
+        """Move every queued process to level 0, keeping the order level by level."""
+        top = self.queues[0]
+        for level in range(1, len(self.queues)):
+            if self.queues[level]:
+                top.extend(self.queues[level])
+                self.queues[level] = deque()
+        self.bitmap = 1 if top else 0
+        self.epoch += 1
+
+    def __bool__(self):
+        return self.bitmap != 0
+
+def mlfq_scheduling(processes, quanta=(4.0, 8.0, 16.0), boost_interval=50.0, context_switch=0.0,
+                    cache_penalty=0.0, verbose=True, return_history=False):
+    """
+    Implement Multi-Level Feedback Queue (MLFQ) scheduling algorithm.
+    - There is one level per entry of quanta; level 0 has the highest priority
+    - New processes enter level 0; each level is served Round Robin
+    - A process that uses up its level's quantum is demoted one level
+      (the last level keeps it); a preempted process keeps the unused part of its quantum
+    - A process arriving at a higher level preempts a running lower level process
+    - Every boost_interval time units all processes move back to level 0 (None disables it)
+    - context_switch and cache_penalty model the dispatch overhead like Round Robin;
+      switches are recorded as 'kind': 'switch' slices in the execution history
+    - verbose=False suppresses the execution trace
+    - return_history=True also returns the execution slices: (results, execution_history)
+    """
+    if not processes:
+        return ([], []) if return_history else []
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError("Every MLFQ level needs a positive time quantum.")
+    if boost_interval is not None and boost_interval <= 0:
+        raise ValueError("Boost interval must be positive.")
+
+    levels = len(quanta)
+
+    # Create working copies of processes
+    process_list = []
+    for p in processes:
+        process_list.append({
+            'pid': p.pid,
+            'arrival': p.arrival_time,
+            'burst': p.burst_time,
+            'remaining': p.burst_time,
+            'completion': 0,
+            'first_response': -1,  # Track when process first gets CPU
+            'last_execution': p.arrival_time,  # End of the last slice, used for waiting time
+            'waiting': 0,
+            'used': 0.0,  # Time used of the current level's quantum
+            'epoch': 0  # Boost epoch the process was last queued in
+        })
+
+    # Sort processes by arrival time
+    process_list.sort(key=lambda x: x['arrival'])
+    process_list = deque(process_list)
+
+    current_time = process_list[0]['arrival']  # Start with first arrival
+    next_boost = current_time + boost_interval if boost_interval else float('inf')
+    completed = []
+    ready = LevelQueues(levels)
+    execution_history = []
+    last_pid = None
+
+    if verbose:
+        print(f"\nMLFQ Execution Sequence (Quanta = {', '.join(f'{q:g}' for q in quanta)}):")
+        print("=" * 80)
+
+    def admit_arrivals():
+        while process_list and process_list[0]['arrival'] <= current_time:
+            new_process = process_list.popleft()
+            ready.push(0, new_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived (Level 0)")
+
+    def boost():
+        nonlocal next_boost
+        while next_boost <= current_time:
+            ready.boost()
+            if verbose:
+                print(f"Time {next_boost:.1f}: Priority boost, all processes back to level 0")
+            next_boost += boost_interval
+
+    while process_list or ready:
+        # Add newly arrived processes to the top level
+        admit_arrivals()
+
+        if not ready:
+            if process_list:
+                current_time = process_list[0]['arrival']
+                continue
+            break
+
+        boost()
+
+        # O(1) dispatch from the highest non-empty level
+        level, current_process = ready.pop()
+
+        # Pay the context switch cost when the CPU moves to a different process
+        if last_pid is not None and last_pid != current_process['pid']:
+            overhead = context_switch
+            if current_process['remaining'] < current_process['burst']:
+                overhead += cache_penalty
+            if overhead > 0:
+                execution_history.append({
+                    'pid': current_process['pid'],
+                    'start': current_time,
+                    'end': current_time + overhead,
+                    'kind': 'switch'
+                })
+                if verbose:
+                    print(f"Time {current_time:.1f}-{current_time + overhead:.1f}: "
+                          f"Context switch to {current_process['pid']}")
+                current_time += overhead
+                admit_arrivals()
+        last_pid = current_process['pid']
+
+        # Track first response time
+        if current_process['first_response'] == -1:
+            current_process['first_response'] = current_time
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} gets CPU first time")
+
+        # Run until the quantum expires, the process finishes, a boost is due,
+        # or (below the top level) a new arrival preempts it
+        execution_time = min(quanta[level] - current_process['used'], current_process['remaining'])
+        if boost_interval:
+            execution_time = min(execution_time, max(next_boost - current_time, 0.0))
+        if level > 0 and process_list:
+            execution_time = min(execution_time, max(process_list[0]['arrival'] - current_time, 0.0))
+        execution_end = current_time + execution_time
+
+        # Record execution slice (a boost can fall inside the context switch, leaving nothing to run)
+        if execution_time > 0:
+            execution_history.append({
+                'pid': current_process['pid'],
+                'start': current_time,
+                'end': execution_end,
+                'level': level
+            })
+
+        if verbose:
+            print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {current_process['pid']} "
+                  f"at level {level} (Remaining: {current_process['remaining']:.1f})")
+
+        # Update process state (waiting time is the gap since its previous slice)
+        current_process['waiting'] += current_time - current_process['last_execution']
+        current_process['last_execution'] = execution_end
+        current_process['remaining'] -= execution_time
+        current_process['used'] += execution_time
+        current_time = execution_end
+
+        # Add newly arrived processes before re-queueing the current one
+        admit_arrivals()
+
+        # Handle process completion, demotion or preemption
+        if current_process['remaining'] <= 0:
+            current_process['completion'] = current_time
+            completed.append(current_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} completed")
+        elif current_process['used'] >= quanta[level]:
+            new_level = min(level + 1, levels - 1)
+            current_process['used'] = 0.0
+            ready.push(new_level, current_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} used its quantum, "
+                      f"moved to level {new_level}")
+        else:
+            ready.push(level, current_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} preempted at level {level}")
+
+    if verbose:
+        print("=" * 80)
+
+    # Calculate timing metrics
+    results = []
+    for process in completed:
+        turnaround_time = process['completion'] - process['arrival']
+
+        results.append({
+            "Process ID": process['pid'],
+            "Arrival Time": process['arrival'],
+            "Burst Time": process['burst'],
+            "Completion Time": process['completion'],
+            "Turnaround Time": turnaround_time,
+            "Waiting Time": process['waiting'],
+            "First Response": process['first_response']
+        })
+
+    results = sorted(results, key=lambda x: x["Process ID"])
+    if return_history:
+        return results, execution_history
+    return results
+
+def print_results(results):
+    """Print the scheduling results in a formatted manner."""
+    if not results:
+        print("No processes to schedule.")
+        return
+
+    print("\nMLFQ Scheduling Results:")
+    print("=" * 100)
+    print(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+        f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}")
+    print("-" * 100)
+
+    total_waiting = 0
+    total_turnaround = 0
+
+    for process in results:
+        print(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+            f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+            f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}")
+
+        total_waiting += process['Waiting Time']
+        total_turnaround += process['Turnaround Time']
+
+    n = len(results)
+    avg_waiting = total_waiting / n
+    avg_turnaround = total_turnaround / n
+
+    print("=" * 100)
+    print(f"Average Waiting Time: {avg_waiting:.2f}")
+    print(f"Average Turnaround Time: {avg_turnaround:.2f}")
+
+    # Write results to file
+    try:
+        # Get the base directory path
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result_path = os.path.join(base_dir, 'Schedulers', 'MLFQ', 'mlfq_results.txt')
+
+        with open(result_path, 'w') as f:
+            f.write(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+                f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}\n")
+            f.write("-" * 100 + "\n")
+
+            for process in results:
+                f.write(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+                    f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+                    f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}\n")
+
+            f.write("\nAverage Waiting Time: {:.2f}\n".format(avg_waiting))
+            f.write("Average Turnaround Time: {:.2f}\n".format(avg_turnaround))
+    except Exception as e:
+        print(f"Error writing results to file: {e}")
+
+def main():
+    # Get the base directory path
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Path to the processes.txt file
+    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+
+    # Read processes from file
+    with phase('parse'):
+        processes = read_processes(file_path)
+
+    # Apply MLFQ scheduling
+    with phase('schedule'):
+        results = mlfq_scheduling(processes)
+
+    # Print results
+    with phase('write'):
+        print_results(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import os
+import sys
+
+# Add the project root to the path for the shared profiling hooks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Schedulers.profiling import phase
+import heapq
+from collections import deque
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority):
+        self.pid = pid
+        self.arrival_time = float(arrival_time)
+        self.burst_time = float(burst_time)
+        self.priority = int(priority)
+        self.remaining_time = float(burst_time)
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+
+def read_processes(file_path):
+    """Read processes from the processes.txt file."""
+    processes = []
+    try:
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            # Read each process
+            for line in file:
+                # Split by whitespace and remove empty strings
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    pid = data[0]
+                    arrival_time = float(data[1])
+                    burst_time = float(data[2])
+                    priority = int(data[3])
+                    processes.append(Process(pid, arrival_time, burst_time, priority))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    return processes
+
+def non_preemptive_scheduling(processes, key, name, context_switch=0.0, verbose=True, return_history=False):
+    """
+    Run the ready process with the smallest key to completion, then pick again.
+    - The ready queue is a binary heap, so every decision is O(log n)
+    - Ties are broken by arrival time, then by input order
+    - context_switch is paid when the CPU moves to a different process; processes
+      are never preempted, so there is no cache refill penalty
+    - verbose=False suppresses the execution trace
+    - return_history=True also returns the execution slices: (results, execution_history)
+    """
+    if not processes:
+        return ([], []) if return_history else []
+
+    # Create working copies of processes
+    process_list = []
+    for order, p in enumerate(processes):
+        process_list.append({
+            'pid': p.pid,
+            'arrival': p.arrival_time,
+            'burst': p.burst_time,
+            'priority': p.priority,
+            'order': order,
+            'completion': 0,
+            'first_response': -1
+        })
+
+    # Sort processes by arrival time
+    process_list.sort(key=lambda x: (x['arrival'], x['order']))
+    process_list = deque(process_list)
+
+    current_time = process_list[0]['arrival']  # Start with first arrival
+    ready_queue = []
+    completed = []
+    execution_history = []
+    last_pid = None
+
+    if verbose:
+        print(f"\n{name} Execution Sequence:")
+        print("=" * 80)
+
+    while process_list or ready_queue:
+        # Add newly arrived processes to the ready heap
+        while process_list and process_list[0]['arrival'] <= current_time:
+            new_process = process_list.popleft()
+            heapq.heappush(ready_queue, (key(new_process), new_process['arrival'], new_process['order'], new_process))
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived")
+
+        if not ready_queue:
+            current_time = process_list[0]['arrival']
+            continue
+
+        current_process = heapq.heappop(ready_queue)[3]
+
+        # Pay the context switch cost when the CPU moves to a different process
+        if last_pid is not None and context_switch > 0:
+            execution_history.append({
+                'pid': current_process['pid'],
+                'start': current_time,
+                'end': current_time + context_switch,
+                'kind': 'switch'
+            })
+            if verbose:
+                print(f"Time {current_time:.1f}-{current_time + context_switch:.1f}: "
+                      f"Context switch to {current_process['pid']}")
+            current_time += context_switch
+        last_pid = current_process['pid']
+
+        # Run to completion
+        current_process['first_response'] = current_time
+        execution_end = current_time + current_process['burst']
+        execution_history.append({
+            'pid': current_process['pid'],
+            'start': current_time,
+            'end': execution_end
+        })
+        if verbose:
+            print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {current_process['pid']} "
+                  f"(Burst: {current_process['burst']:.1f}, Priority: {current_process['priority']})")
+
+        current_time = execution_end
+        current_process['completion'] = current_time
+        completed.append(current_process)
+
+    if verbose:
+        print("=" * 80)
+
+    # Calculate timing metrics
+    results = []
+    for process in completed:
+        turnaround_time = process['completion'] - process['arrival']
+
+        results.append({
+            "Process ID": process['pid'],
+            "Arrival Time": process['arrival'],
+            "Burst Time": process['burst'],
+            "Completion Time": process['completion'],
+            "Turnaround Time": turnaround_time,
+            "Waiting Time": turnaround_time - process['burst'],
+            "First Response": process['first_response']
+        })
+
+    results = sorted(results, key=lambda x: x["Process ID"])
+    if return_history:
+        return results, execution_history
+    return results
+
+def sjf_scheduling(processes, context_switch=0.0, verbose=True, return_history=False):
+    """
+    Implement non-preemptive Shortest Job First (SJF) scheduling.
+    - Whenever the CPU is free, the ready process with the shortest burst runs to completion
+    - Equal bursts are served in arrival order
+    """
+    return non_preemptive_scheduling(processes, lambda p: p['burst'], "SJF",
+                                     context_switch=context_switch, verbose=verbose, return_history=return_history)
+
+def priority_np_scheduling(processes, context_switch=0.0, verbose=True, return_history=False):
+    """
+    Implement non-preemptive Priority scheduling.
+    - Lower priority number means higher priority
+    - Whenever the CPU is free, the highest priority ready process runs to completion
+    - Equal priorities are served in arrival order
+    """
+    return non_preemptive_scheduling(processes, lambda p: p['priority'], "Non-Preemptive Priority",
+                                     context_switch=context_switch, verbose=verbose, return_history=return_history)
+
+def print_results(results, name, file_name):
+    """Print the scheduling results in a formatted manner and write them to file_name."""
+    if not results:
+        print("No processes to schedule.")
+        return
+
+    print(f"\n{name} Scheduling Results:")
+    print("=" * 100)
+    print(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+        f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}")
+    print("-" * 100)
+
+    total_waiting = 0
+    total_turnaround = 0
+
+    for process in results:
+        print(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+            f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+            f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}")
+
+        total_waiting += process['Waiting Time']
+        total_turnaround += process['Turnaround Time']
+
+    n = len(results)
+    avg_waiting = total_waiting / n
+    avg_turnaround = total_turnaround / n
+
+    print("=" * 100)
+    print(f"Average Waiting Time: {avg_waiting:.2f}")
+    print(f"Average Turnaround Time: {avg_turnaround:.2f}")
+
+    # Write results to file
+    try:
+        # Get the base directory path
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result_path = os.path.join(base_dir, 'Schedulers', 'NonPreemptive', file_name)
+
+        with open(result_path, 'w') as f:
+            f.write(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+                f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}\n")
+            f.write("-" * 100 + "\n")
+
+            for process in results:
+                f.write(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+                    f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+                    f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}\n")
+
+            f.write("\nAverage Waiting Time: {:.2f}\n".format(avg_waiting))
+            f.write("Average Turnaround Time: {:.2f}\n".format(avg_turnaround))
+    except Exception as e:
+        print(f"Error writing results to file: {e}")
+
+def main():
+    # Get the base directory path
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Path to the processes.txt file
+    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+
+    # Read processes from file
+    with phase('parse'):
+        processes = read_processes(file_path)
+
+    # Apply both non-preemptive schedulers and print their results
+    with phase('schedule'):
+        sjf_results = sjf_scheduling(processes)
+        priority_np_results = priority_np_scheduling(processes)
+    with phase('write'):
+        print_results(sjf_results, "SJF", "sjf_results.txt")
+        print_results(priority_np_results, "Non-Preemptive Priority", "priority_np_results.txt")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+import os
+import sys
+
+# Add the project root to the path for the shared profiling hooks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Schedulers.profiling import phase
+import heapq
+import random
+import argparse
+from collections import deque
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority):
+        self.pid = pid
+        self.arrival_time = float(arrival_time)
+        self.burst_time = float(burst_time)
+        self.priority = int(priority)
+        self.remaining_time = float(burst_time)
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+
+def read_processes(file_path):
+    """Read processes from the processes.txt file."""
+    processes = []
+    try:
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            # Read each process
+            for line in file:
+                # Split by whitespace and remove empty strings
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    pid = data[0]
+                    arrival_time = float(data[1])
+                    burst_time = float(data[2])
+                    priority = int(data[3])
+                    processes.append(Process(pid, arrival_time, burst_time, priority))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    return processes
+
+def split_bursts(total, count=4, jitter=0.5, rng=None):
+    """
+    Split a process' total CPU time into count CPU bursts.
+    - Burst lengths vary by up to +/- jitter around total / count, so the bursts of
+      one process are similar (which is what makes them predictable) but not equal
+    - The bursts always add up to total
+    """
+    count = max(int(count), 1)
+    if count == 1 or total <= 0:
+        return [total]
+    rng = rng or random.Random(0)
+    weights = [1 + jitter * rng.uniform(-1, 1) for _ in range(count)]
+    scale = total / sum(weights)
+    bursts = [w * scale for w in weights[:-1]]
+    bursts.append(total - sum(bursts))
+    return bursts
+
+def predictive_scheduling(processes, preemptive=False, alpha=0.5, initial_tau=5.0, bursts_per_process=4,
+                          burst_jitter=0.5, seed=0, oracle=False, context_switch=0.0, cache_penalty=0.0,
+                          verbose=True, return_history=False):
+    """
+    Shortest-job scheduling on predicted CPU burst lengths.
+    - Each process is a sequence of CPU bursts (the CPU bursts of its 'bursts' CPU/I/O
+      cycle, or its burst time split by split_bursts, seeded per process from seed);
+      after a burst it goes straight back to the ready queue for the next one
+    - The scheduler never sees the real burst: it orders by the exponential average
+      tau(n+1) = alpha * t(n) + (1 - alpha) * tau(n), starting from initial_tau
+    - preemptive=False is SJF (a burst always runs to its end); preemptive=True is
+      SRTF on the predicted remaining time max(tau - time run in this burst, 0), and
+      an arrival only preempts with a strictly shorter prediction
+    - oracle=True orders by the real burst instead, as a baseline on the same bursts;
+      the predictor still runs so its error is reported either way
+    - context_switch is paid when the CPU moves to a different process; cache_penalty
+      is added when the incoming process was preempted in the middle of its burst
+    - Every result row carries its (predicted, actual) burst pairs and the mean
+      absolute prediction error; prediction_error summarizes them
+    - return_history=True also returns the execution slices: (results, execution_history)
+    """
+    if not processes:
+        return ([], []) if return_history else []
+
+    # Create working copies of processes
+    process_list = []
+    for order, p in enumerate(processes):
+        cycle = getattr(p, 'bursts', None)
+        bursts = cycle[0::2] if cycle else split_bursts(p.burst_time, bursts_per_process, burst_jitter,
+                                                           random.Random(f"{seed}:{p.pid}"))
+        process_list.append({
+            'pid': p.pid,
+            'arrival': p.arrival_time,
+            'burst': p.burst_time,
+            'order': order,
+            'bursts': list(bursts),
+            'index': 0,
+            'left': bursts[0],
+            'ran': 0.0,
+            'tau': float(initial_tau),
+            'predictions': [],
+            'completion': 0,
+            'first_response': -1
+        })
+
+    # Sort processes by arrival time
+    process_list.sort(key=lambda x: (x['arrival'], x['order']))
+    process_list = deque(process_list)
+
+    def predicted_left(process):
+        if oracle:
+            return process['left']
+        return max(process['tau'] - process['ran'], 0.0)
+
+    current_time = process_list[0]['arrival']  # Start with first arrival
+    ready_queue = []
+    completed = []
+    execution_history = []
+    running = None
+    last_pid = None
+    seq = 0
+
+    def enqueue(process):
+        nonlocal seq
+        heapq.heappush(ready_queue, (predicted_left(process), seq, process))
+        seq += 1
+
+    name = "Predictive SRTF" if preemptive else "Predictive SJF"
+    if verbose:
+        print(f"\n{name} Execution Sequence (alpha = {alpha}, initial tau = {initial_tau}):")
+        print("=" * 80)
+
+    while process_list or ready_queue or running:
+        # Add newly arrived processes to the ready heap
+        while process_list and process_list[0]['arrival'] <= current_time:
+            new_process = process_list.popleft()
+            enqueue(new_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived "
+                      f"(predicted burst {predicted_left(new_process):.1f})")
+
+        if running is None:
+            if not ready_queue:
+                current_time = process_list[0]['arrival']
+                continue
+            running = heapq.heappop(ready_queue)[2]
+
+            # Pay the dispatch overhead when the CPU moves to a different process
+            if last_pid is not None and last_pid != running['pid']:
+                overhead = context_switch
+                if running['ran'] > 0:
+                    overhead += cache_penalty
+                if overhead > 0:
+                    execution_history.append({
+                        'pid': running['pid'],
+                        'start': current_time,
+                        'end': current_time + overhead,
+                        'kind': 'switch'
+                    })
+                    if verbose:
+                        print(f"Time {current_time:.1f}-{current_time + overhead:.1f}: "
+                              f"Context switch to {running['pid']}")
+                    current_time += overhead
+            last_pid = running['pid']
+
+            if running['first_response'] == -1:
+                running['first_response'] = current_time
+
+        # Run until the burst ends or, when preemptive, until the next arrival
+        execution_time = running['left']
+        if preemptive and process_list:
+            execution_time = min(execution_time, max(process_list[0]['arrival'] - current_time, 0.0))
+        execution_end = current_time + execution_time
+
+        # Slices of the same process that touch each other are one dispatch
+        previous = execution_history[-1] if execution_history else None
+        if previous and previous['pid'] == running['pid'] and previous.get('kind', 'run') == 'run' \
+                and abs(previous['end'] - current_time) < 1e-9:
+            previous['end'] = execution_end
+        elif execution_time > 0:
+            execution_history.append({
+                'pid': running['pid'],
+                'start': current_time,
+                'end': execution_end
+            })
+        running['left'] -= execution_time
+        running['ran'] += execution_time
+        current_time = execution_end
+
+        if running['left'] <= 1e-9:
+            # Burst finished: score the prediction and update the estimate
+            actual = running['bursts'][running['index']]
+            running['predictions'].append((running['tau'], actual))
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {running['pid']} finished burst {running['index'] + 1} "
+                      f"(actual {actual:.2f}, predicted {running['tau']:.2f})")
+            running['tau'] = alpha * actual + (1 - alpha) * running['tau']
+            running['index'] += 1
+            running['ran'] = 0.0
+            if running['index'] < len(running['bursts']):
+                running['left'] = running['bursts'][running['index']]
+                enqueue(running)
+            else:
+                running['completion'] = current_time
+                completed.append(running)
+                if verbose:
+                    print(f"Time {current_time:.1f}: Process {running['pid']} completed")
+            running = None
+        else:
+            # An arrival: preempt only for a strictly shorter prediction
+            while process_list and process_list[0]['arrival'] <= current_time:
+                new_process = process_list.popleft()
+                enqueue(new_process)
+                if verbose:
+                    print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived "
+                          f"(predicted burst {predicted_left(new_process):.1f})")
+            if ready_queue and ready_queue[0][0] < predicted_left(running):
+                if verbose:
+                    print(f"Time {current_time:.1f}: Process {ready_queue[0][2]['pid']} preempts {running['pid']}")
+                enqueue(running)
+                running = None
+
+    if verbose:
+        print("=" * 80)
+
+    # Calculate timing metrics
+    results = []
+    for process in completed:
+        turnaround_time = process['completion'] - process['arrival']
+        errors = [abs(predicted - actual) for predicted, actual in process['predictions']]
+
+        results.append({
+            "Process ID": process['pid'],
+            "Arrival Time": process['arrival'],
+            "Burst Time": process['burst'],
+            "Completion Time": process['completion'],
+            "Turnaround Time": turnaround_time,
+            "Waiting Time": turnaround_time - process['burst'],
+            "First Response": process['first_response'],
+            "Bursts": len(process['bursts']),
+            "Prediction Error": sum(errors) / len(errors),
+            "Predictions": process['predictions']
+        })
+
+    results = sorted(results, key=lambda x: x["Process ID"])
+    if return_history:
+        return results, execution_history
+    return results
+
+def prediction_error(results):
+    """
+    Accuracy of the burst predictions over every burst of every process.
+    - mae: mean absolute error
+    - mape: mean absolute error relative to the actual burst (bursts of length 0 are skipped)
+    - bias: mean of predicted - actual (positive means bursts were overestimated)
+    """
+    pairs = [pair for r in results for pair in r.get("Predictions", [])]
+    if not pairs:
+        return {'mae': 0.0, 'mape': 0.0, 'bias': 0.0, 'bursts': 0}
+    relative = [abs(predicted - actual) / actual for predicted, actual in pairs if actual > 0]
+    return {
+        'mae': sum(abs(predicted - actual) for predicted, actual in pairs) / len(pairs),
+        'mape': sum(relative) / len(relative) if relative else 0.0,
+        'bias': sum(predicted - actual for predicted, actual in pairs) / len(pairs),
+        'bursts': len(pairs)
+    }
+
+def print_results(results, name, file_name):
+    """Print the scheduling results and prediction error and write them to file_name."""
+    if not results:
+        print("No processes to schedule.")
+        return
+
+    header = (f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+              f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<16} {'Bursts':<8} {'Pred. Error':<12}")
+    lines = []
+    for process in results:
+        lines.append(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+                     f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+                     f"{process['Waiting Time']:<12.2f} {process['First Response']:<16.2f} "
+                     f"{process['Bursts']:<8} {process['Prediction Error']:<12.2f}")
+
+    n = len(results)
+    avg_waiting = sum(p['Waiting Time'] for p in results) / n
+    avg_turnaround = sum(p['Turnaround Time'] for p in results) / n
+    error = prediction_error(results)
+    footer = [f"Average Waiting Time: {avg_waiting:.2f}",
+              f"Average Turnaround Time: {avg_turnaround:.2f}",
+              f"Prediction MAE: {error['mae']:.2f} over {error['bursts']} bursts "
+              f"(MAPE {error['mape']:.1%}, bias {error['bias']:+.2f})"]
+
+    print(f"\n{name} Scheduling Results:")
+    print("=" * 120)
+    print(header)
+    print("-" * 120)
+    for line in lines:
+        print(line)
+    print("=" * 120)
+    for line in footer:
+        print(line)
+
+    # Write results to file
+    try:
+        # Get the base directory path
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result_path = os.path.join(base_dir, 'Schedulers', 'Predictive', file_name)
+
+        with open(result_path, 'w') as f:
+            f.write(header + "\n")
+            f.write("-" * 120 + "\n")
+            for line in lines:
+                f.write(line + "\n")
+            f.write("\n" + "\n".join(footer) + "\n")
+    except Exception as e:
+        print(f"Error writing results to file: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(description="SJF and SRTF on exponentially averaged burst predictions.")
+    parser.add_argument('--alpha', type=float, default=0.5, help="weight of the last burst in the estimate")
+    parser.add_argument('--initial-tau', type=float, default=5.0, help="prediction for a process' first burst")
+    parser.add_argument('--bursts', type=int, default=4, help="CPU bursts per process")
+    parser.add_argument('--jitter', type=float, default=0.5, help="relative variation of burst lengths")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the burst split")
+    parser.add_argument('--oracle', action='store_true', help="order by the real burst lengths instead")
+    args = parser.parse_args()
+
+    # Get the base directory path
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Path to the processes.txt file
+    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+
+    # Read processes from file
+    with phase('parse'):
+        processes = read_processes(file_path)
+
+    options = dict(alpha=args.alpha, initial_tau=args.initial_tau, bursts_per_process=args.bursts,
+                   burst_jitter=args.jitter, seed=args.seed, oracle=args.oracle)
+    with phase('schedule'):
+        sjf_results = predictive_scheduling(processes, preemptive=False, **options)
+        srtf_results = predictive_scheduling(processes, preemptive=True, **options)
+    with phase('write'):
+        print_results(sjf_results, "Predictive SJF", "sjf_predicted_results.txt")
+        print_results(srtf_results, "Predictive SRTF", "srtf_predicted_results.txt")
+
+if __name__ == "__main__":
+    main()
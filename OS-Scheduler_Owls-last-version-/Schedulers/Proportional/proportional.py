@@ -0,0 +1,392 @@
+import os
+import sys
+
+# Add the project root to the path for the shared profiling hooks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Schedulers.profiling import phase
+import heapq
+import random
+from collections import deque
+
+# Priority 1 gets MAX_PRIORITY times the tickets of priority MAX_PRIORITY (or worse)
+MAX_PRIORITY = 20
+TICKETS_PER_LEVEL = 10
+
+# Pass increment of a process with one ticket per quantum (stride = STRIDE1 / tickets)
+STRIDE1 = 1 << 20
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority):
+        self.pid = pid
+        self.arrival_time = float(arrival_time)
+        self.burst_time = float(burst_time)
+        self.priority = int(priority)
+        self.remaining_time = float(burst_time)
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+
+def read_processes(file_path):
+    """Read processes from the processes.txt file."""
+    processes = []
+    try:
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            # Read each process
+            for line in file:
+                # Split by whitespace and remove empty strings
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    pid = data[0]
+                    arrival_time = float(data[1])
+                    burst_time = float(data[2])
+                    priority = int(data[3])
+                    processes.append(Process(pid, arrival_time, burst_time, priority))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    return processes
+
+def priority_to_tickets(priority):
+    """Tickets of a process: lower priority numbers are more important and get more tickets."""
+    return (MAX_PRIORITY + 1 - min(max(priority, 1), MAX_PRIORITY)) * TICKETS_PER_LEVEL
+
+class FenwickTree:
+    """
+    Ticket counts of every process slot, with O(log n) updates and lookups.
+    - add changes the tickets of one slot
+    - find(k) returns the slot holding the k-th ticket (0 <= k < total), which is
+      the winner of a draw of k
+    """
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+        self.top = 1 << (size.bit_length() - 1) if size else 0
+
+    def add(self, slot, delta):
+        self.total += delta
+        i = slot + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, k):
+        # Descend the implicit tree, skipping every subtree whose tickets are all <= k
+        position = 0
+        step = self.top
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self.tree[nxt] <= k:
+                position = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return position
+
+def _working_copies(processes):
+    """Dictionary copies of the processes, sorted by arrival time."""
+    process_list = []
+    for order, p in enumerate(processes):
+        process_list.append({
+            'pid': p.pid,
+            'arrival': p.arrival_time,
+            'burst': p.burst_time,
+            'priority': p.priority,
+            'tickets': priority_to_tickets(p.priority),
+            'remaining': p.burst_time,
+            'order': order,
+            'completion': 0,
+            'first_response': -1
+        })
+    process_list.sort(key=lambda x: (x['arrival'], x['order']))
+    return process_list
+
+def _format_results(completed):
+    """Results in the Priority/Round Robin format, sorted by process ID."""
+    results = []
+    for process in completed:
+        turnaround_time = process['completion'] - process['arrival']
+
+        results.append({
+            "Process ID": process['pid'],
+            "Arrival Time": process['arrival'],
+            "Burst Time": process['burst'],
+            "Completion Time": process['completion'],
+            "Turnaround Time": turnaround_time,
+            "Waiting Time": turnaround_time - process['burst'],
+            "First Response": process['first_response'],
+            "Tickets": process['tickets']
+        })
+    return sorted(results, key=lambda x: x["Process ID"])
+
+def _run_quantum(process, current_time, time_quantum, context_switch, cache_penalty, last_pid,
+                 execution_history, verbose):
+    """Dispatch process for one quantum (or less when it finishes); returns the new time."""
+    # Pay the context switch cost when the CPU moves to a different process
+    if last_pid is not None and last_pid != process['pid']:
+        overhead = context_switch
+        if process['remaining'] < process['burst']:
+            overhead += cache_penalty
+        if overhead > 0:
+            execution_history.append({
+                'pid': process['pid'],
+                'start': current_time,
+                'end': current_time + overhead,
+                'kind': 'switch'
+            })
+            if verbose:
+                print(f"Time {current_time:.1f}-{current_time + overhead:.1f}: "
+                      f"Context switch to {process['pid']}")
+            current_time += overhead
+
+    # Track first response time
+    if process['first_response'] == -1:
+        process['first_response'] = current_time
+
+    execution_time = min(time_quantum, process['remaining'])
+    execution_end = current_time + execution_time
+    previous = execution_history[-1] if execution_history else None
+    if previous and previous['pid'] == process['pid'] and previous.get('kind', 'run') == 'run' \
+            and abs(previous['end'] - current_time) < 1e-9:
+        previous['end'] = execution_end
+    else:
+        execution_history.append({
+            'pid': process['pid'],
+            'start': current_time,
+            'end': execution_end
+        })
+    if verbose:
+        print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {process['pid']} "
+              f"(Tickets: {process['tickets']}, Remaining: {process['remaining']:.1f})")
+    process['remaining'] -= execution_time
+    return execution_end
+
+def lottery_scheduling(processes, time_quantum=4.0, seed=0, context_switch=0.0, cache_penalty=0.0,
+                       verbose=True, return_history=False):
+    """
+    Implement lottery scheduling.
+    - Every process holds tickets derived from its priority (priority_to_tickets)
+    - Each quantum a ticket is drawn at random from the ready processes; its holder
+      runs for the quantum, so a process' expected CPU share is its share of tickets
+    - Tickets live in a Fenwick tree indexed by process, so a draw and every arrival
+      or completion is O(log n) instead of a scan over the ready queue
+    - seed makes the draws reproducible
+    - context_switch and cache_penalty model the dispatch overhead like Round Robin
+    - return_history=True also returns the execution slices: (results, execution_history)
+    """
+    if not processes:
+        return ([], []) if return_history else []
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be positive.")
+
+    process_list = deque(_working_copies(processes))
+    slots = sorted(process_list, key=lambda x: x['order'])
+    rng = random.Random(seed)
+    tickets = FenwickTree(len(slots))
+
+    current_time = process_list[0]['arrival']  # Start with first arrival
+    completed = []
+    execution_history = []
+    last_pid = None
+
+    if verbose:
+        print(f"\nLottery Execution Sequence (Quantum = {time_quantum}, Seed = {seed}):")
+        print("=" * 80)
+
+    while process_list or tickets.total:
+        # Arrivals put their tickets into the draw
+        while process_list and process_list[0]['arrival'] <= current_time:
+            new_process = process_list.popleft()
+            tickets.add(new_process['order'], new_process['tickets'])
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived "
+                      f"(Tickets: {new_process['tickets']})")
+
+        if not tickets.total:
+            current_time = process_list[0]['arrival']
+            continue
+
+        winner = slots[tickets.find(rng.randrange(tickets.total))]
+        current_time = _run_quantum(winner, current_time, time_quantum, context_switch, cache_penalty,
+                                    last_pid, execution_history, verbose)
+        last_pid = winner['pid']
+
+        if winner['remaining'] <= 0:
+            winner['completion'] = current_time
+            tickets.add(winner['order'], -winner['tickets'])
+            completed.append(winner)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {winner['pid']} completed")
+
+    if verbose:
+        print("=" * 80)
+
+    results = _format_results(completed)
+    if return_history:
+        return results, execution_history
+    return results
+
+def stride_scheduling(processes, time_quantum=4.0, context_switch=0.0, cache_penalty=0.0,
+                      verbose=True, return_history=False):
+    """
+    Implement stride scheduling, the deterministic counterpart of lottery scheduling.
+    - Every process has a stride STRIDE1 / tickets and a pass value; the ready
+      process with the smallest pass runs for a quantum and its pass advances by its
+      stride (scaled down when it finishes before the quantum ends)
+    - The ready queue is a binary heap on (pass, arrival order), so each decision is O(log n)
+    - A new process starts at the global pass, the smallest pass among the competing
+      processes when it arrives (the running one charged up to then), so it cannot
+      claim the CPU time it was not there for
+    - context_switch and cache_penalty model the dispatch overhead like Round Robin
+    - return_history=True also returns the execution slices: (results, execution_history)
+    """
+    if not processes:
+        return ([], []) if return_history else []
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be positive.")
+
+    process_list = deque(_working_copies(processes))
+    for process in process_list:
+        process['stride'] = STRIDE1 / process['tickets']
+        process['pass'] = 0.0
+
+    current_time = process_list[0]['arrival']  # Start with first arrival
+    global_pass = 0.0
+    ready_queue = []
+    completed = []
+    execution_history = []
+    last_pid = None
+
+    if verbose:
+        print(f"\nStride Execution Sequence (Quantum = {time_quantum}):")
+        print("=" * 80)
+
+    def admit(new_process, running=None, run_start=0.0):
+        # Join at the smallest pass of the queue and of the running process so far
+        nonlocal global_pass
+        passes = [ready_queue[0][0]] if ready_queue else []
+        if running is not None:
+            ran = min(max(new_process['arrival'] - run_start, 0.0), time_quantum)
+            passes.append(running['pass'] + running['stride'] * ran / time_quantum)
+        if passes:
+            global_pass = max(global_pass, min(passes))
+        new_process['pass'] = global_pass
+        heapq.heappush(ready_queue, (new_process['pass'], new_process['order'], new_process))
+        if verbose:
+            print(f"Time {new_process['arrival']:.1f}: Process {new_process['pid']} arrived "
+                  f"(Tickets: {new_process['tickets']}, Pass: {new_process['pass']:.0f})")
+
+    while process_list or ready_queue:
+        while process_list and process_list[0]['arrival'] <= current_time:
+            admit(process_list.popleft())
+
+        if not ready_queue:
+            current_time = process_list[0]['arrival']
+            continue
+
+        current_process = heapq.heappop(ready_queue)[2]
+        run_time = min(time_quantum, current_process['remaining'])
+        current_time = _run_quantum(current_process, current_time, time_quantum, context_switch, cache_penalty,
+                                    last_pid, execution_history, verbose)
+        last_pid = current_process['pid']
+
+        # Processes that arrived during the quantum compete with the running one
+        while process_list and process_list[0]['arrival'] <= current_time:
+            admit(process_list.popleft(), current_process, current_time - run_time)
+        current_process['pass'] += current_process['stride'] * run_time / time_quantum
+
+        if current_process['remaining'] <= 0:
+            current_process['completion'] = current_time
+            completed.append(current_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} completed")
+        else:
+            heapq.heappush(ready_queue, (current_process['pass'], current_process['order'], current_process))
+
+        # The global pass follows the smallest pass in the queue and only moves forward
+        if ready_queue:
+            global_pass = max(global_pass, ready_queue[0][0])
+
+    if verbose:
+        print("=" * 80)
+
+    results = _format_results(completed)
+    if return_history:
+        return results, execution_history
+    return results
+
+def print_results(results, name, file_name):
+    """Print the scheduling results in a formatted manner and write them to file_name."""
+    if not results:
+        print("No processes to schedule.")
+        return
+
+    print(f"\n{name} Scheduling Results:")
+    print("=" * 100)
+    print(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+        f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}")
+    print("-" * 100)
+
+    total_waiting = 0
+    total_turnaround = 0
+
+    for process in results:
+        print(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+            f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+            f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}")
+
+        total_waiting += process['Waiting Time']
+        total_turnaround += process['Turnaround Time']
+
+    n = len(results)
+    avg_waiting = total_waiting / n
+    avg_turnaround = total_turnaround / n
+
+    print("=" * 100)
+    print(f"Average Waiting Time: {avg_waiting:.2f}")
+    print(f"Average Turnaround Time: {avg_turnaround:.2f}")
+
+    # Write results to file
+    try:
+        # Get the base directory path
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result_path = os.path.join(base_dir, 'Schedulers', 'Proportional', file_name)
+
+        with open(result_path, 'w') as f:
+            f.write(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+                f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}\n")
+            f.write("-" * 100 + "\n")
+
+            for process in results:
+                f.write(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+                    f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+                    f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}\n")
+
+            f.write("\nAverage Waiting Time: {:.2f}\n".format(avg_waiting))
+            f.write("Average Turnaround Time: {:.2f}\n".format(avg_turnaround))
+    except Exception as e:
+        print(f"Error writing results to file: {e}")
+
+def main():
+    # Get the base directory path
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Path to the processes.txt file
+    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+
+    # Read processes from file
+    with phase('parse'):
+        processes = read_processes(file_path)
+
+    # Apply both proportional-share schedulers and print their results
+    with phase('schedule'):
+        lottery_results = lottery_scheduling(processes)
+        stride_results = stride_scheduling(processes)
+    with phase('write'):
+        print_results(lottery_results, "Lottery", "lottery_results.txt")
+        print_results(stride_results, "Stride", "stride_results.txt")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+import os
+import sys
+import heapq
+from collections import deque
+
+# Add the project root to the path for the shared workload helpers
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Schedulers.workload import MISSING, parse_deadline
+from Schedulers.profiling import phase
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority, deadline=None):
+        self.pid = pid
+        self.arrival_time = float(arrival_time)
+        self.burst_time = float(burst_time)
+        self.priority = int(priority)
+        self.remaining_time = float(burst_time)
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+        # Relative deadline (must complete by arrival_time + deadline); None for no deadline
+        self.deadline = deadline
+
+def read_processes(file_path):
+    """Read processes from the processes.txt file, including the optional Deadline column."""
+    processes = []
+    try:
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            # Read each process
+            for line in file:
+                # Split by whitespace and remove empty strings
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    pid = data[0]
+                    arrival_time = float(data[1])
+                    burst_time = float(data[2])
+                    priority = int(data[3])
+                    deadline = parse_deadline(data[5]) if len(data) >= 6 else None
+                    processes.append(Process(pid, arrival_time, burst_time, priority, deadline))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    return processes
+
+def absolute_deadline(arrival, deadline):
+    """The time a process must complete by (infinity when it has no deadline)."""
+    return float('inf') if deadline is None else arrival + deadline
+
+def edf_scheduling(processes, context_switch=0.0, cache_penalty=0.0, verbose=True, return_history=False):
+    """
+    Implement preemptive Earliest Deadline First (EDF) scheduling.
+    - The ready queue is a binary heap on absolute deadline (arrival + Deadline column),
+      so every decision is O(log n)
+    - A newly arrived process with an earlier deadline preempts the running one
+    - Processes without a deadline run only when no process with a deadline is ready,
+      in arrival order
+    - Ties are broken by arrival time, then by input order
+    - context_switch and cache_penalty model the dispatch overhead like SRTF
+    - Results add the absolute "Deadline" and the "Lateness" (completion - deadline,
+      negative when the process finished early)
+    - return_history=True also returns the execution slices: (results, execution_history)
+    """
+    if not processes:
+        return ([], []) if return_history else []
+
+    # Create working copies of processes
+    process_list = []
+    for order, p in enumerate(processes):
+        process_list.append({
+            'pid': p.pid,
+            'arrival': p.arrival_time,
+            'burst': p.burst_time,
+            'remaining': p.burst_time,
+            'deadline': absolute_deadline(p.arrival_time, getattr(p, 'deadline', None)),
+            'order': order,
+            'completion': 0,
+            'first_response': -1
+        })
+
+    # Sort processes by arrival time
+    process_list.sort(key=lambda x: (x['arrival'], x['order']))
+    process_list = deque(process_list)
+
+    current_time = process_list[0]['arrival']  # Start with first arrival
+    ready_queue = []
+    completed = []
+    execution_history = []
+    last_pid = None
+
+    if verbose:
+        print("\nEDF Execution Sequence:")
+        print("=" * 80)
+
+    while process_list or ready_queue:
+        # Add newly arrived processes to the deadline heap
+        while process_list and process_list[0]['arrival'] <= current_time:
+            new_process = process_list.popleft()
+            heapq.heappush(ready_queue, (new_process['deadline'], new_process['arrival'], new_process['order'],
+                                         new_process))
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {new_process['pid']} arrived "
+                      f"(Deadline: {new_process['deadline']:.1f})")
+
+        if not ready_queue:
+            current_time = process_list[0]['arrival']
+            continue
+
+        current_process = ready_queue[0][3]
+
+        # Pay the context switch cost when the CPU moves to a different process
+        if last_pid is not None and last_pid != current_process['pid']:
+            overhead = context_switch
+            if current_process['remaining'] < current_process['burst']:
+                overhead += cache_penalty
+            if overhead > 0:
+                execution_history.append({
+                    'pid': current_process['pid'],
+                    'start': current_time,
+                    'end': current_time + overhead,
+                    'kind': 'switch'
+                })
+                if verbose:
+                    print(f"Time {current_time:.1f}-{current_time + overhead:.1f}: "
+                          f"Context switch to {current_process['pid']}")
+                current_time += overhead
+        last_pid = current_process['pid']
+
+        # Track first response time
+        if current_process['first_response'] == -1:
+            current_process['first_response'] = current_time
+
+        # Run until the process finishes or the next arrival may preempt it
+        execution_end = current_time + current_process['remaining']
+        if process_list:
+            execution_end = min(execution_end, max(process_list[0]['arrival'], current_time))
+        if execution_end > current_time:
+            execution_history.append({
+                'pid': current_process['pid'],
+                'start': current_time,
+                'end': execution_end
+            })
+            if verbose:
+                print(f"Time {current_time:.1f}-{execution_end:.1f}: Executing {current_process['pid']} "
+                      f"(Deadline: {current_process['deadline']:.1f}, Remaining: {current_process['remaining']:.1f})")
+        current_process['remaining'] -= execution_end - current_time
+        current_time = execution_end
+
+        if current_process['remaining'] <= 1e-9:
+            heapq.heappop(ready_queue)
+            current_process['completion'] = current_time
+            completed.append(current_process)
+            if verbose:
+                print(f"Time {current_time:.1f}: Process {current_process['pid']} completed")
+
+    if verbose:
+        print("=" * 80)
+
+    # Calculate timing metrics
+    results = []
+    for process in completed:
+        turnaround_time = process['completion'] - process['arrival']
+
+        results.append({
+            "Process ID": process['pid'],
+            "Arrival Time": process['arrival'],
+            "Burst Time": process['burst'],
+            "Completion Time": process['completion'],
+            "Turnaround Time": turnaround_time,
+            "Waiting Time": turnaround_time - process['burst'],
+            "First Response": process['first_response'],
+            "Deadline": process['deadline'],
+            "Lateness": process['completion'] - process['deadline']
+        })
+
+    results = sorted(results, key=lambda x: x["Process ID"])
+    if return_history:
+        return results, execution_history
+    return results
+
+def print_results(results):
+    """Print the scheduling results in a formatted manner."""
+    if not results:
+        print("No processes to schedule.")
+        return
+
+    def deadline_text(process, key):
+        return f"{process[key]:.2f}" if process['Deadline'] != float('inf') else MISSING
+
+    print("\nEDF Scheduling Results:")
+    print("=" * 120)
+    print(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+        f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<16} {'Deadline':<10} {'Lateness':<10}")
+    print("-" * 120)
+
+    total_waiting = 0
+    total_turnaround = 0
+
+    for process in results:
+        print(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+            f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+            f"{process['Waiting Time']:<12.2f} {process['First Response']:<16.2f} "
+            f"{deadline_text(process, 'Deadline'):<10} {deadline_text(process, 'Lateness'):<10}")
+
+        total_waiting += process['Waiting Time']
+        total_turnaround += process['Turnaround Time']
+
+    n = len(results)
+    avg_waiting = total_waiting / n
+    avg_turnaround = total_turnaround / n
+    with_deadline = [p for p in results if p['Deadline'] != float('inf')]
+    misses = sum(1 for p in with_deadline if p['Lateness'] > 1e-9)
+
+    print("=" * 120)
+    print(f"Average Waiting Time: {avg_waiting:.2f}")
+    print(f"Average Turnaround Time: {avg_turnaround:.2f}")
+    if with_deadline:
+        print(f"Deadline Misses: {misses} of {len(with_deadline)}")
+
+    # Write results to file
+    try:
+        # Get the base directory path
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result_path = os.path.join(base_dir, 'Schedulers', 'RealTime', 'edf_results.txt')
+
+        with open(result_path, 'w') as f:
+            f.write(f"{'Process ID':<12} {'Arrival Time':<14} {'Burst Time':<12} {'Completion':<12} "
+                f"{'Turnaround':<12} {'Waiting':<12} {'First Response':<12}\n")
+            f.write("-" * 100 + "\n")
+
+            for process in results:
+                f.write(f"{process['Process ID']:<12} {process['Arrival Time']:<14.2f} {process['Burst Time']:<12.2f} "
+                    f"{process['Completion Time']:<12.2f} {process['Turnaround Time']:<12.2f} "
+                    f"{process['Waiting Time']:<12.2f} {process['First Response']:<12.2f}\n")
+
+            f.write("\nAverage Waiting Time: {:.2f}\n".format(avg_waiting))
+            f.write("Average Turnaround Time: {:.2f}\n".format(avg_turnaround))
+    except Exception as e:
+        print(f"Error writing results to file: {e}")
+
+def main():
+    # Get the base directory path
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Path to the processes.txt file
+    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+
+    # Read processes from file
+    with phase('parse'):
+        processes = read_processes(file_path)
+
+    # Apply EDF scheduling
+    with phase('schedule'):
+        results = edf_scheduling(processes)
+
+    # Print results
+    with phase('write'):
+        print_results(results)
+
+if __name__ == "__main__":
+    main()
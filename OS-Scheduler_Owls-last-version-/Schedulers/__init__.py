@@ -0,0 +1,34 @@
+"""
+The scheduling algorithms and the tools built on them.
+
+FCFS, SRTF, Priority and Round Robin live in directories whose names are not valid
+package names ('FCFS&SRTF', 'Priority&RoundRobin'); they are importable as
+Schedulers.FCFS, Schedulers.SRTF, Schedulers.priority and Schedulers.round_robin,
+so every scheduler module is imported once, under one name, like any other module.
+"""
+import os
+import sys
+import importlib.abc
+import importlib.util
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Module name -> scheduler script, relative to this directory
+SCRIPT_MODULES = {
+    'Schedulers.FCFS': os.path.join('FCFS&SRTF', 'FCFS.py'),
+    'Schedulers.SRTF': os.path.join('FCFS&SRTF', 'SRTF.py'),
+    'Schedulers.priority': os.path.join('Priority&RoundRobin', 'priority.py'),
+    'Schedulers.round_robin': os.path.join('Priority&RoundRobin', 'round_robin.py')
+}
+
+class _ScriptFinder(importlib.abc.MetaPathFinder):
+    """Finds the scheduler scripts of SCRIPT_MODULES under their package names."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        script = SCRIPT_MODULES.get(fullname)
+        if script is None:
+            return None
+        return importlib.util.spec_from_file_location(fullname, os.path.join(_ROOT, script))
+
+if not any(isinstance(finder, _ScriptFinder) for finder in sys.meta_path):
+    sys.meta_path.append(_ScriptFinder())
@@ -0,0 +1,135 @@
+import os
+import sys
+import time
+import logging
+import argparse
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SCHEDULER_ARTIFACT_DIR moves the store and SCHEDULER_ARTIFACT_BUDGET (bytes) bounds it; both are
+# inherited by the scheduler subprocesses, which write their Gantt charts into the same store
+ENV_DIR = 'SCHEDULER_ARTIFACT_DIR'
+ENV_BUDGET = 'SCHEDULER_ARTIFACT_BUDGET'
+DEFAULT_DIR = os.path.join(BASE_DIR, 'artifacts')
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+class ArtifactStore:
+    """
+    One directory for the generated charts and profiles, bounded by a byte budget.
+    - Writers save to path(name) and then call add(name), which evicts the least recently
+      used artifacts until the store fits its budget again (never the one just added)
+    - touch(name) records a use. The last use is kept in the file's access time, set
+      explicitly so it survives relatime/noatime mounts and is shared by every process
+      using the store; the modification time still says when the content changed
+    """
+
+    def __init__(self, root=DEFAULT_DIR, budget=DEFAULT_BUDGET):
+        if budget < 0:
+            raise ValueError("Artifact budget cannot be negative.")
+        self.root = os.path.abspath(root)
+        self.budget = budget
+
+    def _resolve(self, name):
+        path = os.path.abspath(os.path.join(self.root, name))
+        if path == self.root or os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"Artifact name {name!r} is outside the store")
+        return path
+
+    def path(self, name):
+        """Absolute path to write an artifact to; its directory is created."""
+        path = self._resolve(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def find(self, name):
+        """Absolute path of an existing artifact, None if it does not exist (or is not in the store)."""
+        try:
+            path = self._resolve(name)
+        except ValueError:
+            return None
+        return path if os.path.isfile(path) else None
+
+    def touch(self, name):
+        """Record a use of an artifact. Returns False when it does not exist (e.g. it was evicted)."""
+        path = self.find(name)
+        if path is None:
+            return False
+        try:
+            os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def add(self, name):
+        """Register a freshly written artifact and enforce the budget. Returns the evicted names."""
+        self.touch(name)
+        return self.evict(keep=(name,))
+
+    def entries(self):
+        """(name, size, last use in ns) of every artifact, least recently used first."""
+        rows = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                name = os.path.relpath(path, self.root).replace(os.sep, '/')
+                rows.append((name, stat.st_size, max(stat.st_atime_ns, stat.st_mtime_ns)))
+        rows.sort(key=lambda row: row[2])
+        return rows
+
+    def usage(self):
+        """Number of artifacts and their total size in bytes."""
+        rows = self.entries()
+        return len(rows), sum(size for _, size, _ in rows)
+
+    def evict(self, keep=()):
+        """Remove least recently used artifacts until the store fits its budget. Returns the evicted names."""
+        rows = self.entries()
+        total = sum(size for _, size, _ in rows)
+        evicted = []
+        for name, size, _ in rows:
+            if total <= self.budget:
+                break
+            if name in keep:
+                continue
+            try:
+                os.remove(os.path.join(self.root, name))
+            except FileNotFoundError:
+                pass  # Another process evicted it first
+            total -= size
+            evicted.append(name)
+            logger.info(f"Evicted artifact {name} ({size} bytes)")
+        return evicted
+
+def default_store():
+    """The store configured by SCHEDULER_ARTIFACT_DIR and SCHEDULER_ARTIFACT_BUDGET."""
+    return ArtifactStore(os.environ.get(ENV_DIR, DEFAULT_DIR),
+                         int(os.environ.get(ENV_BUDGET, DEFAULT_BUDGET)))
+
+def main():
+    parser = argparse.ArgumentParser(description="List the artifact store and evict down to its budget")
+    parser.add_argument('--dir', default=os.environ.get(ENV_DIR, DEFAULT_DIR), help="artifact directory")
+    parser.add_argument('--budget', type=int, default=int(os.environ.get(ENV_BUDGET, DEFAULT_BUDGET)),
+                        help="byte budget")
+    parser.add_argument('--evict', action='store_true', help="evict least recently used artifacts over the budget")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    store = ArtifactStore(args.dir, args.budget)
+    if args.evict:
+        store.evict()
+    rows = store.entries()
+    print(f"{'Artifact':<48} {'Size (KB)':>10}  Last used")
+    for name, size, used in reversed(rows):
+        print(f"{name:<48} {size / 1024:>10.1f}  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(used / 1e9))}")
+    total = sum(size for _, size, _ in rows)
+    print(f"\n{len(rows)} artifacts, {total / 1024:.1f} KB of {store.budget / 1024:.1f} KB in {store.root}")
+    return 1 if total > store.budget else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
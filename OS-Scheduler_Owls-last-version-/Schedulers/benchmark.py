@@ -0,0 +1,298 @@
+import numpy as np
+import os
+import sys
+import gc
+import json
+import math
+import time
+import argparse
+import statistics
+import tracemalloc
+import logging
+from datetime import datetime
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+sys.path.append(base_dir)
+
+# Import the comparison pipeline, the scheduler registry (which loads the schedulers on first use)
+# and the SMP simulator
+from Schedulers import performance_analysis
+from Schedulers import registry
+from Schedulers import smp
+from Schedulers import benchmark_history
+
+# Per-run scheduler logging would distort the timings
+performance_analysis.logger.setLevel(logging.WARNING)
+smp.logger.setLevel(logging.WARNING)
+
+DEFAULT_SIZES = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+
+def _same(processes):
+    # These engines work on copies and can reuse the Process objects
+    return processes
+
+def _timed_engine(scheduler):
+    """(prepare, run) of a registered scheduler: only execute() is timed, with the default options."""
+    options = scheduler.bind({})
+    return (lambda ps: scheduler.prepare(ps, **options),
+            lambda data: scheduler.execute(data, verbose=False, **options))
+
+def _predicted_srtf(processes):
+    from Schedulers.Predictive.predictive import predictive_scheduling
+    return predictive_scheduling(processes, preemptive=True, verbose=False, return_history=True)
+
+def _engines():
+    """name: (prepare, run); prepare builds a fresh input outside the timed region."""
+    engines = {scheduler.name: _timed_engine(scheduler) for scheduler in registry.schedulers()}
+    # Variants that only exist as benchmarks
+    engines['SRTF (predicted)'] = (_same, _predicted_srtf)
+    engines['SMP Round Robin (4 cores)'] = (_same, lambda ps: smp.simulate_smp(ps, 'Round Robin', cores=4))
+    return engines
+
+ENGINES = _engines()
+
+def resolve_engine(name):
+    """Map an engine name or a registry slug (e.g. round_robin) to its ENGINES key; KeyError if unknown."""
+    if name in ENGINES:
+        return name
+    return registry.get(name).name
+
+def generate_processes(size, seed=0, load=0.9, min_burst=1, max_burst=25, lambda_priority=6.0, deadline_slack=4.0):
+    """
+    Generate a workload of exactly size processes.
+    - Bursts and priorities follow the web app generator; arrivals are spread so the
+      offered load (total burst / arrival span) is about load
+    - Every process gets a deadline of 1 to deadline_slack times its burst (for EDF)
+    """
+    rng = np.random.default_rng(seed)
+    bursts = rng.integers(min_burst, max_burst + 1, size)
+    span = max(int(bursts.sum() / load), 1)
+    arrivals = rng.integers(0, span + 1, size)
+    priorities = np.maximum(rng.poisson(lambda_priority, size), 1)
+    deadlines = np.round(bursts * rng.uniform(1, deadline_slack, size), 1)
+    Process = performance_analysis.Process
+    return [Process(f"P{i + 1}", a, b, p, deadline=d)
+            for i, (a, b, p, d) in enumerate(zip(arrivals.tolist(), bursts.tolist(), priorities.tolist(),
+                                                 deadlines.tolist()))]
+
+def pin_cpu(cpu=None):
+    """
+    Pin this process to one CPU so timings do not move between cores.
+    cpu defaults to the first CPU the process may run on; returns the pinned CPU, or
+    None where affinity is not supported (macOS, Windows).
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        logger.warning("CPU pinning is not supported on this platform, timings may be noisier")
+        return None
+    if cpu is None:
+        cpu = min(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpu})
+    return cpu
+
+def environment(pinned_cpu=None):
+    """Where the benchmark ran, stored with the results so runs can be compared."""
+    env = benchmark_history.machine_environment()
+    env['pinned_cpu'] = pinned_cpu
+    return env
+
+def time_engine(engine, processes, warmup=1, repetitions=5):
+    """
+    Time one engine on one workload.
+    - warmup untimed runs first (caches, lazy imports, allocator)
+    - then repetitions timed runs, each on a freshly prepared input and after a full
+      garbage collection; only the scheduler call is timed
+    Returns the list of wall-clock times in seconds.
+    """
+    prepare, run = ENGINES[engine]
+    for _ in range(warmup):
+        run(prepare(processes))
+    times = []
+    for _ in range(repetitions):
+        data = prepare(processes)
+        gc.collect()
+        start = time.perf_counter()
+        run(data)
+        times.append(time.perf_counter() - start)
+    return times
+
+def peak_memory(engine, processes):
+    """Peak memory in bytes allocated by one run of the engine (traced separately from the timings)."""
+    prepare, run = ENGINES[engine]
+    data = prepare(processes)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_benchmark(engines=None, sizes=DEFAULT_SIZES, warmup=1, repetitions=5, seed=0, time_budget=60.0,
+                  memory=True, cpu=None, pin=True):
+    """
+    Benchmark every engine over growing workload sizes.
+    - Each size uses the same seeded workload for every engine
+    - An engine stops growing once its next size is projected (from the measured
+      scaling exponent) to take more than time_budget seconds for warmup and all
+      repetitions; the skipped sizes are listed, so a complexity blowup is visible
+    - ops_per_sec is processes scheduled per second at the median time; exponent is
+      the slope of log(time) over log(size) from the previous size (1 is linear,
+      2 quadratic)
+    Returns {'environment', 'config', 'results': {engine: [row per size]}, 'skipped'}.
+    """
+    resolved, unknown = [], []
+    for engine in engines or list(ENGINES):
+        try:
+            resolved.append(resolve_engine(engine))
+        except KeyError:
+            unknown.append(engine)
+    if unknown:
+        raise ValueError(f"Unknown engine(s): {', '.join(unknown)}")
+    engines = list(dict.fromkeys(resolved))
+    sizes = sorted(sizes)
+    pinned = pin_cpu(cpu) if pin else None
+
+    results = {engine: [] for engine in engines}
+    skipped = {}
+    active = list(engines)
+    for size in sizes:
+        if not active:
+            break
+        processes = generate_processes(size, seed)
+        for engine in list(active):
+            rows = results[engine]
+            if rows:
+                previous = rows[-1]
+                exponent = max(previous['exponent'] or 1.0, 1.0)
+                projected = previous['median'] * (size / previous['size']) ** exponent * (warmup + repetitions)
+                if projected > time_budget:
+                    skipped[engine] = [s for s in sizes if s >= size]
+                    active.remove(engine)
+                    logger.info(f"{engine}: skipping sizes from {size} (projected {projected:.0f}s "
+                                f"> budget {time_budget:.0f}s)")
+                    continue
+            times = time_engine(engine, processes, warmup, repetitions)
+            median = statistics.median(times)
+            row = {
+                'size': size,
+                'times': times,
+                'min': min(times),
+                'median': median,
+                'mean': statistics.fmean(times),
+                'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+                'ops_per_sec': size / median if median > 0 else float('inf'),
+                'exponent': (math.log(median / rows[-1]['median']) / math.log(size / rows[-1]['size'])
+                             if rows and rows[-1]['median'] > 0 and median > 0 else None),
+                'peak_memory': peak_memory(engine, processes) if memory else None
+            }
+            rows.append(row)
+            logger.info(f"{engine} n={size}: median {median * 1000:.2f} ms, {row['ops_per_sec']:,.0f} processes/s")
+        del processes
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(pinned),
+        'config': {'sizes': sizes, 'warmup': warmup, 'repetitions': repetitions, 'seed': seed,
+                   'time_budget': time_budget},
+        'results': results,
+        'skipped': skipped
+    }
+
+def plot_scaling(benchmark, output_file):
+    """Log-log scaling curves: time per run and processes per second against workload size."""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    fig.suptitle('Scheduler Benchmark', fontsize=16, y=1.02)
+
+    for engine, rows in benchmark['results'].items():
+        if not rows:
+            continue
+        sizes = [r['size'] for r in rows]
+        ax1.plot(sizes, [r['median'] for r in rows], marker='o', label=engine)
+        ax2.plot(sizes, [r['ops_per_sec'] for r in rows], marker='o', label=engine)
+
+    ax1.set_title('Median Time per Run')
+    ax1.set_ylabel('Seconds')
+    ax2.set_title('Throughput')
+    ax2.set_ylabel('Processes per second')
+    for ax in (ax1, ax2):
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Processes')
+        ax.grid(True, which='both', linestyle='--', alpha=0.5)
+    ax2.legend(fontsize=8, loc='best')
+
+    plt.tight_layout()
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    plt.savefig(output_file, bbox_inches='tight', dpi=100)
+    plt.close(fig)
+
+    logger.info(f"Benchmark plot saved to {output_file}")
+    return output_file
+
+def print_benchmark(benchmark):
+    """Print one row per engine and size."""
+    print(f"\n{'Engine':<27} {'Size':>9} {'Median (ms)':>12} {'Stdev (ms)':>11} {'Processes/s':>13} "
+          f"{'Exponent':>9} {'Peak Memory':>12}")
+    print("-" * 100)
+    for engine, rows in benchmark['results'].items():
+        for r in rows:
+            exponent = f"{r['exponent']:.2f}" if r['exponent'] is not None else '-'
+            memory = f"{r['peak_memory'] / 2 ** 20:.1f} MiB" if r['peak_memory'] is not None else '-'
+            print(f"{engine:<27} {r['size']:>9} {r['median'] * 1000:>12.2f} {r['stdev'] * 1000:>11.2f} "
+                  f"{r['ops_per_sec']:>13,.0f} {exponent:>9} {memory:>12}")
+        if engine in benchmark['skipped']:
+            print(f"{engine:<27} {'skipped':>9} sizes {', '.join(str(s) for s in benchmark['skipped'][engine])} "
+                  f"(over the time budget)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the schedulers over growing workload sizes.")
+    parser.add_argument('--engines', nargs='+',
+                        help=f"engines to run, by name or registry slug (default: all of {', '.join(ENGINES)})")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="workload sizes")
+    parser.add_argument('--warmup', type=int, default=1, help="untimed runs before timing")
+    parser.add_argument('--repetitions', type=int, default=5, help="timed runs per engine and size")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--time-budget', type=float, default=60.0,
+                        help="skip larger sizes once an engine is projected to take longer (seconds)")
+    parser.add_argument('--cpu', type=int, default=None, help="CPU to pin to (default: first allowed CPU)")
+    parser.add_argument('--no-pin', action='store_true', help="do not pin the process to one CPU")
+    parser.add_argument('--no-memory', action='store_true', help="skip the peak memory measurement")
+    parser.add_argument('--json', help="write the benchmark to this JSON file")
+    parser.add_argument('--plot', help="save the scaling curves to this PNG file")
+    parser.add_argument('--record', action='store_true',
+                        help="store the run in the local benchmark history (see benchmark_history.py)")
+    parser.add_argument('--label', help="name for the recorded run (default: git describe)")
+    args = parser.parse_args()
+    for engine in args.engines or []:
+        try:
+            resolve_engine(engine)
+        except KeyError:
+            parser.error(f"unknown engine: {engine} (choose from {', '.join(ENGINES)} or a registry slug)")
+
+    benchmark = run_benchmark(args.engines, args.sizes, warmup=args.warmup, repetitions=args.repetitions,
+                              seed=args.seed, time_budget=args.time_budget, memory=not args.no_memory,
+                              cpu=args.cpu, pin=not args.no_pin)
+    print_benchmark(benchmark)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(benchmark, f, indent=2)
+        logger.info(f"Benchmark results written to {args.json}")
+    if args.plot:
+        plot_scaling(benchmark, args.plot)
+    if args.record:
+        benchmark_history.save_run(benchmark, label=args.label)
+    return benchmark
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+import numpy as np
+import os
+import re
+import sys
+import json
+import glob
+import math
+import hashlib
+import platform
+import argparse
+import statistics
+import subprocess
+import logging
+from functools import lru_cache
+from datetime import datetime
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+
+# Benchmark runs are kept per machine under <project>/.benchmarks/<fingerprint>/
+HISTORY_DIR = os.path.join(base_dir, '.benchmarks')
+
+# Environment fields that change how fast the same code runs
+FINGERPRINT_FIELDS = ('implementation', 'python', 'platform', 'machine', 'processor', 'cpu_count', 'numpy')
+
+def machine_environment():
+    """The machine and interpreter this process runs on."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__
+    }
+
+def machine_fingerprint(environment):
+    """Short stable hash of the machine and interpreter a benchmark ran on."""
+    key = json.dumps({field: environment.get(field) for field in FINGERPRINT_FIELDS}, sort_keys=True)
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+def _git(*args):
+    try:
+        result = subprocess.run(['git', *args], cwd=base_dir, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def git_revision():
+    """The commit and nearest tag of the working tree ('unknown' outside a git checkout)."""
+    return {
+        'commit': _git('rev-parse', 'HEAD') or 'unknown',
+        'revision': _git('describe', '--tags', '--always', '--dirty') or 'unknown'
+    }
+
+def save_run(benchmark, label=None, history_dir=HISTORY_DIR):
+    """
+    Store a run_benchmark result in the local history.
+    - The run is tagged with the git commit/tag, an optional label and the machine
+      fingerprint, and written to <history_dir>/<fingerprint>/<timestamp>_<revision>.json
+    Returns the path of the stored run.
+    """
+    run = dict(benchmark)
+    run.update(git_revision())
+    run['label'] = label
+    run['fingerprint'] = machine_fingerprint(run['environment'])
+
+    directory = os.path.join(history_dir, run['fingerprint'])
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.fromisoformat(run['timestamp']).strftime('%Y%m%dT%H%M%S')
+    name = re.sub(r'[^A-Za-z0-9._-]', '_', label or run['revision'])
+    path = os.path.join(directory, f"{stamp}_{name}.json")
+    with open(path, 'w') as f:
+        json.dump(run, f, indent=2)
+    logger.info(f"Benchmark run stored as {path}")
+    return path
+
+def load_runs(history_dir=HISTORY_DIR, fingerprint=None):
+    """All stored runs (optionally of one machine), oldest first; each carries its 'path'."""
+    pattern = os.path.join(history_dir, fingerprint or '*', '*.json')
+    runs = []
+    for path in glob.glob(pattern):
+        try:
+            with open(path) as f:
+                run = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable benchmark run {path}: {e}")
+            continue
+        run['path'] = path
+        runs.append(run)
+    return sorted(runs, key=lambda r: r['timestamp'])
+
+def find_run(ref, runs):
+    """
+    Pick a run by reference, newest match first.
+    - 'latest' / 'previous': the newest and second newest run
+    - a path to a benchmark JSON file (also plain benchmark.py --json output)
+    - a label, a git tag or describe string, or a commit hash prefix
+    """
+    if ref in ('latest', 'previous'):
+        index = -1 if ref == 'latest' else -2
+        if len(runs) < -index:
+            raise ValueError(f"Not enough stored runs for '{ref}'")
+        return runs[index]
+    if os.path.isfile(ref):
+        with open(ref) as f:
+            run = json.load(f)
+        run['path'] = ref
+        run.setdefault('fingerprint', machine_fingerprint(run['environment']))
+        return run
+    for run in reversed(runs):
+        if ref in (run.get('label'), run.get('revision')) or (len(ref) >= 4 and run.get('commit', '').startswith(ref)):
+            return run
+    raise ValueError(f"No stored benchmark run matches '{ref}'")
+
+@lru_cache(maxsize=None)
+def _u_counts(m, n):
+    """Number of orderings of m + n distinct values giving each Mann-Whitney U (0..m*n)."""
+    if m == 0 or n == 0:
+        return (1,)
+    counts = [0] * (m * n + 1)
+    # The largest value is either one of the m (beats all n) or one of the n
+    for u, c in enumerate(_u_counts(m - 1, n)):
+        counts[u + n] += c
+    for u, c in enumerate(_u_counts(m, n - 1)):
+        counts[u] += c
+    return tuple(counts)
+
+def mann_whitney_greater(sample, reference):
+    """
+    One-sided Mann-Whitney U test that sample tends to be larger than reference.
+    - Exact p-value for small samples without ties, normal approximation (with tie
+      and continuity correction) otherwise
+    - Makes no normality assumption, so a few outlier timings do not decide the result
+    """
+    m, n = len(sample), len(reference)
+    if m == 0 or n == 0:
+        return 1.0
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in sample for y in reference)
+    ties = len(set(sample) | set(reference)) < m + n
+    if not ties and m * n <= 400:
+        counts = _u_counts(m, n)
+        return sum(counts[math.ceil(u):]) / math.comb(m + n, m)
+
+    # Normal approximation with tie correction
+    values = sorted(sample + reference)
+    tie_sizes = [values.count(v) for v in set(values)]
+    total = m + n
+    variance = m * n / 12 * ((total + 1) - sum(t ** 3 - t for t in tie_sizes) / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+def compare_runs(baseline, candidate, alpha=0.05, threshold=0.05):
+    """
+    Compare the raw timings of two benchmark runs per engine and workload size.
+    - A cell is 'slower' when the candidate is significantly slower (one-sided
+      Mann-Whitney p < alpha) and its median time grew by more than threshold;
+      'faster' is the mirror image; everything else is 'unchanged'
+    - Both conditions are needed: with many repetitions a 0.5% change is significant
+      but not worth failing a build over, and a large change on noisy timings is not
+      significant
+    Returns {'baseline', 'candidate', 'rows', 'regressions', 'improvements'}.
+    """
+    rows = []
+    for engine, candidate_rows in candidate['results'].items():
+        baseline_by_size = {r['size']: r for r in baseline['results'].get(engine, [])}
+        for new in candidate_rows:
+            old = baseline_by_size.get(new['size'])
+            if old is None:
+                continue
+            ratio = new['median'] / old['median'] if old['median'] > 0 else float('inf')
+            p_slower = mann_whitney_greater(new['times'], old['times'])
+            p_faster = mann_whitney_greater(old['times'], new['times'])
+            if p_slower < alpha and ratio > 1 + threshold:
+                status = 'slower'
+            elif p_faster < alpha and ratio < 1 / (1 + threshold):
+                status = 'faster'
+            else:
+                status = 'unchanged'
+            rows.append({
+                'engine': engine,
+                'size': new['size'],
+                'baseline_median': old['median'],
+                'candidate_median': new['median'],
+                'baseline_ops_per_sec': old['ops_per_sec'],
+                'candidate_ops_per_sec': new['ops_per_sec'],
+                'ratio': ratio,
+                'p_slower': p_slower,
+                'p_faster': p_faster,
+                'status': status
+            })
+
+    def describe(run):
+        return {key: run.get(key) for key in ('timestamp', 'revision', 'commit', 'label', 'fingerprint', 'path')}
+
+    return {
+        'baseline': describe(baseline),
+        'candidate': describe(candidate),
+        'alpha': alpha,
+        'threshold': threshold,
+        'rows': rows,
+        'regressions': sum(1 for r in rows if r['status'] == 'slower'),
+        'improvements': sum(1 for r in rows if r['status'] == 'faster')
+    }
+
+def _run_name(run):
+    return run.get('label') or run.get('revision') or os.path.basename(run.get('path') or '?')
+
+def print_comparison(comparison):
+    """Print one row per engine and size, marking significant changes."""
+    print(f"\nBaseline:  {_run_name(comparison['baseline'])} ({comparison['baseline']['timestamp']})")
+    print(f"Candidate: {_run_name(comparison['candidate'])} ({comparison['candidate']['timestamp']})")
+    print(f"\n{'Engine':<27} {'Size':>9} {'Baseline (ms)':>14} {'Candidate (ms)':>15} {'Change':>8} "
+          f"{'p (slower)':>11} {'Status':>10}")
+    print("-" * 100)
+    for r in comparison['rows']:
+        mark = {'slower': 'SLOWER', 'faster': 'faster', 'unchanged': ''}[r['status']]
+        print(f"{r['engine']:<27} {r['size']:>9} {r['baseline_median'] * 1000:>14.2f} "
+              f"{r['candidate_median'] * 1000:>15.2f} {(r['ratio'] - 1) * 100:>+7.1f}% "
+              f"{r['p_slower']:>11.4f} {mark:>10}")
+    print("-" * 100)
+    print(f"{comparison['regressions']} significant slowdown(s), {comparison['improvements']} speedup(s) "
+          f"(alpha {comparison['alpha']}, threshold {comparison['threshold'] * 100:.0f}%)")
+
+def print_history(runs):
+    """List the stored runs, newest last."""
+    print(f"\n{'Timestamp':<20} {'Fingerprint':<13} {'Revision':<28} {'Label':<16} Engines")
+    print("-" * 100)
+    for run in runs:
+        print(f"{run['timestamp']:<20} {run.get('fingerprint', '-'):<13} {run.get('revision', '-'):<28} "
+              f"{run.get('label') or '-':<16} {len(run['results'])}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep a history of benchmark runs and compare them for regressions.")
+    parser.add_argument('--history', default=HISTORY_DIR, help="history directory")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help="store a benchmark.py --json file in the history")
+    record.add_argument('file')
+    record.add_argument('--label', help="name for the run (default: git describe)")
+
+    listing = commands.add_parser('list', help="list stored runs")
+    listing.add_argument('--all-machines', action='store_true', help="include runs from other machines")
+
+    compare = commands.add_parser('compare', help="flag significant slowdowns between two runs")
+    compare.add_argument('baseline', nargs='?', default='previous',
+                         help="label, tag, commit, JSON path, 'latest' or 'previous' (default: previous)")
+    compare.add_argument('candidate', nargs='?', default='latest', help="same forms (default: latest)")
+    compare.add_argument('--alpha', type=float, default=0.05, help="significance level")
+    compare.add_argument('--threshold', type=float, default=0.05,
+                         help="minimum relative change of the median to report (0.05 = 5%%)")
+    compare.add_argument('--all-machines', action='store_true',
+                         help="allow comparing runs from different machines")
+    compare.add_argument('--json', help="write the comparison to this JSON file")
+    compare.add_argument('--plot', action='store_true', help="save the comparison chart")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        with open(args.file) as f:
+            save_run(json.load(f), label=args.label, history_dir=args.history)
+        return 0
+
+    # Only runs from this machine are comparable unless asked otherwise
+    fingerprint = None if args.all_machines else machine_fingerprint(machine_environment())
+    runs = load_runs(args.history, fingerprint)
+
+    if args.command == 'list':
+        print_history(runs)
+        return 0
+
+    try:
+        baseline = find_run(args.baseline, runs)
+        candidate = find_run(args.candidate, runs)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+    if baseline.get('fingerprint') != candidate.get('fingerprint'):
+        logger.warning("The runs come from different machines; timing differences may not be caused by the code")
+
+    comparison = compare_runs(baseline, candidate, alpha=args.alpha, threshold=args.threshold)
+    print_comparison(comparison)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(comparison, f, indent=2)
+        logger.info(f"Benchmark comparison written to {args.json}")
+    if args.plot:
+        sys.path.append(base_dir)
+        from performance_analysis2 import plot_benchmark_comparison
+        plot_benchmark_comparison(comparison)
+
+    # A non-zero exit status lets a build or upgrade script gate on the result
+    return 1 if comparison['regressions'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
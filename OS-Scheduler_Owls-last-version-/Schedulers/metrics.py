@@ -0,0 +1,205 @@
+import numpy as np
+
+# Percentiles reported for waiting, response and turnaround times
+PERCENTILES = (50, 90, 95, 99)
+
+# Above this many values the streaming estimator is used instead of sorting
+STREAMING_THRESHOLD = 1_000_000
+
+class P2Quantile:
+    """
+    Streaming quantile estimate with the P-square algorithm (Jain & Chlamtac, 1985).
+    Keeps five markers instead of the samples, so memory is constant.
+    """
+    def __init__(self, quantile):
+        self.quantile = quantile
+        self.count = 0
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self.increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, x):
+        self.count += 1
+        if self.count <= 5:
+            self.heights.append(x)
+            self.heights.sort()
+            return
+
+        # Find the cell containing x and update the extreme markers
+        q = self.heights
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+
+        for i in range(k + 1, 5):
+            self.positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self.desired[i] - self.positions[i]
+            if (d >= 1 and self.positions[i + 1] - self.positions[i] > 1) or \
+               (d <= -1 and self.positions[i - 1] - self.positions[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (self.positions[i + step] - self.positions[i])
+                q[i] = candidate
+                self.positions[i] += step
+
+    def _parabolic(self, i, step):
+        q, n = self.heights, self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self):
+        if self.count == 0:
+            return 0.0
+        if self.count <= 5:
+            return float(np.percentile(self.heights, self.quantile * 100))
+        return float(self.heights[2])
+
+class StreamingTailSummary:
+    """Track the tail percentiles and maximum of a stream of values."""
+    def __init__(self, percentiles=PERCENTILES):
+        self.estimators = {p: P2Quantile(p / 100) for p in percentiles}
+        self.maximum = 0.0
+        self.count = 0
+
+    def add(self, x):
+        self.count += 1
+        self.maximum = x if self.count == 1 else max(self.maximum, x)
+        for estimator in self.estimators.values():
+            estimator.add(x)
+
+    def summary(self):
+        result = {f'p{p}': estimator.value() for p, estimator in self.estimators.items()}
+        result['max'] = float(self.maximum)
+        return result
+
+def tail_summary(values, percentiles=PERCENTILES, streaming=None):
+    """
+    Return p50/p90/p95/p99 and max of a collection of times.
+    - Uses a single vectorized np.percentile call for in-memory data
+    - Uses StreamingTailSummary for iterators or very large inputs (or streaming=True)
+    """
+    if streaming is None:
+        streaming = not hasattr(values, '__len__') or len(values) > STREAMING_THRESHOLD
+    if streaming:
+        tracker = StreamingTailSummary(percentiles)
+        for x in values:
+            tracker.add(float(x))
+        return tracker.summary()
+
+    data = np.asarray(values, dtype=float)
+    if data.size == 0:
+        return {**{f'p{p}': 0.0 for p in percentiles}, 'max': 0.0}
+    result = dict(zip((f'p{p}' for p in percentiles), np.percentile(data, percentiles).tolist()))
+    result['max'] = float(data.max())
+    return result
+
+def flatten_tail(name, summary):
+    """Turn {'p95': x, 'max': y} into {'p95_waiting': x, 'max_waiting': y}."""
+    return {f'{key}_{name}': value for key, value in summary.items()}
+
+def system_metrics(execution_history, arrivals=None, completions=None, cores=1):
+    """
+    System-level metrics computed from an execution trace.
+    - execution_history is a list of {'pid', 'start', 'end'} slices; slices with
+      'kind': 'switch' are context switch overhead rather than useful work, and
+      multi-core traces tag every slice with its 'core'
+    - arrivals (optional) sets the start of the makespan to the first arrival
+    - completions defaults to the number of distinct processes in the trace
+    - cores is the number of CPUs the utilization is divided by
+    Returns makespan, busy/idle/switch time, CPU utilization, throughput,
+    context switches, preemptions and migrations between cores.
+    """
+    work = sorted((s for s in execution_history if s.get('kind', 'run') == 'run'),
+                  key=lambda s: s['start'])
+    if not work:
+        return {'makespan': 0.0, 'busy_time': 0.0, 'idle_time': 0.0, 'switch_time': 0.0,
+                'utilization': 0.0, 'throughput': 0.0, 'context_switches': 0, 'preemptions': 0,
+                'migrations': 0}
+
+    start = min(arrivals) if arrivals else work[0]['start']
+    end = max(s['end'] for s in execution_history)
+    makespan = end - start
+    busy = sum(s['end'] - s['start'] for s in work)
+    switch_time = sum(s['end'] - s['start'] for s in execution_history if s.get('kind') == 'switch')
+
+    # Slices of the same process that touch each other on the same core are one dispatch
+    # (SRTF and Priority split slices at every arrival)
+    last_dispatch = {}
+    dispatches = []
+    for s in work:
+        core = s.get('core', 0)
+        previous = last_dispatch.get(core)
+        if previous and previous['pid'] == s['pid'] and abs(previous['end'] - s['start']) < 1e-9:
+            previous['end'] = s['end']
+        else:
+            last_dispatch[core] = {'pid': s['pid'], 'start': s['start'], 'end': s['end'], 'core': core}
+            dispatches.append(last_dispatch[core])
+
+    context_switches = 0
+    previous_pid = {}
+    for d in dispatches:
+        if d['core'] in previous_pid and previous_pid[d['core']] != d['pid']:
+            context_switches += 1
+        previous_pid[d['core']] = d['pid']
+
+    runs_per_process = {}
+    migrations = 0
+    last_core = {}
+    for d in dispatches:
+        runs_per_process[d['pid']] = runs_per_process.get(d['pid'], 0) + 1
+        if d['pid'] in last_core and last_core[d['pid']] != d['core']:
+            migrations += 1
+        last_core[d['pid']] = d['core']
+    preemptions = sum(count - 1 for count in runs_per_process.values())
+
+    if completions is None:
+        completions = len(runs_per_process)
+
+    capacity = makespan * cores
+    return {
+        'makespan': makespan,
+        'busy_time': busy,
+        'idle_time': max(capacity - busy - switch_time, 0.0),
+        'switch_time': switch_time,
+        'utilization': busy / capacity if capacity > 0 else 0.0,
+        'throughput': completions / makespan if makespan > 0 else 0.0,
+        'context_switches': context_switches,
+        'preemptions': preemptions,
+        'migrations': migrations
+    }
+
+def deadline_metrics(processes, deadlines):
+    """
+    Deadline (latency SLO) metrics of a schedule.
+    - processes are {'pid', 'completion'} dicts; deadlines maps pid to the absolute
+      deadline, and processes without an entry are ignored
+    - Lateness is completion - deadline (negative when a process finishes early);
+      tardiness is the positive part of the lateness
+    Returns the number and ratio of missed deadlines and the average and maximum
+    lateness and tardiness, or {} when no process has a deadline.
+    """
+    lateness = [p['completion'] - deadlines[p['pid']] for p in processes if deadlines.get(p['pid']) is not None]
+    if not lateness:
+        return {}
+    misses = sum(1 for x in lateness if x > 1e-9)
+    return {
+        'deadline_misses': misses,
+        'deadline_miss_ratio': misses / len(lateness),
+        'avg_lateness': sum(lateness) / len(lateness),
+        'max_lateness': max(lateness),
+        'avg_tardiness': sum(max(x, 0.0) for x in lateness) / len(lateness),
+        'max_tardiness': max(max(lateness), 0.0)
+    }
@@ -0,0 +1,284 @@
+import numpy as np
+import os
+import json
+import random
+import sys
+import argparse
+import math
+import logging
+from functools import lru_cache
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+sys.path.append(base_dir)
+
+# Import the comparison pipeline (which loads the schedulers on first use) and the scheduler registry
+from Schedulers import performance_analysis
+from Schedulers import registry
+
+# Per-run scheduler logging would drown out the Monte Carlo progress
+performance_analysis.logger.setLevel(logging.WARNING)
+
+METRICS = ['avg_waiting', 'avg_turnaround', 'avg_response']
+# Tail metrics are reported with intervals too, but are too noisy to drive early stopping
+TAIL_METRICS = ['p95_waiting', 'p95_response', 'p95_turnaround', 'p99_waiting', 'max_waiting']
+SYSTEM_METRICS = ['throughput', 'utilization', 'idle_time', 'switch_time', 'makespan', 'context_switches', 'preemptions']
+# Only reported by SJF and SRTF when they run on predicted burst lengths
+PREDICTION_METRICS = ['prediction_mae', 'prediction_mape', 'prediction_bias']
+# Only reported when the generator gives processes deadlines (deadline_slack)
+DEADLINE_METRICS = ['deadline_miss_ratio', 'avg_lateness', 'max_lateness', 'avg_tardiness']
+
+# Same ranges as generate_new_processes in app.py
+DEFAULT_GENERATOR = {
+    'min_processes': 3,
+    'max_processes': 10,
+    'max_arrival': 15,
+    'min_burst': 1,
+    'max_burst': 25,
+    'lambda_range': (4, 10),
+    'deadline_slack': None
+}
+
+def generate_workload(seed, min_processes=3, max_processes=10, max_arrival=15,
+                      min_burst=1, max_burst=25, lambda_range=(4, 10), deadline_slack=None):
+    """
+    Generate a reproducible workload with the same distributions as the web app generator.
+    deadline_slack gives every process a relative deadline of its burst time times a
+    factor drawn uniformly from [1, deadline_slack]; None leaves out deadlines.
+    """
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+
+    num_processes = rng.randint(min_processes, max_processes)
+    arrival_times = [rng.randint(0, max_arrival) for _ in range(num_processes)]
+    burst_times = [rng.randint(min_burst, max_burst) for _ in range(num_processes)]
+    lambda_priority = rng.uniform(*lambda_range)
+    priorities = [max(1, int(p)) for p in np_rng.poisson(lambda_priority, num_processes)]
+    deadlines = [None] * num_processes
+    if deadline_slack is not None:
+        deadlines = [round(burst * rng.uniform(1, deadline_slack), 1) for burst in burst_times]
+
+    return [performance_analysis.Process(f"P{i + 1}", arrival_times[i], burst_times[i], priorities[i],
+                                         deadline=deadlines[i])
+            for i in range(num_processes)]
+
+def _simulate_seed(task):
+    """Generate the workload for one seed and run the selected schedulers on it."""
+    seed, generator, schedulers, time_quantum, context_switch, cache_penalty, aging, prediction = task
+    processes = generate_workload(seed, **generator)
+    metrics = {}
+    for scheduler in schedulers:
+        results = performance_analysis.run_scheduler(processes, scheduler, time_quantum=time_quantum, verbose=False,
+                                                     context_switch=context_switch, cache_penalty=cache_penalty,
+                                                     aging=aging, prediction=prediction)
+        metrics[scheduler] = performance_analysis.calculate_metrics_from_dict(results)
+    return metrics
+
+# Below this many degrees of freedom the Cornish-Fisher expansion is too small (7.15 instead
+# of 12.71 at df=1), so the critical value is found from the exact t distribution
+EXACT_T_BELOW = 30
+
+def _t_coverage(t, df):
+    """P(|T| <= t) for Student's t with an integer df (Abramowitz & Stegun 26.7.3 and 26.7.4)."""
+    theta = math.atan(t / math.sqrt(df))
+    cos2 = math.cos(theta) ** 2
+    if df % 2:
+        term = total = math.cos(theta)
+        for k in range(1, (df - 1) // 2):
+            term *= cos2 * (2 * k) / (2 * k + 1)
+            total += term
+        return 2 / math.pi * (theta + (math.sin(theta) * total if df > 1 else 0.0))
+    term = total = 1.0
+    for k in range(1, df // 2):
+        term *= cos2 * (2 * k - 1) / (2 * k)
+        total += term
+    return math.sin(theta) * total
+
+@lru_cache(maxsize=256)
+def _t_critical(df, confidence):
+    """
+    Two-sided Student t critical value.
+    - Exact for df < EXACT_T_BELOW: the coverage is inverted by bisection
+    - Cornish-Fisher expansion of the normal quantile above that, where it is accurate to 1e-3
+    """
+    if df < EXACT_T_BELOW:
+        low, high = 0.0, 1.0
+        while _t_coverage(high, df) < confidence:
+            low, high = high, high * 2
+        for _ in range(100):
+            mid = (low + high) / 2
+            if _t_coverage(mid, df) < confidence:
+                low = mid
+            else:
+                high = mid
+        return high
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return (z + (z ** 3 + z) / (4 * df) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2))
+
+def summarize_samples(samples, confidence=0.95):
+    """Mean and confidence interval of each scheduler metric across the simulated workloads."""
+    summary = {}
+    for scheduler in samples[0] if samples else []:
+        summary[scheduler] = {}
+        for metric in METRICS + TAIL_METRICS + SYSTEM_METRICS + PREDICTION_METRICS + DEADLINE_METRICS:
+            values = np.array([s[scheduler][metric] for s in samples if s.get(scheduler) and metric in s[scheduler]])
+            n = len(values)
+            if n == 0 and metric in PREDICTION_METRICS + DEADLINE_METRICS:
+                continue
+            mean = float(values.mean()) if n else 0.0
+            std = float(values.std(ddof=1)) if n > 1 else 0.0
+            half_width = _t_critical(n - 1, confidence) * std / np.sqrt(n) if n > 1 else float('inf')
+            summary[scheduler][metric] = {
+                'mean': mean,
+                'std': std,
+                'half_width': float(half_width),
+                'ci_low': float(mean - half_width),
+                'ci_high': float(mean + half_width)
+            }
+    return summary
+
+def _intervals_tight(summary, rel_precision, abs_precision):
+    """True once every confidence interval is within the requested precision."""
+    for scheduler in summary:
+        for metric in METRICS:
+            stats = summary[scheduler][metric]
+            if stats['half_width'] > max(rel_precision * abs(stats['mean']), abs_precision):
+                return False
+    return True
+
+def run_monte_carlo(runs=200, seed=0, generator=None, time_quantum=4.0, confidence=0.95,
+                    rel_precision=0.05, abs_precision=0.1, min_runs=20, batch_size=None, max_workers=None,
+                    context_switch=0.0, cache_penalty=0.0, aging=0.0, prediction=None, schedulers=None):
+    """
+    Compare all schedulers on many seeded workloads drawn from the same generator.
+    - Workload i uses seed + i, so results are reproducible
+    - Workloads are simulated in batches on a process pool; after each batch the
+      confidence intervals are recomputed and the run stops early once every interval
+      half-width is within rel_precision of its mean (or abs_precision)
+    - context_switch and cache_penalty set the dispatch overhead of the preemptive schedulers
+    - aging sets the Priority scheduler's priority improvement per unit of waiting time
+    - prediction runs SJF and SRTF on predicted burst lengths (see run_scheduler) and
+      adds their prediction error to the summary
+    - schedulers selects the schedulers by name or slug (see registry.select); default: all registered
+    - Returns mean and confidence interval per scheduler and metric
+    """
+    generator = dict(DEFAULT_GENERATOR, **(generator or {}))
+    schedulers = registry.select(schedulers)
+    workers = max_workers or os.cpu_count() or 1
+    batch_size = batch_size or max(min_runs, 4 * workers)
+
+    samples = []
+    seeds = []
+    summary = None
+    stopped_early = False
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while len(samples) < runs:
+            batch = [(seed + i, generator, schedulers, time_quantum, context_switch, cache_penalty, aging, prediction)
+                     for i in range(len(samples), min(runs, len(samples) + batch_size))]
+            if executor:
+                outcomes = list(executor.map(_simulate_seed, batch))
+            else:
+                outcomes = [_simulate_seed(task) for task in batch]
+            samples.extend(outcomes)
+            seeds.extend(task[0] for task in batch)
+
+            summary = summarize_samples(samples, confidence)
+            if len(samples) >= min_runs and len(samples) < runs and _intervals_tight(summary, rel_precision, abs_precision):
+                stopped_early = True
+                break
+    finally:
+        if executor:
+            executor.shutdown()
+
+    logger.info(f"Monte Carlo comparison finished after {len(samples)} workloads"
+                f"{' (intervals converged)' if stopped_early else ''}")
+    return {
+        'runs': len(samples),
+        'seeds': seeds,
+        'confidence': confidence,
+        'stopped_early': stopped_early,
+        'generator': generator,
+        'time_quantum': time_quantum,
+        'context_switch': context_switch,
+        'cache_penalty': cache_penalty,
+        'aging': aging,
+        'prediction': prediction,
+        'schedulers': schedulers,
+        'metrics': summary
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare scheduling algorithms over many seeded random workloads.")
+    parser.add_argument('--runs', type=int, default=200, help="maximum number of workloads")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first workload")
+    parser.add_argument('--confidence', type=float, default=0.95)
+    parser.add_argument('--precision', type=float, default=0.05,
+                        help="stop once every CI half-width is within this fraction of its mean")
+    parser.add_argument('--min-runs', type=int, default=20)
+    parser.add_argument('--quantum', type=float, default=4.0, help="Round Robin time quantum")
+    parser.add_argument('--context-switch', type=float, default=0.0, help="fixed cost of switching processes")
+    parser.add_argument('--cache-penalty', type=float, default=0.0,
+                        help="extra cost of resuming a preempted process")
+    parser.add_argument('--aging', type=float, default=0.0,
+                        help="Priority scheduler aging (priority units per unit of waiting time)")
+    parser.add_argument('--alpha', type=float, default=None,
+                        help="run SJF and SRTF on exponentially averaged burst predictions with this weight")
+    parser.add_argument('--initial-tau', type=float, default=5.0, help="prediction for a process' first burst")
+    parser.add_argument('--deadline-slack', type=float, default=None,
+                        help="give processes deadlines of up to this many times their burst time")
+    parser.add_argument('--schedulers', nargs='+', choices=registry.names(), metavar='NAME',
+                        help=f"schedulers to compare (default: all; one of {', '.join(registry.names())})")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--json', help="write the comparison to this JSON file")
+    parser.add_argument('--plot', action='store_true', help="save the comparison chart to the artifact store")
+    args = parser.parse_args()
+    prediction = None if args.alpha is None else {'alpha': args.alpha, 'initial_tau': args.initial_tau}
+
+    generator = {'deadline_slack': args.deadline_slack}
+
+    result = run_monte_carlo(runs=args.runs, seed=args.seed, generator=generator, time_quantum=args.quantum,
+                             confidence=args.confidence, rel_precision=args.precision,
+                             min_runs=args.min_runs, max_workers=args.workers,
+                             context_switch=args.context_switch, cache_penalty=args.cache_penalty,
+                             aging=args.aging, prediction=prediction, schedulers=args.schedulers)
+
+    print(f"\nMonte Carlo comparison over {result['runs']} workloads ({int(result['confidence'] * 100)}% CI)")
+    print("=" * 80)
+    print(f"{'Algorithm':<14} {'Avg Waiting':<22} {'Avg Turnaround':<22} {'Avg Response':<22}")
+    print("-" * 80)
+    for scheduler, metrics in result['metrics'].items():
+        cells = [f"{metrics[m]['mean']:.2f} ± {metrics[m]['half_width']:.2f}" for m in METRICS]
+        print(f"{scheduler:<14} {cells[0]:<22} {cells[1]:<22} {cells[2]:<22}")
+    print("=" * 80)
+    for scheduler, metrics in result['metrics'].items():
+        if 'prediction_mae' in metrics:
+            print(f"{scheduler} burst prediction MAE: {metrics['prediction_mae']['mean']:.2f} "
+                  f"(MAPE {metrics['prediction_mape']['mean']:.1%})")
+    if args.deadline_slack is not None:
+        print(f"\n{'Algorithm':<14} {'Deadline Miss Ratio':<22} {'Avg Lateness':<22} {'Max Lateness':<22}")
+        print("-" * 80)
+        for scheduler, metrics in result['metrics'].items():
+            cells = [f"{metrics[m]['mean']:.2f} ± {metrics[m]['half_width']:.2f}"
+                     for m in ('deadline_miss_ratio', 'avg_lateness', 'max_lateness')]
+            print(f"{scheduler:<14} {cells[0]:<22} {cells[1]:<22} {cells[2]:<22}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+        logger.info(f"Monte Carlo results written to {args.json}")
+    if args.plot:
+        # performance_analysis puts the project root on sys.path
+        from performance_analysis2 import plot_monte_carlo_comparison
+        plot_monte_carlo_comparison(result)
+    return result
+
+if __name__ == "__main__":
+    main()
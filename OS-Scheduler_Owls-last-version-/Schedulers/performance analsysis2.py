@@ -2,7 +2,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import os
 import sys
-import importlib.util
 import time
 from matplotlib.animation import FuncAnimation
 from datetime import datetime
@@ -12,40 +11,15 @@ import logging
 current_dir = os.path.dirname(os.path.abspath(__file__))
 base_dir = os.path.dirname(current_dir)
 
-# Add scheduler directories to Python path
-fcfs_srtf_dir = os.path.join(current_dir, "FCFS&SRTF")
-priority_rr_dir = os.path.join(current_dir, "Priority&RoundRobin")
-
 # Add base directory to Python path
 sys.path.append(base_dir)
 
-# Import the scheduling functions
-spec = importlib.util.spec_from_file_location("FCFS", os.path.join(fcfs_srtf_dir, "FCFS.py"))
-FCFS = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(FCFS)
-fcfs_schedule = FCFS.fcfs_scheduling
-
-spec = importlib.util.spec_from_file_location("SRTF", os.path.join(fcfs_srtf_dir, "SRTF.py"))
-SRTF = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(SRTF)
-srtf_schedule = SRTF.srtf_scheduling
-
-spec = importlib.util.spec_from_file_location("priority", os.path.join(priority_rr_dir, "priority.py"))
-priority = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(priority)
-priority_schedule = priority.highest_priority_first
+# The schedulers, the process type they take and the results file parser
+from Schedulers import registry
+from Schedulers.performance_analysis import Process
+from performance_analysis2 import read_scheduler_results
 
-spec = importlib.util.spec_from_file_location("round_robin", os.path.join(priority_rr_dir, "round_robin.py"))
-round_robin = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(round_robin)
-rr_schedule = round_robin.round_robin_scheduling
-
-class Process:
-    def __init__(self, pid, arrival_time, burst_time, priority):
-        self.pid = pid
-        self.arrival_time = float(arrival_time)
-        self.burst_time = float(burst_time)
-        self.priority = int(priority)
+logger = logging.getLogger(__name__)
 
 def generate_processes(n=10):
     """Generate n random processes for testing."""
@@ -57,70 +31,22 @@ def generate_processes(n=10):
         processes.append(Process(f"P{i}", arrival_time, burst_time, priority))
     return processes
 
-def run_scheduler(scheduler_func, processes):
-    """
-    Run a scheduler with the given processes.
-    Converts processes to the format expected by each scheduler.
-    """
-    # Convert processes to the format expected by each scheduler
-    if scheduler_func in [fcfs_schedule, srtf_schedule]:
-        # FCFS and SRTF use Process objects
-        process_objects = []
-        for p in processes:
-            if scheduler_func == srtf_schedule:
-                process_obj = SRTF.Process(p.pid, p.arrival_time, p.burst_time, p.priority)
-            else:
-                process_obj = FCFS.Process(p.pid, p.arrival_time, p.burst_time, p.priority)
-            process_objects.append(process_obj)
-        return scheduler_func(process_objects)
-    elif scheduler_func == rr_schedule:
-        # Round Robin uses Process objects
-        process_objects = []
-        for p in processes:
-            process_obj = round_robin.Process(p.pid, p.arrival_time, p.burst_time, p.priority)
-            process_objects.append(process_obj)
-        return scheduler_func(process_objects, time_quantum=4.0)
-    else:
-        # Priority uses dictionaries
-        process_list = []
-        for p in processes:
-            process_dict = {
-                'pid': p.pid,
-                'arrival': p.arrival_time,
-                'burst': p.burst_time,
-                'priority': p.priority
-            }
-            process_list.append(process_dict)
-        return scheduler_func(process_list)
+def run_scheduler(scheduler_name, processes):
+    """Run a registered scheduler with the given processes; returns the FCFS/SRTF result structure."""
+    return registry.get(scheduler_name).run(processes)
 
-def calculate_metrics_from_dict(results, scheduler_name):
-    """
-    Calculate performance metrics from scheduler results.
-    Handles different output formats from different schedulers.
-    """
+def calculate_metrics_from_dict(results):
+    """Calculate performance metrics from scheduler results."""
     total_waiting_time = 0
     total_turnaround_time = 0
     total_response_time = 0
     
-    for process in results:
-        if scheduler_name in ['FCFS', 'SRTF', 'Round Robin']:
-            # These schedulers use consistent key names
-            total_waiting_time += process['Waiting Time']
-            total_turnaround_time += process['Turnaround Time']
-            if 'First Response' in process:
-                total_response_time += process['First Response'] - process['Arrival Time']
-            else:
-                total_response_time += process['Waiting Time']  # Approximation
-        elif scheduler_name == 'Priority':
-            # Priority scheduler uses different key names
-            total_waiting_time += process['waiting_time']
-            total_turnaround_time += process['turnaround_time']
-            if 'start_time' in process and process['start_time'] != -1:
-                total_response_time += process['start_time'] - process['arrival']
-            else:
-                total_response_time += process['waiting_time']  # Approximation
+    for process in results['processes']:
+        total_waiting_time += process['waiting']
+        total_turnaround_time += process['turnaround']
+        total_response_time += process['response'] - process['arrival']
     
-    n = len(results)
+    n = len(results['processes'])
     return {
         'avg_waiting_time': total_waiting_time / n,
         'avg_turnaround_time': total_turnaround_time / n,
@@ -128,21 +54,14 @@ def calculate_metrics_from_dict(results, scheduler_name):
     }
 
 def compare_algorithms(processes):
-    """Compare all scheduling algorithms with the same set of processes."""
-    schedulers = {
-        'FCFS': fcfs_schedule,
-        'SRTF': srtf_schedule,
-        'Priority': priority_schedule,
-        'Round Robin': rr_schedule
-    }
-    
+    """Compare all registered scheduling algorithms with the same set of processes."""
     results = {}
-    for name, scheduler in schedulers.items():
+    for name in registry.select():
         start_time = time.time()
-        scheduled_results = run_scheduler(scheduler, processes)
+        scheduled_results = run_scheduler(name, processes)
         execution_time = time.time() - start_time
         
-        metrics = calculate_metrics_from_dict(scheduled_results, name)
+        metrics = calculate_metrics_from_dict(scheduled_results)
         metrics['execution_time'] = execution_time
         results[name] = metrics
     
@@ -155,13 +74,9 @@ def plot_comparison():
         # Get the base directory path
         BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         
-        # Define result files with absolute paths
-        result_files = {
-            'FCFS': os.path.join(BASE_DIR, 'Schedulers', 'FCFS&SRTF', 'fcfs_results.txt'),
-            'SRTF': os.path.join(BASE_DIR, 'Schedulers', 'FCFS&SRTF', 'srtf_results.txt'),
-            'Priority': os.path.join(BASE_DIR, 'Schedulers', 'Priority&RoundRobin', 'priority_results.txt'),
-            'Round Robin': os.path.join(BASE_DIR, 'Schedulers', 'Priority&RoundRobin', 'round_robin_results.txt')
-        }
+        # The results file of every registered scheduler that has one, with absolute paths
+        result_files = {scheduler.name: os.path.join(BASE_DIR, 'Schedulers', scheduler.results_file)
+                        for scheduler in registry.schedulers() if scheduler.results_file}
         
         # Read results from all files
         results = {}
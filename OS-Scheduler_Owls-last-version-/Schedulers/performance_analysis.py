@@ -1,469 +1,441 @@
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import numpy as np
-import os
-import sys
-import importlib.util
-import time
-from datetime import datetime
-import logging
-
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-# Get the absolute path of the current script
-current_dir = os.path.dirname(os.path.abspath(__file__))
-base_dir = os.path.dirname(current_dir)
-
-# Add scheduler directories to Python path
-fcfs_srtf_dir = os.path.join(current_dir, "FCFS&SRTF")
-priority_rr_dir = os.path.join(current_dir, "Priority&RoundRobin")
-
-# Add base directory to Python path
-sys.path.append(base_dir)
-
-# Import the scheduling functions
-spec = importlib.util.spec_from_file_location("FCFS", os.path.join(fcfs_srtf_dir, "FCFS.py"))
-FCFS = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(FCFS)
-fcfs_schedule = FCFS.fcfs_scheduling
-
-spec = importlib.util.spec_from_file_location("SRTF", os.path.join(fcfs_srtf_dir, "SRTF.py"))
-SRTF = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(SRTF)
-srtf_schedule = SRTF.srtf_scheduling
-
-spec = importlib.util.spec_from_file_location("priority", os.path.join(priority_rr_dir, "priority.py"))
-priority = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(priority)
-priority_schedule = priority.highest_priority_first
-
-spec = importlib.util.spec_from_file_location("round_robin", os.path.join(priority_rr_dir, "round_robin.py"))
-round_robin = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(round_robin)
-rr_schedule = round_robin.round_robin_scheduling
-
-class Process:
-    def __init__(self, pid, arrival_time, burst_time, priority):
-        self.pid = pid
-        self.arrival_time = float(arrival_time)
-        self.burst_time = float(burst_time)
-        self.priority = int(priority)
-        self.remaining_time = float(burst_time)
-        self.completion_time = 0
-        self.turnaround_time = 0
-        self.waiting_time = 0
-        self.first_response = -1
-
-def read_processes(file_path):
-    """Read processes from the processes.txt file."""
-    processes = []
-    try:
-        logger.info(f"Reading processes from {file_path}")
-        with open(file_path, 'r') as file:
-            # Skip the header line
-            next(file)
-            # Read each process
-            for line in file:
-                # Split by whitespace and remove empty strings
-                data = [x for x in line.strip().split() if x]
-                if len(data) >= 4:
-                    pid = data[0]
-                    arrival_time = float(data[1])
-                    burst_time = float(data[2])
-                    priority = int(data[3])
-                    processes.append(Process(pid, arrival_time, burst_time, priority))
-                    logger.info(f"Read process: {pid}, arrival: {arrival_time}, burst: {burst_time}, priority: {priority}")
-    except FileNotFoundError:
-        logger.error(f"Error: File '{file_path}' not found.")
-        return []
-    except Exception as e:
-        logger.error(f"Error reading processes: {e}")
-        return []
-    return processes
-
-def run_scheduler(processes, scheduler_name):
-    """Run a specific scheduler and return its results."""
-    try:
-        logger.info(f"Running {scheduler_name} scheduler with {len(processes)} processes")
-        if scheduler_name == 'FCFS':
-            # Convert Process objects to dictionary format
-            fcfs_processes = []
-            for p in processes:
-                fcfs_processes.append({
-                    'pid': p.pid,
-                    'arrival': p.arrival_time,
-                    'burst': p.burst_time,
-                    'remaining': p.burst_time,
-                    'completion': 0,
-                    'waiting': 0,
-                    'turnaround': 0,
-                    'response': -1
-                })
-            return fcfs_schedule(fcfs_processes)
-        elif scheduler_name == 'SRTF':
-            # Convert Process objects to dictionary format
-            srtf_processes = []
-            for p in processes:
-                srtf_processes.append({
-                    'pid': p.pid,
-                    'arrival': p.arrival_time,
-                    'burst': p.burst_time,
-                    'remaining': p.burst_time,
-                    'completion': 0,
-                    'waiting': 0,
-                    'turnaround': 0,
-                    'response': -1
-                })
-            return srtf_schedule(srtf_processes)
-        elif scheduler_name == 'Priority':
-            # Convert processes to the format expected by priority_schedule
-            priority_processes = []
-            for p in processes:
-                priority_processes.append({
-                    'pid': p.pid,
-                    'arrival': p.arrival_time,
-                    'burst': p.burst_time,
-                    'priority': p.priority
-                })
-            results = priority_schedule(priority_processes)
-            # Convert results to match the format of other schedulers
-            formatted_results = []
-            for r in results:
-                formatted_results.append({
-                    'Process ID': r['pid'],
-                    'Arrival Time': r['arrival'],
-                    'Burst Time': r['burst'],
-                    'Completion Time': r['finish_time'],
-                    'Turnaround Time': r['turnaround_time'],
-                    'Waiting Time': r['waiting_time'],
-                    'First Response': r['start_time'] if 'start_time' in r else r['arrival']
-                })
-            return formatted_results
-        elif scheduler_name == 'Round Robin':
-            return rr_schedule(processes)
-        else:
-            logger.error(f"Unknown scheduler: {scheduler_name}")
-            return None
-    except Exception as e:
-        logger.error(f"Error running {scheduler_name}: {e}")
-        return None
-
-def calculate_metrics_from_dict(results):
-    """Calculate performance metrics from scheduler results."""
-    if not results:
-        logger.warning("No results to calculate metrics from")
-        return None
-        
-    total_waiting = 0
-    total_turnaround = 0
-    total_response = 0
-    count = 0
-    
-    # Handle FCFS and SRTF format
-    if isinstance(results, dict) and 'processes' in results and 'averages' in results:
-        return {
-            'avg_waiting': results['averages']['waiting'],
-            'avg_turnaround': results['averages']['turnaround'],
-            'avg_response': results['averages']['response']
-        }
-    
-    # Handle Priority and Round Robin format
-    for process in results:
-        if isinstance(process, dict):
-            total_waiting += process.get('Waiting Time', 0)
-            total_turnaround += process.get('Turnaround Time', 0)
-            total_response += process.get('First Response', 0)
-            count += 1
-    
-    if count == 0:
-        logger.warning("No valid processes found in results")
-        return None
-        
-    metrics = {
-        'avg_waiting': total_waiting / count,
-        'avg_turnaround': total_turnaround / count,
-        'avg_response': total_response / count
-    }
-    logger.info(f"Calculated metrics: {metrics}")
-    return metrics
-
-def compare_algorithms(processes):
-    """Compare all scheduling algorithms using the same set of processes."""
-    schedulers = ['FCFS', 'SRTF', 'Priority', 'Round Robin']
-    results = {}
-    
-    for scheduler in schedulers:
-        logger.info(f"\nRunning {scheduler} scheduler...")
-        scheduler_results = run_scheduler(processes, scheduler)
-        if scheduler_results:
-            metrics = calculate_metrics_from_dict(scheduler_results)
-            if metrics:
-                results[scheduler] = metrics
-                logger.info(f"{scheduler} Results:")
-                logger.info(f"Average Waiting Time: {metrics['avg_waiting']:.2f}")
-                logger.info(f"Average Turnaround Time: {metrics['avg_turnaround']:.2f}")
-                logger.info(f"Average Response Time: {metrics['avg_response']:.2f}")
-            else:
-                logger.warning(f"Could not calculate metrics for {scheduler}")
-        else:
-            logger.warning(f"No results returned for {scheduler}")
-    
-    return results
-
-def read_scheduler_results(file_path):
-    """Read and parse scheduler results from a file."""
-    try:
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-            
-        # Skip header and separator lines
-        process_lines = [line for line in lines if line.strip() and not line.startswith('Process ID') and not line.startswith('-')]
-        
-        # Find the line with average values
-        avg_line = None
-        for line in lines:
-            if 'Average' in line:
-                avg_line = line
-                break
-        
-        if not avg_line:
-            logger.error(f"No average values found in {file_path}")
-            return None
-            
-        # Extract average values
-        avg_waiting = float(avg_line.split('Average Waiting Time:')[1].split()[0])
-        avg_turnaround = float(avg_line.split('Average Turnaround Time:')[1].split()[0])
-        
-        results = {
-            'process_count': len(process_lines),
-            'avg_waiting': avg_waiting,
-            'avg_turnaround': avg_turnaround
-        }
-        
-        return results
-    except Exception as e:
-        logger.error(f"Error reading results from {file_path}: {e}")
-        return None
-
-def plot_comparison():
-    """Create a real-time comparison of scheduling algorithms."""
-    # Use Agg backend to avoid threading issues
-    matplotlib.use('Agg')
-    
-    # Delete old comparison plots
-    static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
-    os.makedirs(static_dir, exist_ok=True)
-    for file in os.listdir(static_dir):
-        if file.startswith('scheduling_comparison'):
-            try:
-                os.remove(os.path.join(static_dir, file))
-            except:
-                pass
-    
-    # Get the current directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Read results from all scheduler files using absolute paths
-    fcfs_results = read_scheduler_results(os.path.join(current_dir, 'FCFS&SRTF', 'fcfs_results.txt'))
-    srtf_results = read_scheduler_results(os.path.join(current_dir, 'FCFS&SRTF', 'srtf_results.txt'))
-    priority_results = read_scheduler_results(os.path.join(current_dir, 'Priority&RoundRobin', 'priority_results.txt'))
-    round_robin_results = read_scheduler_results(os.path.join(current_dir, 'Priority&RoundRobin', 'round_robin_results.txt'))
-
-    # Extract metrics
-    metrics = {
-        'FCFS': fcfs_results,
-        'SRTF': srtf_results,
-        'Priority': priority_results,
-        'Round Robin': round_robin_results
-    }
-
-    # Create figure and subplots
-    fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 5))
-    fig.suptitle('Scheduling Algorithm Comparison', fontsize=16, y=1.05)
-
-    # Define colors for each algorithm
-    colors = ['#3498db', '#2ecc71', '#e74c3c', '#f1c40f']
-
-    # Prepare data
-    algorithms = list(metrics.keys())
-    x = np.arange(len(algorithms))
-    width = 0.35
-
-    # Plot waiting times
-    waiting_times = [metrics[algo]['avg_waiting'] for algo in algorithms]
-    turnaround_times = [metrics[algo]['avg_turnaround'] for algo in algorithms]
-    response_times = [metrics[algo].get('avg_response', 0) for algo in algorithms]
-
-    # Plot Average Waiting Time
-    bars1 = ax1.bar(x, waiting_times, width, color=colors)
-    ax1.set_title('Average Waiting Time')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(algorithms, rotation=45)
-    ax1.grid(True, linestyle='--', alpha=0.7)
-    # Add values on top of bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.2f}', ha='center', va='bottom')
-
-    # Plot Average Turnaround Time
-    bars2 = ax2.bar(x, turnaround_times, width, color=colors)
-    ax2.set_title('Average Turnaround Time')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(algorithms, rotation=45)
-    ax2.grid(True, linestyle='--', alpha=0.7)
-    # Add values on top of bars
-    for bar in bars2:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.2f}', ha='center', va='bottom')
-
-    # Plot Average Response Time
-    bars3 = ax3.bar(x, response_times, width, color=colors)
-    ax3.set_title('Average Response Time')
-    ax3.set_xticks(x)
-    ax3.set_xticklabels(algorithms, rotation=45)
-    ax3.grid(True, linestyle='--', alpha=0.7)
-    # Add values on top of bars
-    for bar in bars3:
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.2f}', ha='center', va='bottom')
-
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the plot with fixed filename
-    plot_path = os.path.join(static_dir, 'scheduling_comparison.png')
-    plt.savefig(plot_path, bbox_inches='tight', dpi=100)
-    plt.close('all')  # Close all figures to prevent memory leaks
-    
-    logger.info(f"Comparison plot saved to: {plot_path}")
-    return plot_path
-
-def analyze_performance():
-    """
-    Main function to analyze performance of all schedulers.
-    """
-    try:
-        # Create static directory if it doesn't exist
-        static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
-        os.makedirs(static_dir, exist_ok=True)
-        
-        # Delete old comparison plots
-        for file in os.listdir(static_dir):
-            if file.startswith('scheduling_comparison'):
-                try:
-                    os.remove(os.path.join(static_dir, file))
-                except:
-                    pass
-        
-        # Generate comparison plot with fixed filename
-        plot_path = os.path.join('static', 'scheduling_comparison.png')
-        if not plot_path:
-            logger.error("Failed to generate comparison plot")
-            return None, None
-            
-        return None, plot_path
-        
-    except Exception as e:
-        logger.error(f"Error in performance analysis: {e}")
-        return None, None
-
-def main():
-    # Get the base directory path
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Path to the processes.txt file
-    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
-    
-    # Read processes from file
-    processes = read_processes(file_path)
-    if not processes:
-        logger.error("No processes found in the input file")
-        return
-    
-    # Compare algorithms and get results
-    results = compare_algorithms(processes)
-    if not results:
-        logger.error("Failed to compare algorithms")
-        return
-    
-    # Create comparison plot
-    logger.info("Creating comparison plot")
-    try:
-        # Create static directory if it doesn't exist
-        static_dir = os.path.join(base_dir, "static")
-        os.makedirs(static_dir, exist_ok=True)
-        
-        # Delete old comparison plots
-        for file in os.listdir(static_dir):
-            if file.startswith('scheduling_comparison'):
-                try:
-                    os.remove(os.path.join(static_dir, file))
-                except:
-                    pass
-        
-        # Use fixed filename for the plot
-        plot_path = os.path.join(static_dir, "scheduling_comparison.png")
-        
-        # Create the plot
-        plt.figure(figsize=(12, 5))
-        
-        # Create two subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-        fig.suptitle('Scheduling Algorithm Comparison', fontsize=16, y=1.05)
-        
-        # Define colors for each algorithm
-        colors = ['#3498db', '#2ecc71', '#e74c3c', '#f1c40f']
-        
-        # Plot data
-        algorithms = list(results.keys())
-        x = np.arange(len(algorithms))
-        width = 0.35
-        
-        # Get metrics
-        waiting_times = [results[algo]['avg_waiting'] for algo in algorithms]
-        turnaround_times = [results[algo]['avg_turnaround'] for algo in algorithms]
-        
-        # Plot Average Waiting Time
-        bars1 = ax1.bar(x, waiting_times, width, color=colors)
-        ax1.set_title('Average Waiting Time')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(algorithms, rotation=45)
-        ax1.grid(True, linestyle='--', alpha=0.7)
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}', ha='center', va='bottom')
-        
-        # Plot Average Turnaround Time
-        bars2 = ax2.bar(x, turnaround_times, width, color=colors)
-        ax2.set_title('Average Turnaround Time')
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(algorithms, rotation=45)
-        ax2.grid(True, linestyle='--', alpha=0.7)
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}', ha='center', va='bottom')
-        
-        # Adjust layout
-        plt.tight_layout()
-        
-        # Save the plot
-        plt.savefig(plot_path, bbox_inches='tight', dpi=100)
-        plt.close('all')
-        
-        logger.info(f"Comparison plot saved to: {plot_path}")
-        return plot_path
-        
-    except Exception as e:
-        logger.error(f"Error creating comparison plot: {e}")
-        return None
-
-if __name__ == "__main__":
+import numpy as np
+import os
+import sys
+import time
+from datetime import datetime
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+
+# Add base directory to Python path
+sys.path.append(base_dir)
+
+from Schedulers.artifacts import default_store
+
+# Shared metric and workload helpers (the optional Bursts and Deadline columns)
+from Schedulers import metrics as metrics_lib
+from Schedulers import workload
+# The schedulers, their options and their uniform run function
+from Schedulers import registry
+
+class Process:
+    def __init__(self, pid, arrival_time, burst_time, priority, bursts=None, deadline=None):
+        self.pid = pid
+        self.arrival_time = float(arrival_time)
+        self.burst_time = float(burst_time)
+        self.priority = int(priority)
+        self.remaining_time = float(burst_time)
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+        self.first_response = -1
+        # Optional CPU/I/O cycle (CPU, I/O, CPU, ...); None for a single CPU burst
+        self.bursts = bursts
+        # Optional relative deadline (must complete by arrival_time + deadline)
+        self.deadline = deadline
+
+def read_processes(file_path):
+    """Read processes from the processes.txt file."""
+    processes = []
+    try:
+        logger.info(f"Reading processes from {file_path}")
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            # Read each process
+            for line in file:
+                # Split by whitespace and remove empty strings
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    pid = data[0]
+                    arrival_time = float(data[1])
+                    burst_time = float(data[2])
+                    priority = int(data[3])
+                    bursts = workload.parse_bursts(data[4]) if len(data) >= 5 else None
+                    deadline = workload.parse_deadline(data[5]) if len(data) >= 6 else None
+                    processes.append(Process(pid, arrival_time, burst_time, priority, bursts, deadline))
+                    logger.info(f"Read process: {pid}, arrival: {arrival_time}, burst: {burst_time}, priority: {priority}")
+    except FileNotFoundError:
+        logger.error(f"Error: File '{file_path}' not found.")
+        return []
+    except Exception as e:
+        logger.error(f"Error reading processes: {e}")
+        return []
+    return processes
+
+def run_scheduler(processes, scheduler_name, time_quantum=4.0, verbose=True, context_switch=0.0, cache_penalty=0.0,
+                  aging=0.0, prediction=None):
+    """
+    Run a specific scheduler and return its results (verbose=False runs it quietly).
+    Every scheduler returns the FCFS/SRTF structure: processes, averages,
+    execution_history and system metrics.
+    context_switch and cache_penalty set the dispatch overhead of the preemptive
+    schedulers (SRTF, Priority, Round Robin, MLFQ, CFS, Lottery, Stride, EDF); SJF and
+    Priority (NP) never preempt and only pay context_switch.
+    Lottery and Stride use time_quantum as their scheduling quantum.
+    aging is the Priority scheduler's priority improvement per unit of waiting time.
+    prediction switches SJF and SRTF to predicted burst lengths: a dict of
+    predictive_scheduling options (alpha, initial_tau, bursts_per_process, ...);
+    their results then also carry the prediction error under 'prediction'.
+    When any process has a deadline, the results of every scheduler also carry the
+    deadline miss ratio and lateness under 'deadlines'.
+    """
+    result = _run_scheduler(processes, scheduler_name, time_quantum=time_quantum, verbose=verbose,
+                            context_switch=context_switch, cache_penalty=cache_penalty, aging=aging,
+                            prediction=prediction)
+    deadlines = {p.pid: p.arrival_time + p.deadline for p in processes if getattr(p, 'deadline', None) is not None}
+    if result and deadlines:
+        result['deadlines'] = metrics_lib.deadline_metrics(result['processes'], deadlines)
+    return result
+
+def _run_scheduler(processes, scheduler_name, time_quantum=4.0, verbose=True, context_switch=0.0, cache_penalty=0.0,
+                   aging=0.0, prediction=None):
+    """Run one registered scheduler; it takes the options it declares and ignores the others (see run_scheduler)."""
+    try:
+        scheduler = registry.get(scheduler_name)
+    except KeyError:
+        logger.error(f"Unknown scheduler: {scheduler_name}")
+        return None
+    try:
+        logger.info(f"Running {scheduler_name} scheduler with {len(processes)} processes")
+        return scheduler.run(processes, verbose=verbose, time_quantum=time_quantum, context_switch=context_switch,
+                             cache_penalty=cache_penalty, aging=aging, prediction=prediction)
+    except Exception as e:
+        logger.error(f"Error running {scheduler_name}: {e}")
+        return None
+
+def calculate_metrics_from_dict(results):
+    """Calculate average and tail (p50/p90/p95/p99/max) metrics from scheduler results."""
+    if not results:
+        logger.warning("No results to calculate metrics from")
+        return None
+        
+    waiting = []
+    turnaround = []
+    response = []
+    
+    # Handle FCFS and SRTF format
+    if isinstance(results, dict) and 'processes' in results and 'averages' in results:
+        for process in results['processes']:
+            waiting.append(process['waiting'])
+            turnaround.append(process['turnaround'])
+            response.append(process['response'] - process['arrival'])
+    else:
+        # Handle Priority and Round Robin format
+        for process in results:
+            if isinstance(process, dict):
+                waiting.append(process.get('Waiting Time', 0))
+                turnaround.append(process.get('Turnaround Time', 0))
+                # First Response is an absolute time, response time is measured from arrival
+                response.append(process.get('First Response', 0) - process.get('Arrival Time', 0))
+    
+    count = len(waiting)
+    if count == 0:
+        logger.warning("No valid processes found in results")
+        return None
+        
+    metrics = {
+        'avg_waiting': sum(waiting) / count,
+        'avg_turnaround': sum(turnaround) / count,
+        'avg_response': sum(response) / count
+    }
+    # Tail latency, flattened as p95_waiting, max_response, ...
+    for name, values in (('waiting', waiting), ('response', response), ('turnaround', turnaround)):
+        metrics.update(metrics_lib.flatten_tail(name, metrics_lib.tail_summary(values)))
+    # Throughput, utilization, context switches, ... when the trace is available
+    if isinstance(results, dict) and results.get('execution_history'):
+        metrics.update(results.get('system') or metrics_lib.system_metrics(results['execution_history']))
+    # Burst prediction accuracy of SJF/SRTF in predictive mode
+    if isinstance(results, dict) and results.get('prediction'):
+        for key in ('mae', 'mape', 'bias'):
+            metrics[f'prediction_{key}'] = results['prediction'][key]
+    # Deadline miss ratio and lateness when the workload has deadlines
+    if isinstance(results, dict) and results.get('deadlines'):
+        metrics.update(results['deadlines'])
+    logger.info(f"Calculated metrics: {metrics}")
+    return metrics
+
+def compare_algorithms(processes, time_quantum=4.0, verbose=True, context_switch=0.0, cache_penalty=0.0, aging=0.0,
+                       prediction=None, schedulers=None):
+    """
+    Compare scheduling algorithms using the same set of processes.
+    schedulers selects them by name or slug (see registry.select); the default is every registered one.
+    """
+    schedulers = registry.select(schedulers)
+    results = {}
+    
+    for scheduler in schedulers:
+        logger.info(f"\nRunning {scheduler} scheduler...")
+        scheduler_results = run_scheduler(processes, scheduler, time_quantum=time_quantum, verbose=verbose,
+                                          context_switch=context_switch, cache_penalty=cache_penalty, aging=aging,
+                                          prediction=prediction)
+        if scheduler_results:
+            metrics = calculate_metrics_from_dict(scheduler_results)
+            if metrics:
+                results[scheduler] = metrics
+                logger.info(f"{scheduler} Results:")
+                logger.info(f"Average Waiting Time: {metrics['avg_waiting']:.2f}")
+                logger.info(f"Average Turnaround Time: {metrics['avg_turnaround']:.2f}")
+                logger.info(f"Average Response Time: {metrics['avg_response']:.2f}")
+                logger.info(f"P95 / Max Waiting Time: {metrics['p95_waiting']:.2f} / {metrics['max_waiting']:.2f}")
+                if 'throughput' in metrics:
+                    logger.info(f"Throughput: {metrics['throughput']:.3f}/unit, CPU Utilization: {metrics['utilization']:.1%}, "
+                                f"Context Switches: {metrics['context_switches']}, Preemptions: {metrics['preemptions']}, "
+                                f"Switch Overhead: {metrics['switch_time']:.2f}")
+                if 'prediction_mae' in metrics:
+                    logger.info(f"Burst Prediction MAE: {metrics['prediction_mae']:.2f} "
+                                f"(MAPE {metrics['prediction_mape']:.1%}, bias {metrics['prediction_bias']:+.2f})")
+                if 'deadline_miss_ratio' in metrics:
+                    logger.info(f"Deadline Misses: {metrics['deadline_misses']} ({metrics['deadline_miss_ratio']:.1%}), "
+                                f"Avg / Max Lateness: {metrics['avg_lateness']:.2f} / {metrics['max_lateness']:.2f}")
+            else:
+                logger.warning(f"Could not calculate metrics for {scheduler}")
+        else:
+            logger.warning(f"No results returned for {scheduler}")
+    
+    return results
+
+def read_scheduler_results(file_path):
+    """Read and parse scheduler results from a file."""
+    try:
+        with open(file_path, 'r') as f:
+            lines = f.readlines()
+            
+        # Skip header and separator lines
+        process_lines = [line for line in lines if line.strip() and not line.startswith('Process ID') and not line.startswith('-')]
+        
+        # Find the line with average values
+        avg_line = None
+        for line in lines:
+            if 'Average' in line:
+                avg_line = line
+                break
+        
+        if not avg_line:
+            logger.error(f"No average values found in {file_path}")
+            return None
+            
+        # Extract average values
+        avg_waiting = float(avg_line.split('Average Waiting Time:')[1].split()[0])
+        avg_turnaround = float(avg_line.split('Average Turnaround Time:')[1].split()[0])
+        
+        results = {
+            'process_count': len(process_lines),
+            'avg_waiting': avg_waiting,
+            'avg_turnaround': avg_turnaround
+        }
+        
+        return results
+    except Exception as e:
+        logger.error(f"Error reading results from {file_path}: {e}")
+        return None
+
+def plot_comparison():
+    """Create a real-time comparison of scheduling algorithms."""
+    # Use Agg backend to avoid threading issues
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    # Get the current directory
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # Read the results file of every registered scheduler that has one, using absolute paths
+    metrics = {}
+    for scheduler in registry.schedulers():
+        if scheduler.results_file:
+            results = read_scheduler_results(os.path.join(current_dir, scheduler.results_file))
+            if results:
+                metrics[scheduler.name] = results
+
+    # Create figure and subplots
+    fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 5))
+    fig.suptitle('Scheduling Algorithm Comparison', fontsize=16, y=1.05)
+
+    # Define colors for each algorithm
+    colors = ['#3498db', '#2ecc71', '#e74c3c', '#f1c40f', '#6f42c1', '#fd7e14', '#20c997', '#8d6e63',
+              '#e83e8c', '#17a2b8', '#795548']
+
+    # Prepare data
+    algorithms = list(metrics.keys())
+    x = np.arange(len(algorithms))
+    width = 0.35
+
+    # Plot waiting times
+    waiting_times = [metrics[algo]['avg_waiting'] for algo in algorithms]
+    turnaround_times = [metrics[algo]['avg_turnaround'] for algo in algorithms]
+    response_times = [metrics[algo].get('avg_response', 0) for algo in algorithms]
+
+    # Plot Average Waiting Time
+    bars1 = ax1.bar(x, waiting_times, width, color=colors)
+    ax1.set_title('Average Waiting Time')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(algorithms, rotation=45)
+    ax1.grid(True, linestyle='--', alpha=0.7)
+    # Add values on top of bars
+    for bar in bars1:
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.2f}', ha='center', va='bottom')
+
+    # Plot Average Turnaround Time
+    bars2 = ax2.bar(x, turnaround_times, width, color=colors)
+    ax2.set_title('Average Turnaround Time')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(algorithms, rotation=45)
+    ax2.grid(True, linestyle='--', alpha=0.7)
+    # Add values on top of bars
+    for bar in bars2:
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.2f}', ha='center', va='bottom')
+
+    # Plot Average Response Time
+    bars3 = ax3.bar(x, response_times, width, color=colors)
+    ax3.set_title('Average Response Time')
+    ax3.set_xticks(x)
+    ax3.set_xticklabels(algorithms, rotation=45)
+    ax3.grid(True, linestyle='--', alpha=0.7)
+    # Add values on top of bars
+    for bar in bars3:
+        height = bar.get_height()
+        ax3.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.2f}', ha='center', va='bottom')
+
+    # Adjust layout
+    plt.tight_layout()
+    
+    # Save the plot into the artifact store, overwriting the previous one
+    store = default_store()
+    plot_path = store.path('scheduling_comparison.png')
+    plt.savefig(plot_path, bbox_inches='tight', dpi=100)
+    plt.close('all')  # Close all figures to prevent memory leaks
+    store.add('scheduling_comparison.png')
+    
+    logger.info(f"Comparison plot saved to: {plot_path}")
+    return plot_path
+
+def analyze_performance():
+    """
+    Main function to analyze performance of all schedulers.
+    """
+    try:
+        # Generate comparison plot with fixed filename
+        plot_path = default_store().path('scheduling_comparison.png')
+        if not plot_path:
+            logger.error("Failed to generate comparison plot")
+            return None, None
+            
+        return None, plot_path
+        
+    except Exception as e:
+        logger.error(f"Error in performance analysis: {e}")
+        return None, None
+
+def main():
+    # Get the base directory path
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    # Path to the processes.txt file
+    file_path = os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+    
+    # Read processes from file
+    processes = read_processes(file_path)
+    if not processes:
+        logger.error("No processes found in the input file")
+        return
+    
+    # Compare algorithms and get results
+    results = compare_algorithms(processes)
+    if not results:
+        logger.error("Failed to compare algorithms")
+        return
+    
+    # Create comparison plot
+    logger.info("Creating comparison plot")
+    try:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+        
+        # Use fixed filename for the plot, in the artifact store
+        store = default_store()
+        plot_path = store.path("scheduling_comparison.png")
+        
+        # Create the plot
+        plt.figure(figsize=(12, 5))
+        
+        # Create three subplots
+        fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(18, 5))
+        fig.suptitle('Scheduling Algorithm Comparison', fontsize=16, y=1.05)
+        
+        # Define colors for each algorithm
+        colors = ['#3498db', '#2ecc71', '#e74c3c', '#f1c40f', '#6f42c1', '#fd7e14', '#20c997', '#8d6e63',
+                  '#e83e8c', '#17a2b8', '#795548']
+        
+        # Plot data
+        algorithms = list(results.keys())
+        x = np.arange(len(algorithms))
+        width = 0.35
+        
+        # Get metrics
+        waiting_times = [results[algo]['avg_waiting'] for algo in algorithms]
+        turnaround_times = [results[algo]['avg_turnaround'] for algo in algorithms]
+        
+        # Plot Average Waiting Time
+        bars1 = ax1.bar(x, waiting_times, width, color=colors)
+        ax1.set_title('Average Waiting Time')
+        ax1.set_xticks(x)
+        ax1.set_xticklabels(algorithms, rotation=45)
+        ax1.grid(True, linestyle='--', alpha=0.7)
+        for bar in bars1:
+            height = bar.get_height()
+            ax1.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{height:.2f}', ha='center', va='bottom')
+        
+        # Plot Average Turnaround Time
+        bars2 = ax2.bar(x, turnaround_times, width, color=colors)
+        ax2.set_title('Average Turnaround Time')
+        ax2.set_xticks(x)
+        ax2.set_xticklabels(algorithms, rotation=45)
+        ax2.grid(True, linestyle='--', alpha=0.7)
+        for bar in bars2:
+            height = bar.get_height()
+            ax2.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{height:.2f}', ha='center', va='bottom')
+        
+        # Plot tail waiting time (averages hide starvation of long jobs)
+        tail_keys = ['p50_waiting', 'p95_waiting', 'p99_waiting', 'max_waiting']
+        tail_width = 0.8 / len(tail_keys)
+        for i, key in enumerate(tail_keys):
+            ax3.bar(x + (i - (len(tail_keys) - 1) / 2) * tail_width,
+                    [results[algo][key] for algo in algorithms], tail_width, label=key.split('_')[0])
+        ax3.set_title('Waiting Time Percentiles')
+        ax3.set_xticks(x)
+        ax3.set_xticklabels(algorithms, rotation=45)
+        ax3.grid(True, linestyle='--', alpha=0.7)
+        ax3.legend()
+        
+        # Adjust layout
+        plt.tight_layout()
+        
+        # Save the plot
+        plt.savefig(plot_path, bbox_inches='tight', dpi=100)
+        plt.close('all')
+        store.add("scheduling_comparison.png")
+        
+        logger.info(f"Comparison plot saved to: {plot_path}")
+        return plot_path
+        
+    except Exception as e:
+        logger.error(f"Error creating comparison plot: {e}")
+        return None
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,165 @@
+import os
+import io
+import sys
+import json
+import time
+import atexit
+import pstats
+import cProfile
+import logging
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+# SCHEDULER_PROFILE=1 turns the phase timers on for a whole process (inherited by the
+# scheduler subprocesses); SCHEDULER_PROFILE_OUT names a JSON file the report is written to at exit
+ENV_ENABLE = 'SCHEDULER_PROFILE'
+ENV_OUTPUT = 'SCHEDULER_PROFILE_OUT'
+
+# Returned by phase() while profiling is off, so a disabled timer costs one lookup and a no-op with block
+_DISABLED = nullcontext()
+
+class PhaseTimer:
+    """
+    Wall-clock time and call count per named phase, plus free-form counters.
+    - Phases nest: a phase opened inside 'schedule' is recorded as 'schedule/sort', and
+      the outer phase's time includes it
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+        self.stack = []
+
+    def add(self, name, seconds):
+        stats = self.phases.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+    def merge(self, report, prefix=''):
+        """Add the phases and counters of another report (e.g. from a subprocess)."""
+        for name, stats in report.get('phases', {}).items():
+            mine = self.phases.setdefault(prefix + name, [0, 0.0, 0.0])
+            mine[0] += stats['calls']
+            mine[1] += stats['total']
+            mine[2] = max(mine[2], stats['max'])
+        for name, value in report.get('counters', {}).items():
+            self.counters[prefix + name] = self.counters.get(prefix + name, 0) + value
+
+    def report(self):
+        """JSON-friendly summary, phases in the order they were first entered."""
+        return {
+            'phases': {name: {'calls': calls, 'total': total, 'max': longest}
+                       for name, (calls, total, longest) in self.phases.items()},
+            'counters': dict(self.counters)
+        }
+
+class _Phase:
+    __slots__ = ('timer', 'name', 'start')
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        stack = self.timer.stack
+        stack.append(self.name)
+        self.name = '/'.join(stack)
+        # Reserve the slot on entry so a parent is listed before its nested phases
+        self.timer.phases.setdefault(self.name, [0, 0.0, 0.0])
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.add(self.name, time.perf_counter() - self.start)
+        self.timer.stack.pop()
+        return False
+
+_current = ContextVar('scheduler_phase_timer', default=None)
+
+def phase(name):
+    """
+    Time a block as one phase of the current run:
+
+        with phase('parse'):
+            processes = read_processes(path)
+
+    Does nothing unless profiling is enabled or a collect() block is active.
+    """
+    timer = _current.get()
+    if timer is None:
+        return _DISABLED
+    return _Phase(timer, name)
+
+def count(name, n=1):
+    """Add n to a counter of the current run (ignored while profiling is off)."""
+    timer = _current.get()
+    if timer is not None:
+        timer.counters[name] = timer.counters.get(name, 0) + n
+
+def enabled():
+    return _current.get() is not None
+
+@contextmanager
+def collect():
+    """
+    Collect the phases of one run separately from anything else, e.g. one web request:
+
+        with collect() as timer:
+            ...
+        timer.report()
+    """
+    timer = PhaseTimer()
+    token = _current.set(timer)
+    try:
+        yield timer
+    finally:
+        _current.reset(token)
+
+def format_report(report):
+    """Text table of a report, nested phases under their parent."""
+    lines = [f"{'Phase':<28} {'Calls':>6} {'Total (ms)':>11} {'Max (ms)':>10}"]
+    for name, stats in report['phases'].items():
+        lines.append(f"{name:<28} {stats['calls']:>6} {stats['total'] * 1000:>11.2f} {stats['max'] * 1000:>10.2f}")
+    for name, value in report['counters'].items():
+        lines.append(f"{name:<28} {value:>6}")
+    return '\n'.join(lines)
+
+def pstats_summary(stats_file, limit=20, sort='cumulative'):
+    """The top functions of a cProfile dump as text (what `python -m pstats` would print)."""
+    stream = io.StringIO()
+    stats = pstats.Stats(stats_file, stream=stream)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+@contextmanager
+def cprofile(stats_file):
+    """Run the block under cProfile and dump the pstats data to stats_file."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        os.makedirs(os.path.dirname(os.path.abspath(stats_file)), exist_ok=True)
+        profiler.dump_stats(stats_file)
+        logger.info(f"cProfile data written to {stats_file}")
+
+def _report_at_exit(timer):
+    report = timer.report()
+    if not report['phases'] and not report['counters']:
+        return
+    output = os.environ.get(ENV_OUTPUT)
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f)
+    else:
+        # The scheduler scripts do not configure logging, so report on stderr
+        print("Phase timings:\n" + format_report(report), file=sys.stderr)
+
+if os.environ.get(ENV_ENABLE, '') not in ('', '0'):
+    _process_timer = PhaseTimer()
+    _current.set(_process_timer)
+    atexit.register(_report_at_exit, _process_timer)
@@ -0,0 +1,167 @@
+import numpy as np
+import os
+import json
+import sys
+import argparse
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+sys.path.append(base_dir)
+
+# Import the quantum sweep helpers and the Round Robin scheduler
+from Schedulers import quantum_sweep
+from Schedulers import round_robin
+
+# Objective names mapped to the metric they minimize
+OBJECTIVES = {
+    'waiting': 'avg_waiting',
+    'turnaround': 'avg_turnaround',
+    'response': 'avg_response',
+    'p95_response': 'p95_response'
+}
+
+# Golden ratio used to shrink the bracket
+INV_PHI = (np.sqrt(5) - 1) / 2
+
+def make_objective(objective='waiting', weights=None):
+    """
+    Build a function that turns sweep metrics into a single value to minimize.
+    - objective picks one of OBJECTIVES
+    - weights, e.g. {'waiting': 1.0, 'p95_response': 0.5}, combines several objectives
+    """
+    if weights:
+        unknown = [name for name in weights if name not in OBJECTIVES]
+        if unknown:
+            raise ValueError(f"Unknown objective(s): {', '.join(unknown)}")
+        return lambda metrics: sum(w * metrics[OBJECTIVES[name]] for name, w in weights.items())
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}")
+    return lambda metrics: metrics[OBJECTIVES[objective]]
+
+def optimize_quantum(workloads, objective='waiting', weights=None, q_min=0.5, q_max=None,
+                     coarse_points=8, tolerance=0.05, context_switch=0.0, max_simulations=1000):
+    """
+    Find the Round Robin time quantum that minimizes an objective.
+    - workloads is a single workload or a list of workloads sampled from a distribution;
+      the objective is averaged across them
+    - A coarse log-spaced scan brackets the best region, then a golden-section search
+      narrows the bracket down to the tolerance
+    - Every quantum is simulated at most once (results are memoized)
+    - At most max_simulations scheduler runs are made; when the budget runs out, even
+      during the coarse scan, the best quantum found so far is returned
+    - Returns the chosen quantum, its objective value, the sampled curve and the
+      number of scheduler runs used
+    """
+    if not workloads:
+        return None
+
+    first = workloads[0]
+    if not isinstance(first, (list, tuple)) or (first and isinstance(first[0], (str, int, float))):
+        workloads = [workloads]
+    workloads = [quantum_sweep._as_rows(w) for w in workloads if w]
+    score = make_objective(objective, weights)
+
+    # Past the longest burst every process finishes in one quantum, so the curve is flat
+    if q_max is None:
+        q_max = max(row[2] for w in workloads for row in w)
+    if q_min <= 0 or q_max <= q_min:
+        raise ValueError("Quantum bounds must satisfy 0 < q_min < q_max.")
+    if max_simulations < len(workloads):
+        raise ValueError(f"max_simulations must allow one quantum per workload ({len(workloads)} runs).")
+
+    cache = {}
+    simulations = 0
+
+    def evaluate(quantum):
+        nonlocal simulations
+        key = round(float(quantum), 6)
+        if key in cache:
+            return cache[key]
+        if simulations + len(workloads) > max_simulations:
+            raise RuntimeError(f"Simulation budget of {max_simulations} runs exhausted")
+        totals = []
+        for rows in workloads:
+            processes = [round_robin.Process(*row) for row in rows]
+            results = round_robin.round_robin_scheduling(processes, time_quantum=key,
+                                                         context_switch=context_switch, verbose=False)
+            totals.append(score(quantum_sweep.summarize_rr_results(results)))
+            simulations += 1
+        cache[key] = float(np.mean(totals))
+        return cache[key]
+
+    try:
+        # Coarse scan: bracket the best grid point by its neighbours
+        grid = np.geomspace(q_min, q_max, max(3, coarse_points))
+        values = [evaluate(q) for q in grid]
+        best = int(np.argmin(values))
+        low = grid[max(best - 1, 0)]
+        high = grid[min(best + 1, len(grid) - 1)]
+
+        # Golden-section search inside the bracket
+        c = high - INV_PHI * (high - low)
+        d = low + INV_PHI * (high - low)
+        while high - low > tolerance:
+            if evaluate(c) <= evaluate(d):
+                high = d
+            else:
+                low = c
+            c = high - INV_PHI * (high - low)
+            d = low + INV_PHI * (high - low)
+    except RuntimeError as e:
+        logger.warning(f"{e}, returning the best quantum found so far")
+
+    best_quantum = min(cache, key=lambda q: (cache[q], q))
+    curve = sorted(cache.items())
+    logger.info(f"Best quantum {best_quantum:.3f} (objective {cache[best_quantum]:.3f}) "
+                f"after {simulations} simulations")
+
+    return {
+        'quantum': best_quantum,
+        'objective': cache[best_quantum],
+        'objective_name': objective if not weights else 'weighted',
+        'curve': {'quanta': [q for q, _ in curve], 'values': [v for _, v in curve]},
+        'simulations': simulations
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the Round Robin time quantum that minimizes an objective.")
+    parser.add_argument('workloads', nargs='*',
+                        help="processes.txt style files (default: ProcessGeneratorModule/processes.txt)")
+    parser.add_argument('--objective', choices=sorted(OBJECTIVES), default='waiting')
+    parser.add_argument('--weight', nargs=2, action='append', metavar=('OBJECTIVE', 'WEIGHT'),
+                        help="combine objectives, e.g. --weight waiting 1 --weight p95_response 0.5")
+    parser.add_argument('--min', type=float, default=0.5, help="smallest quantum to consider")
+    parser.add_argument('--max', type=float, default=None, help="largest quantum to consider")
+    parser.add_argument('--tolerance', type=float, default=0.05)
+    parser.add_argument('--context-switch', type=float, default=0.0)
+    parser.add_argument('--json', help="write the result to this JSON file")
+    args = parser.parse_args()
+
+    files = args.workloads or [os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")]
+    workloads = [w for w in (quantum_sweep.load_workload(f) for f in files) if w]
+    if not workloads:
+        logger.error("No processes found in the input file(s)")
+        return None
+
+    weights = {name: float(w) for name, w in args.weight} if args.weight else None
+    result = optimize_quantum(workloads, objective=args.objective, weights=weights, q_min=args.min,
+                              q_max=args.max, tolerance=args.tolerance, context_switch=args.context_switch)
+
+    print(f"Best time quantum: {result['quantum']:.3f}")
+    print(f"Objective ({result['objective_name']}): {result['objective']:.3f}")
+    print(f"Simulations used: {result['simulations']}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+        logger.info(f"Optimizer result written to {args.json}")
+    return result
+
+if __name__ == "__main__":
+    main()
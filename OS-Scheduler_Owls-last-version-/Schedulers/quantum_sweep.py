@@ -0,0 +1,208 @@
+import numpy as np
+import os
+import sys
+import json
+import argparse
+import itertools
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+sys.path.append(base_dir)
+
+# Import the Round Robin scheduler
+from Schedulers import round_robin
+rr_schedule = round_robin.round_robin_scheduling
+
+METRICS = ['avg_waiting', 'avg_turnaround', 'avg_response', 'p95_response', 'makespan']
+
+# Workloads shared with the worker processes, set once per worker by _init_worker
+_WORKLOADS = None
+
+def load_workload(file_path):
+    """Parse a processes.txt file once into plain (pid, arrival, burst, priority) rows."""
+    processes = round_robin.read_processes(file_path)
+    return [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+def _as_rows(workload):
+    """Accept Process objects or (pid, arrival, burst, priority) rows and return rows."""
+    rows = []
+    for p in workload:
+        if isinstance(p, (tuple, list)):
+            rows.append(tuple(p))
+        else:
+            rows.append((p.pid, p.arrival_time, p.burst_time, p.priority))
+    return rows
+
+def _init_worker(workloads):
+    """Install the parsed workloads in this process so tasks only carry indices."""
+    global _WORKLOADS
+    _WORKLOADS = workloads
+
+def summarize_rr_results(results):
+    """Reduce Round Robin per-process results to the metrics tracked by the sweep."""
+    n = len(results)
+    if n == 0:
+        return {metric: 0.0 for metric in METRICS}
+    return {
+        'avg_waiting': sum(r['Waiting Time'] for r in results) / n,
+        'avg_turnaround': sum(r['Turnaround Time'] for r in results) / n,
+        'avg_response': sum(r['First Response'] - r['Arrival Time'] for r in results) / n,
+        'p95_response': float(np.percentile([r['First Response'] - r['Arrival Time'] for r in results], 95)),
+        'makespan': max(r['Completion Time'] for r in results) - min(r['Arrival Time'] for r in results)
+    }
+
+def _simulate(task):
+    """Run Round Robin for one (workload index, quantum, context switch) configuration."""
+    workload_index, quantum, context_switch = task
+    processes = [round_robin.Process(*row) for row in _WORKLOADS[workload_index]]
+    results = rr_schedule(processes, time_quantum=quantum, context_switch=context_switch, verbose=False)
+    return summarize_rr_results(results)
+
+def sweep_quantum(workloads, quanta, context_switches=(0.0,), max_workers=None):
+    """
+    Evaluate Round Robin over every combination of quantum and context switch cost.
+    - workloads is a single workload or a list of workloads (Process objects or rows)
+    - Every configuration runs in a process pool; max_workers=1 runs in this process
+    - Repeated quanta or context switch costs are swept once, in their first position
+    - Returns per-run metrics and, for each context switch cost, metric curves over
+      the quanta averaged across workloads
+    """
+    if not workloads:
+        return None
+
+    # A single workload is a list of processes rather than a list of lists
+    first = workloads[0]
+    if not isinstance(first, (list, tuple)) or (first and isinstance(first[0], (str, int, float))):
+        workloads = [workloads]
+    workloads = [_as_rows(w) for w in workloads if w]
+    # Each configuration is simulated once; repeated values would share a curve column
+    quanta = list(dict.fromkeys(float(q) for q in quanta))
+    context_switches = list(dict.fromkeys(float(c) for c in context_switches))
+
+    if any(q <= 0 for q in quanta):
+        raise ValueError("Time quantum must be positive.")
+
+    tasks = list(itertools.product(range(len(workloads)), quanta, context_switches))
+    logger.info(f"Sweeping {len(quanta)} quanta x {len(context_switches)} context switch costs "
+                f"over {len(workloads)} workload(s): {len(tasks)} simulations")
+
+    if max_workers == 1 or len(tasks) < 2:
+        _init_worker(workloads)
+        outcomes = [_simulate(task) for task in tasks]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(workloads,)) as executor:
+            outcomes = list(executor.map(_simulate, tasks, chunksize=chunksize))
+
+    runs = []
+    for (workload_index, quantum, context_switch), metrics in zip(tasks, outcomes):
+        run = {'workload': workload_index, 'quantum': quantum, 'context_switch': context_switch}
+        run.update(metrics)
+        runs.append(run)
+
+    # Average every metric across workloads, giving one curve per context switch cost
+    curves = {}
+    for context_switch in context_switches:
+        curves[context_switch] = {}
+        for metric in METRICS:
+            values = np.zeros((len(workloads), len(quanta)))
+            for run in runs:
+                if run['context_switch'] == context_switch:
+                    values[run['workload'], quanta.index(run['quantum'])] = run[metric]
+            curves[context_switch][metric] = values.mean(axis=0).tolist()
+
+    return {
+        'quanta': quanta,
+        'context_switches': context_switches,
+        'workload_count': len(workloads),
+        'curves': curves,
+        'runs': runs
+    }
+
+def plot_sweep(sweep, output_file):
+    """Plot the metric curves of a sweep, one line per context switch cost."""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    fig.suptitle('Round Robin Time Quantum Sweep', fontsize=16, y=1.05)
+
+    titles = {
+        'avg_waiting': 'Average Waiting Time',
+        'avg_turnaround': 'Average Turnaround Time',
+        'avg_response': 'Average Response Time'
+    }
+    for ax, (metric, title) in zip(axes, titles.items()):
+        for context_switch, curve in sweep['curves'].items():
+            ax.plot(sweep['quanta'], curve[metric], marker='o', label=f'Switch cost {context_switch:g}')
+        ax.set_title(title)
+        ax.set_xlabel('Time Quantum')
+        ax.set_ylabel('Time')
+        ax.grid(True, linestyle='--', alpha=0.7)
+    axes[0].legend()
+
+    plt.tight_layout()
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    plt.savefig(output_file, bbox_inches='tight', dpi=100)
+    plt.close(fig)
+
+    logger.info(f"Sweep plot saved to {output_file}")
+    return output_file
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep the Round Robin time quantum over one or more workloads.")
+    parser.add_argument('workloads', nargs='*',
+                        help="processes.txt style files (default: ProcessGeneratorModule/processes.txt)")
+    parser.add_argument('--quanta', type=float, nargs='+',
+                        help="explicit list of quanta to evaluate")
+    parser.add_argument('--range', type=float, nargs=3, metavar=('START', 'STOP', 'STEP'), default=(1.0, 10.0, 1.0),
+                        help="quantum range used when --quanta is not given (inclusive)")
+    parser.add_argument('--context-switch', type=float, nargs='+', default=[0.0],
+                        help="context switch costs to evaluate")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--json', help="write the sweep results to this JSON file")
+    parser.add_argument('--plot', help="save the metric curves to this PNG file")
+    args = parser.parse_args()
+
+    files = args.workloads or [os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")]
+    workloads = [load_workload(f) for f in files]
+    workloads = [w for w in workloads if w]
+    if not workloads:
+        logger.error("No processes found in the input file(s)")
+        return None
+
+    if args.quanta:
+        quanta = args.quanta
+    else:
+        start, stop, step = args.range
+        quanta = np.arange(start, stop + step / 2, step).round(6).tolist()
+
+    sweep = sweep_quantum(workloads, quanta, args.context_switch, max_workers=args.workers)
+
+    print(f"{'Quantum':<10} {'Switch':<8} {'Avg Waiting':<14} {'Avg Turnaround':<16} {'Avg Response':<14}")
+    print("-" * 64)
+    for context_switch, curve in sweep['curves'].items():
+        for i, quantum in enumerate(sweep['quanta']):
+            print(f"{quantum:<10.2f} {context_switch:<8.2f} {curve['avg_waiting'][i]:<14.2f} "
+                  f"{curve['avg_turnaround'][i]:<16.2f} {curve['avg_response'][i]:<14.2f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(sweep, f, indent=2)
+        logger.info(f"Sweep results written to {args.json}")
+    if args.plot:
+        plot_sweep(sweep, args.plot)
+    return sweep
+
+if __name__ == "__main__":
+    main()
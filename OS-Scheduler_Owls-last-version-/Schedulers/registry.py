@@ -0,0 +1,348 @@
+"""
+The scheduler registry: every scheduling algorithm, by name, with the options it takes
+and one way to run it. The web app, the comparisons, the Monte Carlo runs and the
+benchmarks all select schedulers from here.
+
+A new engine is a module that calls register() at import time. List it in
+SCHEDULER_PLUGINS (comma-separated module names) and it is imported once, the first
+time the registry is used, in every process that uses the registry:
+
+    from Schedulers import registry
+
+    def fast_fcfs(processes, verbose=False, context_switch=0.0):
+        ...  # returns (results, execution_history) like the built-in schedulers
+
+    registry.register(registry.Scheduler('Fast FCFS', fast_fcfs,
+                                         parameters={'context_switch': registry.CONTEXT_SWITCH},
+                                         convert=registry.from_history))
+"""
+import os
+import re
+import importlib
+import threading
+import logging
+
+from Schedulers import metrics as metrics_lib
+
+logger = logging.getLogger(__name__)
+
+ENV_PLUGINS = 'SCHEDULER_PLUGINS'
+
+class Parameter:
+    """One option of a scheduler: its type, default and description."""
+
+    def __init__(self, type, default, help=''):
+        self.type = type
+        self.default = default
+        self.help = help
+
+    def convert(self, value):
+        """The value as this parameter's type (None stays None)."""
+        return None if value is None else self.type(value)
+
+# The options the comparison pipeline passes to every scheduler; each one declares those it uses
+TIME_QUANTUM = Parameter(float, 4.0, "scheduling quantum")
+CONTEXT_SWITCH = Parameter(float, 0.0, "fixed cost of switching processes")
+CACHE_PENALTY = Parameter(float, 0.0, "extra cost of resuming a preempted process")
+AGING = Parameter(float, 0.0, "priority units gained per unit of waiting time")
+PREDICTION = Parameter(dict, None, "predictive_scheduling options; schedule on predicted burst lengths")
+
+def _same(processes, **options):
+    # These schedulers work on copies and can reuse the Process objects
+    return processes
+
+def _identity(results):
+    return results
+
+class Scheduler:
+    """
+    A registered scheduling algorithm.
+    - run(processes, **options) takes performance_analysis.Process objects and returns the
+      FCFS/SRTF result structure: processes, averages, execution_history and system metrics
+    - run is prepare -> execute -> convert: prepare(processes, **options) builds the
+      algorithm's own input, execute(data, verbose=..., **options) schedules it and
+      convert(output) builds the result structure. Benchmarks time execute alone
+    - parameters maps the options the scheduler takes to their Parameter; run() drops any
+      other option, so the same options can be passed to every scheduler
+    - slug names its web page and the web app runs script (relative to Schedulers/),
+      which writes results_file; engines without a script are compared and benchmarked
+      in-process only
+    - title and description head the web page; chart is the artifact the script draws
+      (e.g. gantt/fcfs_gantt.png), shown on the page when set
+    - compare=False leaves it out of the default comparison set (it can still be selected)
+    """
+
+    def __init__(self, name, execute, parameters=None, prepare=_same, convert=_identity, slug=None, script=None,
+                 results_file=None, compare=True, title=None, description='', chart=None):
+        if script and not results_file:
+            raise ValueError(f"Scheduler {name!r} has a script but no results file")
+        self.name = name
+        self.execute = execute
+        self.parameters = dict(parameters or {})
+        self.prepare = prepare
+        self.convert = convert
+        self.slug = slug or re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+        self.script = script
+        self.results_file = results_file
+        self.compare = compare
+        self.title = title or name
+        self.description = description
+        self.chart = chart
+
+    def bind(self, options):
+        """The options this scheduler takes, converted to their types, with defaults for the missing ones."""
+        return {key: parameter.convert(options.get(key, parameter.default))
+                for key, parameter in self.parameters.items()}
+
+    def run(self, processes, verbose=False, **options):
+        """Schedule processes and return the FCFS/SRTF result structure."""
+        options = self.bind(options)
+        return self.convert(self.execute(self.prepare(processes, **options), verbose=verbose, **options))
+
+    def __repr__(self):
+        return f"Scheduler({self.name!r})"
+
+def to_result_dict(formatted_results, execution_history):
+    """Convert Priority/Round Robin style results to the FCFS/SRTF result structure."""
+    processes = []
+    for r in formatted_results:
+        processes.append({
+            'pid': r['Process ID'],
+            'arrival': r['Arrival Time'],
+            'burst': r['Burst Time'],
+            'completion': r['Completion Time'],
+            'turnaround': r['Turnaround Time'],
+            'waiting': r['Waiting Time'],
+            'response': r['First Response']
+        })
+    n = len(processes)
+    return {
+        'processes': processes,
+        'averages': {
+            'waiting': sum(p['waiting'] for p in processes) / n if n > 0 else 0,
+            'turnaround': sum(p['turnaround'] for p in processes) / n if n > 0 else 0,
+            'response': sum(p['response'] - p['arrival'] for p in processes) / n if n > 0 else 0
+        },
+        'execution_history': execution_history,
+        'system': metrics_lib.system_metrics(execution_history, arrivals=[p['arrival'] for p in processes])
+    }
+
+def from_history(output):
+    """convert for schedulers returning (Priority/Round Robin style results, execution_history)."""
+    if isinstance(output, dict):
+        return output  # Already converted (a run on predicted burst lengths)
+    return to_result_dict(*output)
+
+# Built-in schedulers. Their modules are imported by the first run, not by the registry
+
+def _dict_processes(processes, **options):
+    """The dict input of fcfs_scheduling and srtf_scheduling (they update it in place)."""
+    if options.get('prediction') is not None:
+        return processes
+    return [{'pid': p.pid, 'arrival': p.arrival_time, 'burst': p.burst_time, 'remaining': p.burst_time,
+             'completion': 0, 'waiting': 0, 'turnaround': 0, 'response': -1} for p in processes]
+
+def _priority_processes(processes, **options):
+    """The dict input of highest_priority_first."""
+    return [{'pid': p.pid, 'arrival': p.arrival_time, 'burst': p.burst_time, 'priority': p.priority}
+            for p in processes]
+
+def _predicted(processes, preemptive, verbose, context_switch, cache_penalty, prediction):
+    """SJF (preemptive=False) or SRTF on predicted burst lengths, with the prediction error under 'prediction'."""
+    from Schedulers.Predictive.predictive import predictive_scheduling, prediction_error
+    results, execution_history = predictive_scheduling(processes, preemptive=preemptive, verbose=verbose,
+                                                       return_history=True, context_switch=context_switch,
+                                                       cache_penalty=cache_penalty, **prediction)
+    result = to_result_dict(results, execution_history)
+    result['prediction'] = prediction_error(results)
+    return result
+
+def _fcfs(processes, verbose=False):
+    from Schedulers.FCFS import fcfs_scheduling
+    return fcfs_scheduling(processes, verbose=verbose)
+
+def _srtf(processes, verbose=False, context_switch=0.0, cache_penalty=0.0, prediction=None):
+    if prediction is not None:
+        return _predicted(processes, True, verbose, context_switch, cache_penalty, prediction)
+    from Schedulers.SRTF import srtf_scheduling
+    return srtf_scheduling(processes, verbose=verbose, context_switch=context_switch, cache_penalty=cache_penalty)
+
+def _priority(processes, verbose=False, context_switch=0.0, cache_penalty=0.0, aging=0.0):
+    from Schedulers.priority import highest_priority_first
+    return highest_priority_first(processes, verbose=verbose, return_history=True, context_switch=context_switch,
+                                  cache_penalty=cache_penalty, aging=aging)
+
+def _from_priority(output):
+    """convert for highest_priority_first, whose rows have their own keys."""
+    results, execution_history = output
+    formatted_results = [{
+        'Process ID': r['pid'],
+        'Arrival Time': r['arrival'],
+        'Burst Time': r['burst'],
+        'Completion Time': r['finish_time'],
+        'Turnaround Time': r['turnaround_time'],
+        'Waiting Time': r['waiting_time'],
+        'First Response': r['start_time'] if 'start_time' in r else r['arrival']
+    } for r in results]
+    return to_result_dict(formatted_results, execution_history)
+
+def _round_robin(processes, verbose=False, time_quantum=4.0, context_switch=0.0, cache_penalty=0.0):
+    from Schedulers.round_robin import round_robin_scheduling
+    return round_robin_scheduling(processes, time_quantum=time_quantum, verbose=verbose, return_history=True,
+                                  context_switch=context_switch, cache_penalty=cache_penalty)
+
+def _mlfq(processes, verbose=False, context_switch=0.0, cache_penalty=0.0):
+    from Schedulers.MLFQ.mlfq import mlfq_scheduling
+    return mlfq_scheduling(processes, verbose=verbose, return_history=True, context_switch=context_switch,
+                           cache_penalty=cache_penalty)
+
+def _cfs(processes, verbose=False, context_switch=0.0, cache_penalty=0.0):
+    from Schedulers.CFS.cfs import cfs_scheduling
+    return cfs_scheduling(processes, verbose=verbose, return_history=True, context_switch=context_switch,
+                          cache_penalty=cache_penalty)
+
+def _sjf(processes, verbose=False, context_switch=0.0, prediction=None):
+    if prediction is not None:
+        return _predicted(processes, False, verbose, context_switch, 0.0, prediction)
+    from Schedulers.NonPreemptive.non_preemptive import sjf_scheduling
+    return sjf_scheduling(processes, verbose=verbose, return_history=True, context_switch=context_switch)
+
+def _priority_np(processes, verbose=False, context_switch=0.0):
+    from Schedulers.NonPreemptive.non_preemptive import priority_np_scheduling
+    return priority_np_scheduling(processes, verbose=verbose, return_history=True, context_switch=context_switch)
+
+def _lottery(processes, verbose=False, time_quantum=4.0, context_switch=0.0, cache_penalty=0.0):
+    from Schedulers.Proportional.proportional import lottery_scheduling
+    return lottery_scheduling(processes, time_quantum=time_quantum, verbose=verbose, return_history=True,
+                              context_switch=context_switch, cache_penalty=cache_penalty)
+
+def _stride(processes, verbose=False, time_quantum=4.0, context_switch=0.0, cache_penalty=0.0):
+    from Schedulers.Proportional.proportional import stride_scheduling
+    return stride_scheduling(processes, time_quantum=time_quantum, verbose=verbose, return_history=True,
+                             context_switch=context_switch, cache_penalty=cache_penalty)
+
+def _edf(processes, verbose=False, context_switch=0.0, cache_penalty=0.0):
+    from Schedulers.RealTime.edf import edf_scheduling
+    return edf_scheduling(processes, verbose=verbose, return_history=True, context_switch=context_switch,
+                          cache_penalty=cache_penalty)
+
+PREEMPTIVE = {'context_switch': CONTEXT_SWITCH, 'cache_penalty': CACHE_PENALTY}
+QUANTUM = dict(PREEMPTIVE, time_quantum=TIME_QUANTUM)
+
+BUILTIN = [
+    Scheduler('FCFS', _fcfs, prepare=_dict_processes, slug='fcfs',
+              script=os.path.join('FCFS&SRTF', 'FCFS.py'), results_file=os.path.join('FCFS&SRTF', 'fcfs_results.txt'),
+              chart='gantt/fcfs_gantt.png'),
+    Scheduler('SRTF', _srtf, dict(PREEMPTIVE, prediction=PREDICTION), prepare=_dict_processes, slug='srtf',
+              script=os.path.join('FCFS&SRTF', 'SRTF.py'), results_file=os.path.join('FCFS&SRTF', 'srtf_results.txt'),
+              chart='gantt/srtf_gantt.png'),
+    Scheduler('Priority', _priority, dict(PREEMPTIVE, aging=AGING), prepare=_priority_processes,
+              convert=_from_priority, slug='priority', script=os.path.join('Priority&RoundRobin', 'priority.py'),
+              results_file=os.path.join('Priority&RoundRobin', 'priority_results.txt')),
+    Scheduler('Round Robin', _round_robin, QUANTUM, convert=from_history, slug='round_robin',
+              script=os.path.join('Priority&RoundRobin', 'round_robin.py'),
+              results_file=os.path.join('Priority&RoundRobin', 'round_robin_results.txt')),
+    Scheduler('MLFQ', _mlfq, PREEMPTIVE, convert=from_history, slug='mlfq',
+              script=os.path.join('MLFQ', 'mlfq.py'), results_file=os.path.join('MLFQ', 'mlfq_results.txt'),
+              title='Multi-Level Feedback Queue',
+              description="Levels with quanta 4, 8 and 16; new processes start at the top level, are demoted after "
+                          "using a full quantum, and every process is boosted back to the top level every 50 time units."),
+    Scheduler('CFS', _cfs, PREEMPTIVE, convert=from_history, slug='cfs',
+              script=os.path.join('CFS', 'cfs.py'), results_file=os.path.join('CFS', 'cfs_results.txt'),
+              title='Completely Fair Scheduler',
+              description="The process with the smallest weighted virtual runtime runs next. Priority 10 is nice 0; each "
+                          "step below or above it gives about 25% more or less CPU share. Target latency 6, minimum "
+                          "granularity 0.75."),
+    Scheduler('SJF', _sjf, {'context_switch': CONTEXT_SWITCH, 'prediction': PREDICTION}, convert=from_history,
+              slug='sjf', script=os.path.join('NonPreemptive', 'non_preemptive.py'),
+              results_file=os.path.join('NonPreemptive', 'sjf_results.txt'), title='Shortest Job First',
+              description="Non-preemptive: whenever the CPU is free, the ready process with the shortest burst runs to "
+                          "completion."),
+    Scheduler('Priority (NP)', _priority_np, {'context_switch': CONTEXT_SWITCH}, convert=from_history,
+              slug='priority_np', script=os.path.join('NonPreemptive', 'non_preemptive.py'),
+              results_file=os.path.join('NonPreemptive', 'priority_np_results.txt'), title='Non-Preemptive Priority',
+              description="Whenever the CPU is free, the ready process with the lowest priority number runs to "
+                          "completion; a higher priority arrival waits for the running process to finish."),
+    Scheduler('Lottery', _lottery, QUANTUM, convert=from_history, slug='lottery',
+              script=os.path.join('Proportional', 'proportional.py'),
+              results_file=os.path.join('Proportional', 'lottery_results.txt'),
+              description="Every process holds tickets in proportion to its priority (priority 1 gets the most); each "
+                          "quantum a random ticket decides which process runs, so CPU shares follow the ticket shares "
+                          "on average."),
+    Scheduler('Stride', _stride, QUANTUM, convert=from_history, slug='stride',
+              script=os.path.join('Proportional', 'proportional.py'),
+              results_file=os.path.join('Proportional', 'stride_results.txt'),
+              description="The deterministic version of lottery scheduling: every quantum the process with the smallest "
+                          "pass value runs, and its pass advances by a stride inversely proportional to its tickets."),
+    Scheduler('EDF', _edf, PREEMPTIVE, convert=from_history, slug='edf',
+              script=os.path.join('RealTime', 'edf.py'), results_file=os.path.join('RealTime', 'edf_results.txt'),
+              description="Earliest Deadline First: the ready process whose absolute deadline (arrival plus its Deadline "
+                          "column) comes first runs, and an arrival with an earlier deadline preempts it. Processes "
+                          "without a deadline run last.")
+]
+
+_schedulers = {}
+_plugins_loaded = False
+_lock = threading.RLock()
+
+def register(scheduler):
+    """Add a scheduler to the registry. Names and slugs must be unique; returns the scheduler."""
+    with _lock:
+        if scheduler.name in _schedulers:
+            raise ValueError(f"Scheduler {scheduler.name!r} is already registered")
+        if any(s.slug == scheduler.slug for s in _schedulers.values()):
+            raise ValueError(f"Scheduler slug {scheduler.slug!r} is already registered")
+        _schedulers[scheduler.name] = scheduler
+    return scheduler
+
+def discover():
+    """
+    Import the SCHEDULER_PLUGINS modules, once per process; they register their schedulers.
+    A plugin that fails to import is logged and skipped.
+    """
+    global _plugins_loaded
+    with _lock:
+        if _plugins_loaded:
+            return
+        _plugins_loaded = True
+        for module in filter(None, (m.strip() for m in os.environ.get(ENV_PLUGINS, '').split(','))):
+            try:
+                importlib.import_module(module)
+                logger.info(f"Loaded scheduler plugin {module}")
+            except Exception as e:
+                logger.error(f"Error loading scheduler plugin {module}: {e}")
+
+def schedulers():
+    """Every registered scheduler, in registration order."""
+    discover()
+    return list(_schedulers.values())
+
+def names(compared_only=False):
+    """Names of the registered schedulers (compared_only: the default comparison set)."""
+    return [s.name for s in schedulers() if s.compare or not compared_only]
+
+def get(name):
+    """The scheduler registered under name (or slug); raises KeyError for an unknown scheduler."""
+    discover()
+    scheduler = _schedulers.get(name)
+    if scheduler is None:
+        scheduler = next((s for s in _schedulers.values() if s.slug == name), None)
+    if scheduler is None:
+        raise KeyError(f"Unknown scheduler: {name}")
+    return scheduler
+
+def select(selection=None):
+    """
+    Names of the schedulers to run: the default comparison set when selection is empty,
+    otherwise the listed names or slugs (a list or a comma-separated string), in registry order.
+    Raises KeyError for an unknown scheduler.
+    """
+    if not selection:
+        return names(compared_only=True)
+    if isinstance(selection, str):
+        selection = [s.strip() for s in selection.split(',') if s.strip()]
+    wanted = {get(name).name for name in selection}
+    return [name for name in names() if name in wanted]
+
+for _scheduler in BUILTIN:
+    register(_scheduler)
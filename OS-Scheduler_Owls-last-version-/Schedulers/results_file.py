@@ -0,0 +1,71 @@
+import re
+
+# Column headings of the scheduler results files and the process keys they are read into.
+# The schedulers write different columns (Priority has Priority, Start Time and Finish Time),
+# so the columns are found by their heading rather than by position.
+COLUMNS = {
+    'Process ID': 'pid',
+    'Arrival Time': 'arrival',
+    'Burst Time': 'burst',
+    'Completion': 'completion',
+    'Finish Time': 'completion',
+    'Turnaround': 'turnaround',
+    'Waiting': 'waiting',
+    'First Response': 'first_response',
+    'Start Time': 'first_response',
+    'Priority': 'priority'
+}
+
+AVERAGES = {
+    'Average Waiting Time:': 'waiting',
+    'Average Turnaround Time:': 'turnaround'
+}
+
+def header_columns(header):
+    """The column headings of a results file's header line (headings are separated by two or more spaces)."""
+    return re.split(r'\s{2,}', header.strip())
+
+def parse_results(lines):
+    """
+    Parse the lines of a scheduler results file.
+    - The first line is the header; the columns are looked up by heading (COLUMNS), and
+      columns the reader does not know (Bursts, Pred. Error) are skipped
+    - Every process gets pid, arrival, burst, completion, turnaround and waiting, and
+      response (first response - arrival) when the file has a First Response or Start Time column
+    - Lines with a colon are summaries, not processes; only the averages are kept
+    Returns (processes, averages); averages holds the waiting and turnaround averages found
+    in the file. Raises ValueError when the header lacks a required column.
+    """
+    if not lines:
+        return [], {}
+    keys = [COLUMNS.get(heading) for heading in header_columns(lines[0])]
+    missing = {'pid', 'arrival', 'burst', 'completion', 'turnaround', 'waiting'} - set(keys)
+    if missing:
+        raise ValueError(f"Results header has no {', '.join(sorted(missing))} column: {lines[0].strip()}")
+
+    processes = []
+    averages = {}
+    for line in lines[1:]:
+        line = line.strip()
+        if not line or line.startswith('-'):
+            continue
+        if ':' in line:
+            # Summary lines (averages, the predictive schedulers' prediction error) follow the rows
+            average = next((key for label, key in AVERAGES.items() if line.startswith(label)), None)
+            if average:
+                averages[average] = float(line.split(':')[1].strip())
+            continue
+
+        data = line.split()
+        if len(data) < len(keys):
+            continue
+        process = {}
+        for key, value in zip(keys, data):
+            if key == 'pid':
+                process['pid'] = value
+            elif key:
+                process[key] = float(value)
+        if 'first_response' in process:
+            process['response'] = process.pop('first_response') - process['arrival']
+        processes.append(process)
+    return processes, averages
@@ -0,0 +1,926 @@
+import numpy as np
+import os
+import sys
+import json
+import heapq
+import random
+import argparse
+import logging
+from collections import deque
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+sys.path.append(base_dir)
+
+from Schedulers.metrics import system_metrics, tail_summary, deadline_metrics
+from Schedulers.workload import read_workload
+
+# Import the CFS weights so both simulations agree on nice levels
+from Schedulers.CFS import cfs
+
+# Import the ticket rules so both simulations agree on proportional shares
+from Schedulers.Proportional import proportional
+
+PLACEMENTS = ['global', 'per-core']
+# Which processes get the fast cores when core speeds differ
+CORE_PREFERENCES = ['none', 'fastest', 'short-jobs', 'high-priority']
+
+# Tolerance for floating point event times
+EPS = 1e-9
+
+class Policy:
+    """
+    Ordering and time slice rules of one algorithm, shared by every core.
+    - key orders a run queue (smallest first); queued processes never change key
+    - slice_left is how long a dispatched process may run before it is requeued
+    - preempts decides whether a queued process takes the CPU from a running one
+    - blocked and woken bracket the I/O of a process between two CPU bursts
+    """
+    preemptive = False
+    boost_interval = None
+    # Whether a process whose slice expired is queued before the processes arriving at that moment
+    requeue_before_arrivals = False
+
+    def admit(self, process):
+        """Prepare a newly arrived process."""
+
+    def key(self, process):
+        raise NotImplementedError
+
+    def slice_left(self, process, queue):
+        return float('inf')
+
+    def queued(self, process):
+        """Called when a process enters a run queue, before its key is computed."""
+
+    def dispatched(self, process):
+        """Called when a process gets a core."""
+
+    def charge(self, process, run_time, work):
+        """run_time is time spent on the core, work the part of the burst done in it."""
+        process['remaining'] -= work
+        process['used'] += run_time
+
+    def expire(self, process):
+        """Called when a process used up its slice without finishing."""
+        process['used'] = 0.0
+
+    def accounted(self, runnable, queues):
+        """Called at every event once the running processes were charged up to now."""
+
+    def preempts(self, queued, running):
+        return self.preemptive and self.key(queued) < self.key(running)
+
+    def boost(self):
+        """Periodic boost of every queued process (every boost_interval)."""
+
+    def blocked(self, process):
+        """Called when a process finished a CPU burst and starts I/O; the next burst gets a fresh slice."""
+        process['used'] = 0.0
+
+    def woken(self, process):
+        """Called when a process' I/O completed, before it is queued again."""
+
+class FCFSPolicy(Policy):
+    def key(self, process):
+        return (process['arrival'], process['order'])
+
+class SRTFPolicy(Policy):
+    preemptive = True
+
+    def key(self, process):
+        return (process['remaining'], process['arrival'], process['order'])
+
+class PriorityPolicy(Policy):
+    preemptive = True
+
+    def key(self, process):
+        return (process['priority'], process['arrival'], process['order'])
+
+class EDFPolicy(Policy):
+    preemptive = True
+
+    def key(self, process):
+        return (process['deadline'], process['arrival'], process['order'])
+
+class SJFPolicy(Policy):
+    def key(self, process):
+        return (process['cpu_burst'], process['arrival'], process['order'])
+
+class PriorityNPPolicy(Policy):
+    def key(self, process):
+        return (process['priority'], process['arrival'], process['order'])
+
+class RoundRobinPolicy(Policy):
+    def __init__(self, time_quantum=4.0):
+        self.time_quantum = time_quantum
+
+    def key(self, process):
+        # FIFO: the sequence number the run queue stamped on the process
+        return (process['seq'],)
+
+    def slice_left(self, process, queue):
+        return self.time_quantum - process['used']
+
+class MLFQPolicy(Policy):
+    """
+    MLFQ with lazy priority boosts, like LevelQueues in mlfq.py.
+    - A boost moves every queued process to level 0 keeping their order level by
+      level, which is the order of (boost epoch, level, seq); the key is therefore
+      stable and a boost only starts a new epoch instead of touching every process
+    - A process queued in an older epoch is moved to level 0 when it is dispatched
+      or moved to another queue
+    """
+    preemptive = True
+
+    def __init__(self, quanta=(4.0, 8.0, 16.0), boost_interval=50.0):
+        self.quanta = quanta
+        self.boost_interval = boost_interval
+        self.epoch = 0
+
+    def admit(self, process):
+        process['level'] = 0
+        process['epoch'] = self.epoch
+
+    def _refresh(self, process):
+        if process['epoch'] != self.epoch:
+            process['level'] = 0
+            process['used'] = 0.0
+            process['epoch'] = self.epoch
+
+    def queued(self, process):
+        self._refresh(process)
+
+    def dispatched(self, process):
+        self._refresh(process)
+
+    def key(self, process):
+        return (process['epoch'], process['level'], process['seq'])
+
+    def slice_left(self, process, queue):
+        return self.quanta[process['level']] - process['used']
+
+    def expire(self, process):
+        process['level'] = min(process['level'] + 1, len(self.quanta) - 1)
+        process['used'] = 0.0
+
+    def preempts(self, queued, running):
+        level = 0 if queued['epoch'] != self.epoch else queued['level']
+        return level < running['level']
+
+    def boost(self):
+        self.epoch += 1
+
+    def blocked(self, process):
+        # The time allotment at a level counts across I/O, so giving up the CPU just
+        # before the quantum ends does not keep a process at the top level
+        pass
+
+class CFSPolicy(Policy):
+    preemptive = True
+    requeue_before_arrivals = True
+
+    def __init__(self, target_latency=6.0, min_granularity=0.75, wakeup_granularity=1.0):
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self.wakeup_granularity = wakeup_granularity
+        self.min_vruntime = 0.0
+
+    def admit(self, process):
+        process['weight'] = cfs.priority_to_weight(process['priority'])
+        process['vruntime'] = max(process.get('vruntime', 0.0), self.min_vruntime)
+
+    def key(self, process):
+        return (process['vruntime'], process['seq'])
+
+    def slice_left(self, process, queue):
+        # Weighted share of the period among this queue's processes and the dispatched one
+        runnable = len(queue) + 1
+        period = max(self.target_latency, runnable * self.min_granularity)
+        share = period * process['weight'] / (queue.total_weight + process['weight'])
+        return max(share, self.min_granularity) - process['used']
+
+    def dispatched(self, process):
+        # Every pick starts a fresh slice, as in cfs_scheduling
+        process['used'] = 0.0
+
+    def accounted(self, runnable, queues):
+        # min_vruntime follows the smallest runnable virtual runtime and only moves forward
+        vruntimes = [p['vruntime'] for p in runnable] + [q.peek()['vruntime'] for q in queues if q]
+        if vruntimes:
+            self.min_vruntime = max(self.min_vruntime, min(vruntimes))
+
+    def charge(self, process, run_time, work):
+        super().charge(process, run_time, work)
+        process['vruntime'] += run_time * cfs.NICE_0_WEIGHT / process['weight']
+
+    def preempts(self, queued, running):
+        return running['vruntime'] - queued['vruntime'] > self.wakeup_granularity
+
+    def woken(self, process):
+        # A sleeper is placed up to half a period behind min_vruntime, so it runs soon
+        # without being able to bank the whole time it slept
+        process['vruntime'] = max(process['vruntime'], self.min_vruntime - self.target_latency / 2)
+
+class LotteryPolicy(Policy):
+    """
+    Lottery scheduling on a heap: a process entering a queue draws
+    clock + Exp(tickets), and the smallest draw wins. The smallest of independent
+    exponential draws belongs to each process with probability tickets / total, and
+    since the draws are memoryless, drawing on entry instead of at every pick gives
+    the same odds once the clock follows the last winner.
+    """
+    def __init__(self, time_quantum=4.0, seed=0):
+        self.time_quantum = time_quantum
+        self.rng = random.Random(seed)
+        self.clock = 0.0
+
+    def admit(self, process):
+        process['tickets'] = proportional.priority_to_tickets(process['priority'])
+
+    def queued(self, process):
+        process['draw'] = self.clock + self.rng.expovariate(process['tickets'])
+
+    def key(self, process):
+        return (process['draw'],)
+
+    def dispatched(self, process):
+        self.clock = max(self.clock, process['draw'])
+
+    def slice_left(self, process, queue):
+        return self.time_quantum - process['used']
+
+class StridePolicy(Policy):
+    def __init__(self, time_quantum=4.0):
+        self.time_quantum = time_quantum
+        self.global_pass = 0.0
+
+    def admit(self, process):
+        process['tickets'] = proportional.priority_to_tickets(process['priority'])
+        process['stride'] = proportional.STRIDE1 / process['tickets']
+        process['pass'] = max(process.get('pass', 0.0), self.global_pass)
+
+    def key(self, process):
+        return (process['pass'], process['order'])
+
+    def slice_left(self, process, queue):
+        return self.time_quantum - process['used']
+
+    def charge(self, process, run_time, work):
+        super().charge(process, run_time, work)
+        process['pass'] += process['stride'] * run_time / self.time_quantum
+
+    def accounted(self, runnable, queues):
+        # The global pass follows the smallest competing pass and only moves forward
+        passes = [p['pass'] for p in runnable] + [q.peek()['pass'] for q in queues if q]
+        if passes:
+            self.global_pass = max(self.global_pass, min(passes))
+
+    def woken(self, process):
+        process['pass'] = max(process['pass'], self.global_pass)
+
+def make_policy(algorithm, time_quantum=4.0):
+    """Build the policy of a scheduling algorithm by its comparison name."""
+    policies = {
+        'FCFS': FCFSPolicy,
+        'SRTF': SRTFPolicy,
+        'Priority': PriorityPolicy,
+        'Round Robin': lambda: RoundRobinPolicy(time_quantum),
+        'MLFQ': MLFQPolicy,
+        'CFS': CFSPolicy,
+        'SJF': SJFPolicy,
+        'Priority (NP)': PriorityNPPolicy,
+        'Lottery': lambda: LotteryPolicy(time_quantum),
+        'Stride': lambda: StridePolicy(time_quantum),
+        'EDF': EDFPolicy
+    }
+    if algorithm not in policies:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    return policies[algorithm]()
+
+ALGORITHMS = ['FCFS', 'SRTF', 'Priority', 'Round Robin', 'MLFQ', 'CFS', 'SJF', 'Priority (NP)', 'Lottery', 'Stride',
+              'EDF']
+
+class RunQueue:
+    """A run queue ordered by the policy key (binary heap, FIFO among equal keys)."""
+    def __init__(self, policy):
+        self.policy = policy
+        self.heap = []
+        self.total_weight = 0
+        self.sequence = 0
+
+    def push(self, process):
+        self.sequence += 1
+        process['seq'] = self.sequence
+        self.policy.queued(process)
+        self.total_weight += process.get('weight', 0)
+        heapq.heappush(self.heap, (self.policy.key(process), self.sequence, process))
+
+    def peek(self):
+        return self.heap[0][2] if self.heap else None
+
+    def pop(self):
+        process = heapq.heappop(self.heap)[2]
+        self.total_weight -= process.get('weight', 0)
+        return process
+
+    def pop_any(self):
+        """Remove a leaf entry in O(1), used when moving work to another core."""
+        process = self.heap.pop()[2]
+        self.total_weight -= process.get('weight', 0)
+        return process
+
+    def __len__(self):
+        return len(self.heap)
+
+def _as_rows(workload):
+    """
+    Accept Process objects or (pid, arrival, burst, priority[, bursts[, deadline]]) rows and
+    return (pid, arrival, burst, priority, bursts, deadline) rows; bursts is a CPU/I/O
+    cycle or None, deadline a relative deadline or None.
+    """
+    rows = []
+    for p in workload:
+        if isinstance(p, (tuple, list)):
+            row = tuple(p)
+            rows.append(row + (None,) * (6 - len(row)))
+        else:
+            rows.append((p.pid, p.arrival_time, p.burst_time, p.priority, getattr(p, 'bursts', None),
+                         getattr(p, 'deadline', None)))
+    return rows
+
+def simulate_smp(processes, algorithm='Round Robin', cores=2, placement='global', work_stealing=True,
+                 balance_interval=None, time_quantum=4.0, context_switch=0.0, cache_penalty=0.0,
+                 speeds=None, core_preference='none'):
+    """
+    Run a scheduling algorithm on several simulated cores.
+    - placement='global' shares one run queue between all cores; 'per-core' gives every
+      core its own queue and places each arrival on the least loaded core
+    - work_stealing lets an idle per-core CPU take a queued process from the busiest core
+    - balance_interval (per-core only) periodically moves queued processes from the
+      longest to the shortest queue
+    - context_switch is paid when a core switches to a different process; cache_penalty
+      is added when the process ran before (it was preempted or migrated)
+    - speeds (optional) gives every core a speed factor and sets the core count; a burst
+      of 10 takes 10 / s time units on a core of speed s
+    - core_preference decides who gets the fast cores: 'none' ignores speeds, 'fastest'
+      fills idle cores fastest first (and places per-core arrivals by load / speed),
+      'short-jobs' and 'high-priority' also hand the fastest idle core to the shortest
+      (highest priority) of the processes dispatched together and let an idle fast core
+      pull such a process off a slower core when it finishes sooner despite the switch
+    - A process with a CPU/I/O cycle (bursts) is blocked for each I/O burst and queued
+      again when its I/O completes; I/O runs in parallel with the cores and is listed in
+      io_history. burst_response is the mean delay from becoming ready (arrival or I/O
+      completion) to starting each CPU burst, and waiting excludes the time in I/O
+    - EDF orders by absolute deadline (arrival + relative deadline; processes without
+      one go last); for every algorithm the results carry the deadline miss ratio and
+      lateness under 'deadlines' when any process has a deadline
+    - Returns the FCFS/SRTF result structure (processes, averages, execution_history,
+      system) plus per-core busy time; every slice in the trace is tagged with its core
+    """
+    if speeds is not None:
+        cores = len(speeds)
+        if any(speed <= 0 for speed in speeds):
+            raise ValueError("Core speeds must be positive.")
+    else:
+        speeds = [1.0] * cores
+    if cores < 1:
+        raise ValueError("At least one core is required.")
+    if placement not in PLACEMENTS:
+        raise ValueError(f"Unknown placement: {placement}")
+    if core_preference not in CORE_PREFERENCES:
+        raise ValueError(f"Unknown core preference: {core_preference}")
+    # Smaller merit deserves a faster core
+    merit = {
+        'short-jobs': lambda p: (p['remaining'], p['order']),
+        'high-priority': lambda p: (p['priority'], p['remaining'], p['order'])
+    }.get(core_preference)
+
+    policy = make_policy(algorithm, time_quantum)
+    rows = _as_rows(processes)
+    if not rows:
+        return {'processes': [], 'averages': {'waiting': 0, 'turnaround': 0, 'response': 0, 'burst_response': 0},
+                'execution_history': [], 'io_history': [], 'system': system_metrics([])}
+
+    pending = deque(sorted(({
+        'pid': pid,
+        'arrival': float(arrival),
+        'burst': float(sum(cycle[0::2]) if cycle else burst),
+        'priority': int(priority),
+        'deadline': float('inf') if deadline is None else float(arrival) + deadline,
+        'cycle': [float(x) for x in cycle] if cycle else [float(burst)],  # CPU, I/O, CPU, ...
+        'index': 0,  # Position of the current CPU burst in the cycle
+        'cpu_burst': float(cycle[0] if cycle else burst),
+        'remaining': float(cycle[0] if cycle else burst),
+        'used': 0.0,
+        'service': 0.0,  # Time spent running, shorter than the burst on fast cores
+        'io_time': 0.0,
+        'ready_since': float(arrival),
+        'burst_responses': [],
+        'order': i,
+        'response': -1,
+        'completion': 0,
+        'last_core': None,
+        'migrations': 0
+    } for i, (pid, arrival, burst, priority, cycle, deadline) in enumerate(rows)),
+        key=lambda p: (p['arrival'], p['order'])))
+
+    cpu = [{'id': c, 'speed': float(speeds[c]), 'process': None, 'start': 0.0, 'slice_end': 0.0,
+            'slice': None, 'last_pid': None} for c in range(cores)]
+    by_speed = sorted(cpu, key=lambda c: (-c['speed'], c['id']))
+    if placement == 'global':
+        shared = RunQueue(policy)
+        queues = [shared] * cores
+        distinct_queues = [shared]
+    else:
+        queues = [RunQueue(policy) for _ in range(cores)]
+        distinct_queues = queues
+
+    execution_history = []
+    io_history = []
+    blocked = []  # Heap of (I/O completion time, order, process)
+    completed = []
+    total = len(pending)
+    current_time = pending[0]['arrival']
+    next_balance = current_time + balance_interval if balance_interval and placement == 'per-core' else float('inf')
+    next_boost = current_time + policy.boost_interval if policy.boost_interval else float('inf')
+
+    def place(process):
+        if placement == 'global':
+            shared.push(process)
+            return
+        # Least loaded core: queued processes plus the running one (per unit of speed)
+        if core_preference == 'none':
+            core = min(range(cores), key=lambda c: (len(queues[c]) + (cpu[c]['process'] is not None), c))
+        else:
+            core = min(range(cores), key=lambda c: ((len(queues[c]) + (cpu[c]['process'] is not None) + 1)
+                                                    / cpu[c]['speed'], -cpu[c]['speed'], c))
+        queues[core].push(process)
+
+    def dispatch(core, process):
+        overhead = 0.0
+        if core['last_pid'] is not None and core['last_pid'] != process['pid']:
+            overhead = context_switch
+            if process['remaining'] < process['cpu_burst']:
+                overhead += cache_penalty
+        if overhead > 0:
+            execution_history.append({
+                'pid': process['pid'],
+                'start': current_time,
+                'end': current_time + overhead,
+                'kind': 'switch',
+                'core': core['id']
+            })
+        if process['last_core'] is not None and process['last_core'] != core['id']:
+            process['migrations'] += 1
+        start = current_time + overhead
+        if process['response'] == -1:
+            process['response'] = start
+        if len(process['burst_responses']) <= process['index'] // 2:
+            process['burst_responses'].append(start - process['ready_since'])
+        policy.dispatched(process)
+        core['process'] = process
+        core['start'] = start
+        core['slice'] = None
+        core['slice_end'] = start + min(process['remaining'] / core['speed'],
+                                        policy.slice_left(process, queues[core['id']]))
+        core['last_pid'] = process['pid']
+        process['last_core'] = core['id']
+
+    def take(core):
+        queue = queues[core['id']]
+        if queue:
+            return queue.pop()
+        if work_stealing:
+            victim = max(range(cores), key=lambda c: len(queues[c]))
+            if queues[victim]:
+                return queues[victim].pop_any()
+        return None
+
+    while len(completed) < total:
+        # Account the work done on every core up to now; finish or requeue expired slices
+        expired = []
+        for core in cpu:
+            process = core['process']
+            if process is None:
+                continue
+            if current_time > core['start']:
+                # Events on other cores split the accounting, not the slice in the trace
+                if core['slice'] is None:
+                    core['slice'] = {'pid': process['pid'], 'start': core['start'], 'end': current_time,
+                                     'core': core['id']}
+                    execution_history.append(core['slice'])
+                else:
+                    core['slice']['end'] = current_time
+                run_time = current_time - core['start']
+                process['service'] += run_time
+                policy.charge(process, run_time, run_time * core['speed'])
+                core['start'] = current_time
+            if current_time >= core['slice_end'] - EPS:
+                core['process'] = None
+                if process['remaining'] <= EPS and process['index'] + 1 < len(process['cycle']):
+                    # End of a CPU burst: block for the following I/O burst
+                    io = process['cycle'][process['index'] + 1]
+                    process['index'] += 2
+                    process['cpu_burst'] = process['remaining'] = process['cycle'][process['index']]
+                    process['io_time'] += io
+                    policy.blocked(process)
+                    io_history.append({'pid': process['pid'], 'start': current_time, 'end': current_time + io})
+                    heapq.heappush(blocked, (current_time + io, process['order'], process))
+                elif process['remaining'] <= EPS:
+                    process['completion'] = current_time
+                    completed.append(process)
+                else:
+                    policy.expire(process)
+                    expired.append((core, process))
+
+        policy.accounted([c['process'] for c in cpu if c['process'] is not None] + [p for _, p in expired],
+                         distinct_queues)
+
+        # Admit arrivals and requeue the processes whose slice just expired, in the
+        # order the single-core scheduler uses
+        if policy.requeue_before_arrivals:
+            for core, process in expired:
+                queues[core['id']].push(process)
+        while blocked and blocked[0][0] <= current_time + EPS:
+            done, _, process = heapq.heappop(blocked)
+            process['ready_since'] = done
+            policy.woken(process)
+            place(process)
+        while pending and pending[0]['arrival'] <= current_time + EPS:
+            process = pending.popleft()
+            policy.admit(process)
+            place(process)
+        if not policy.requeue_before_arrivals:
+            for core, process in expired:
+                queues[core['id']].push(process)
+
+        # Periodic priority boost (MLFQ): running processes are requeued, then every
+        # queue moves to the top level keeping its order level by level
+        if current_time >= next_boost - EPS:
+            for core in cpu:
+                if core['process'] is not None and core['start'] <= current_time + EPS:
+                    queues[core['id']].push(core['process'])
+                    core['process'] = None
+            policy.boost()
+            while next_boost <= current_time + EPS:
+                next_boost += policy.boost_interval
+
+        # Periodic load balancing between per-core queues
+        if current_time >= next_balance - EPS:
+            while True:
+                longest = max(range(cores), key=lambda c: len(queues[c]))
+                shortest = min(range(cores), key=lambda c: len(queues[c]))
+                if len(queues[longest]) - len(queues[shortest]) <= 1:
+                    break
+                queues[shortest].push(queues[longest].pop_any())
+            while next_balance <= current_time + EPS:
+                next_balance += balance_interval
+
+        # Idle cores pick (or steal) work; from the shared queue a process goes back
+        # to the core it last ran on when that core is idle (cache affinity), among
+        # the fastest idle cores unless speeds are ignored
+        order = cpu if core_preference == 'none' else by_speed
+        if placement == 'global':
+            idle = [core for core in order if core['process'] is None]
+            chosen = [shared.pop() for _ in range(min(len(idle), len(shared)))]
+            if merit:
+                chosen.sort(key=merit)
+            for process in chosen:
+                candidates = idle if core_preference == 'none' else [c for c in idle if c['speed'] == idle[0]['speed']]
+                core = next((c for c in candidates if c['id'] == process['last_core']), candidates[0])
+                idle.remove(core)
+                dispatch(core, process)
+        else:
+            for core in order:
+                if core['process'] is None:
+                    process = take(core)
+                    if process is not None:
+                        dispatch(core, process)
+
+        # Misfit migration: a fast core left idle pulls the most deserving process off a
+        # slower core when that finishes it sooner despite the switch cost
+        if merit:
+            for fast in by_speed:
+                if fast['process'] is not None:
+                    continue
+                slower = [c for c in cpu if c['process'] is not None and c['speed'] < fast['speed']
+                          and c['start'] <= current_time + EPS]
+                if not slower:
+                    break
+                slow = min(slower, key=lambda c: merit(c['process']))
+                process = slow['process']
+                if (process['remaining'] / slow['speed']
+                        <= context_switch + cache_penalty + process['remaining'] / fast['speed']):
+                    continue
+                slow['process'] = None
+                dispatch(fast, process)
+                replacement = take(slow)
+                if replacement is not None:
+                    dispatch(slow, replacement)
+
+        # Preemption: a better queued process takes over a core that is not mid-switch
+        if policy.preemptive:
+            if placement == 'global':
+                while shared:
+                    running = [c for c in cpu if c['process'] is not None and c['start'] <= current_time + EPS]
+                    if not running:
+                        break
+                    worst = max(running, key=lambda c: policy.key(c['process']))
+                    if not policy.preempts(shared.peek(), worst['process']):
+                        break
+                    victim = worst['process']
+                    worst['process'] = None
+                    dispatch(worst, shared.pop())
+                    shared.push(victim)
+            else:
+                for core in cpu:
+                    queue = queues[core['id']]
+                    process = core['process']
+                    if (process is not None and queue and core['start'] <= current_time + EPS
+                            and policy.preempts(queue.peek(), process)):
+                        core['process'] = None
+                        dispatch(core, queue.pop())
+                        queue.push(process)
+
+        # Advance to the next event
+        events = [core['slice_end'] for core in cpu if core['process'] is not None]
+        if pending:
+            events.append(pending[0]['arrival'])
+        if blocked:
+            events.append(blocked[0][0])
+        if any(distinct_queues):
+            events.append(next_balance)
+            events.append(next_boost)
+        elif any(core['process'] is not None for core in cpu):
+            events.append(next_boost)
+        if not events:
+            break
+        current_time = max(min(events), current_time)
+
+    # Calculate timing metrics
+    results = []
+    for process in completed:
+        turnaround = process['completion'] - process['arrival']
+        results.append({
+            'pid': process['pid'],
+            'arrival': process['arrival'],
+            'burst': process['burst'],
+            'priority': process['priority'],
+            'deadline': process['deadline'] if process['deadline'] != float('inf') else None,
+            'completion': process['completion'],
+            'turnaround': turnaround,
+            'waiting': turnaround - process['service'] - process['io_time'],
+            'response': process['response'],
+            'burst_response': sum(process['burst_responses']) / len(process['burst_responses']),
+            'bursts': len(process['burst_responses']),
+            'io_time': process['io_time'],
+            'migrations': process['migrations']
+        })
+    results.sort(key=lambda r: r['pid'])
+    n = len(results)
+
+    system = system_metrics(execution_history, arrivals=[r['arrival'] for r in results], cores=cores)
+    busy = [0.0] * cores
+    for s in execution_history:
+        if s.get('kind', 'run') == 'run':
+            busy[s['core']] += s['end'] - s['start']
+    per_core = [{
+        'core': core['id'],
+        'speed': core['speed'],
+        'busy_time': busy[core['id']],
+        'utilization': busy[core['id']] / system['makespan'] if system['makespan'] > 0 else 0.0
+    } for core in cpu]
+
+    result = {
+        'algorithm': algorithm,
+        'cores': cores,
+        'placement': placement,
+        'speeds': [core['speed'] for core in cpu],
+        'core_preference': core_preference,
+        'processes': results,
+        'averages': {
+            'waiting': sum(r['waiting'] for r in results) / n,
+            'turnaround': sum(r['turnaround'] for r in results) / n,
+            'response': sum(r['response'] - r['arrival'] for r in results) / n,
+            'burst_response': sum(r['burst_response'] for r in results) / n
+        },
+        'execution_history': execution_history,
+        'io_history': io_history,
+        'system': system,
+        'per_core': per_core
+    }
+    deadlines = {r['pid']: r['deadline'] for r in results if r['deadline'] is not None}
+    if deadlines:
+        result['deadlines'] = deadline_metrics(results, deadlines)
+    return result
+
+def scaling_study(processes, core_counts=(1, 2, 4, 8), algorithms=ALGORITHMS, **options):
+    """
+    Run every algorithm at every core count on the same workload.
+    Returns {algorithm: [{'cores', 'avg_waiting', 'avg_turnaround', 'avg_response',
+    'p95_waiting', 'makespan', 'utilization', 'throughput', 'migrations'}, ...]}.
+    """
+    study = {}
+    for algorithm in algorithms:
+        study[algorithm] = []
+        for count in core_counts:
+            result = simulate_smp(processes, algorithm, cores=count, **options)
+            study[algorithm].append(dict(cores=count, **_summary_row(result)))
+    return study
+
+def heterogeneity_study(processes, speeds, algorithms=ALGORITHMS, preferences=CORE_PREFERENCES, **options):
+    """
+    Run every algorithm with every core preference on cores of the given speeds.
+    Returns {algorithm: [{'preference', 'avg_waiting', ..., 'migrations'}, ...]}.
+    """
+    study = {}
+    for algorithm in algorithms:
+        study[algorithm] = []
+        for preference in preferences:
+            result = simulate_smp(processes, algorithm, speeds=speeds, core_preference=preference, **options)
+            study[algorithm].append(dict(preference=preference, **_summary_row(result)))
+    return study
+
+def io_study(processes, algorithms=ALGORITHMS, cores=1, **options):
+    """
+    Interactive versus batch behaviour of every algorithm on a CPU/I/O workload.
+    A process is interactive when it does I/O and its mean CPU burst fits in one Round
+    Robin quantum, otherwise batch.
+    Returns {algorithm: {class: {'count', 'avg_burst_response', 'avg_response',
+    'avg_waiting', 'avg_turnaround'}}}.
+    """
+    quantum = options.get('time_quantum', 4.0)
+    study = {}
+    for algorithm in algorithms:
+        result = simulate_smp(processes, algorithm, cores=cores, **options)
+        classes = {}
+        for p in result['processes']:
+            interactive = p['io_time'] > 0 and p['burst'] / p['bursts'] <= quantum
+            classes.setdefault('interactive' if interactive else 'batch', []).append(p)
+        study[algorithm] = {name: {
+            'count': len(members),
+            'avg_burst_response': sum(p['burst_response'] for p in members) / len(members),
+            'avg_response': sum(p['response'] - p['arrival'] for p in members) / len(members),
+            'avg_waiting': sum(p['waiting'] for p in members) / len(members),
+            'avg_turnaround': sum(p['turnaround'] for p in members) / len(members)
+        } for name, members in sorted(classes.items(), reverse=True)}
+    return study
+
+def _summary_row(result):
+    row = {
+        'avg_waiting': result['averages']['waiting'],
+        'avg_turnaround': result['averages']['turnaround'],
+        'avg_response': result['averages']['response'],
+        'p95_waiting': tail_summary([p['waiting'] for p in result['processes']])['p95'],
+        'makespan': result['system']['makespan'],
+        'utilization': result['system']['utilization'],
+        'throughput': result['system']['throughput'],
+        'migrations': result['system']['migrations']
+    }
+    if result.get('deadlines'):
+        row['deadline_miss_ratio'] = result['deadlines']['deadline_miss_ratio']
+        row['avg_lateness'] = result['deadlines']['avg_lateness']
+    return row
+
+def plot_smp_gantt(result, output_file):
+    """Gantt chart with one lane per core; switch overhead is drawn grey and hatched."""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+
+    history = result['execution_history']
+    cores = result['cores']
+    pids = sorted({s['pid'] for s in history})
+    colors = plt.cm.tab20(np.linspace(0, 1, max(len(pids), 1)))
+    color_map = {pid: colors[i] for i, pid in enumerate(pids)}
+
+    fig, ax = plt.subplots(figsize=(14, 1.2 * cores + 2))
+    for s in history:
+        duration = s['end'] - s['start']
+        if s.get('kind') == 'switch':
+            ax.barh(s['core'], duration, left=s['start'], height=0.6,
+                    color='lightgrey', edgecolor='black', linewidth=0.5, hatch='//')
+            continue
+        ax.barh(s['core'], duration, left=s['start'], height=0.6,
+                color=color_map[s['pid']], edgecolor='black', linewidth=0.5)
+        if len(pids) <= 20:
+            ax.text(s['start'] + duration / 2, s['core'], s['pid'], ha='center', va='center', fontsize=8)
+
+    ax.set_yticks(range(cores))
+    speeds = result.get('speeds') or [1.0] * cores
+    if len(set(speeds)) > 1:
+        ax.set_yticklabels([f'CPU {c} (x{speeds[c]:g})' for c in range(cores)])
+    else:
+        ax.set_yticklabels([f'CPU {c}' for c in range(cores)])
+    ax.invert_yaxis()
+    ax.set_xlabel('Time')
+    ax.set_title(f"{result['algorithm']} on {cores} cores ({result['placement']} run queues)")
+    ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+
+    plt.tight_layout()
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    plt.savefig(output_file, bbox_inches='tight', dpi=100)
+    plt.close(fig)
+
+    logger.info(f"SMP Gantt chart saved to {output_file}")
+    return output_file
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate the scheduling algorithms on several cores.")
+    parser.add_argument('workload', nargs='?',
+                        help="processes.txt style file (default: ProcessGeneratorModule/processes.txt)")
+    parser.add_argument('--cores', type=int, nargs='+', default=[1, 2, 4],
+                        help="core counts to compare")
+    parser.add_argument('--speeds', type=float, nargs='+',
+                        help="speed factor of every core (e.g. 2 2 1 1); compares the core preferences")
+    parser.add_argument('--core-preference', choices=CORE_PREFERENCES,
+                        help="only run this core preference (with --speeds)")
+    parser.add_argument('--algorithms', nargs='+', default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument('--placement', choices=PLACEMENTS, default='global')
+    parser.add_argument('--no-stealing', action='store_true', help="disable work stealing (per-core placement)")
+    parser.add_argument('--balance-interval', type=float, default=None,
+                        help="periodic load balancing interval (per-core placement)")
+    parser.add_argument('--quantum', type=float, default=4.0, help="Round Robin time quantum")
+    parser.add_argument('--context-switch', type=float, default=0.0)
+    parser.add_argument('--cache-penalty', type=float, default=0.0)
+    parser.add_argument('--gantt', help="save per-core Gantt charts with this file prefix")
+    parser.add_argument('--json', help="write the study to this JSON file")
+    args = parser.parse_args()
+
+    file_path = args.workload or os.path.join(base_dir, "ProcessGeneratorModule", "processes.txt")
+    processes = read_workload(file_path)
+    if not processes:
+        logger.error("No processes found in the input file")
+        return None
+
+    options = dict(placement=args.placement, work_stealing=not args.no_stealing,
+                   balance_interval=args.balance_interval, time_quantum=args.quantum,
+                   context_switch=args.context_switch, cache_penalty=args.cache_penalty)
+    if args.speeds:
+        preferences = [args.core_preference] if args.core_preference else CORE_PREFERENCES
+        study = heterogeneity_study(processes, args.speeds, args.algorithms, preferences, **options)
+        column, title = 'preference', f"core speeds {' '.join(f'{s:g}' for s in args.speeds)}"
+        runs = [dict(speeds=args.speeds, core_preference=p) for p in preferences]
+    else:
+        study = scaling_study(processes, args.cores, args.algorithms, **options)
+        column, title = 'cores', 'SMP scaling'
+        runs = [dict(cores=max(args.cores))]
+
+    print(f"\n{title} ({args.placement} run queues, {len(processes)} processes)")
+    print("=" * 104)
+    print(f"{'Algorithm':<14} {column.capitalize():<15} {'Avg Waiting':<13} {'Avg Turnaround':<16} "
+          f"{'P95 Waiting':<13} {'Makespan':<10} {'Utilization':<12} {'Migrations':<10}")
+    print("-" * 104)
+    for algorithm, rows in study.items():
+        for row in rows:
+            print(f"{algorithm:<14} {row[column]:<15} {row['avg_waiting']:<13.2f} {row['avg_turnaround']:<16.2f} "
+                  f"{row['p95_waiting']:<13.2f} {row['makespan']:<10.2f} {row['utilization']:<12.1%} "
+                  f"{row['migrations']:<10}")
+    print("=" * 104)
+
+    if any(row[5] is not None for row in processes):
+        print(f"\nDeadlines ({len([row for row in processes if row[5] is not None])} processes with a deadline)")
+        print("=" * 70)
+        print(f"{'Algorithm':<14} {column.capitalize():<15} {'Miss Ratio':<13} {'Avg Lateness':<14}")
+        print("-" * 70)
+        for algorithm, rows in study.items():
+            for row in rows:
+                print(f"{algorithm:<14} {row[column]:<15} {row['deadline_miss_ratio']:<13.1%} "
+                      f"{row['avg_lateness']:<14.2f}")
+        print("=" * 70)
+
+    if any(row[4] for row in processes):
+        io = io_study(processes, args.algorithms, cores=min(args.cores), **options)
+        print(f"\nInteractive vs batch on {min(args.cores)} core(s) (CPU/I/O bursts)")
+        print("=" * 90)
+        print(f"{'Algorithm':<14} {'Class':<12} {'Count':<7} {'Burst Response':<16} {'Avg Waiting':<13} "
+              f"{'Avg Turnaround':<16}")
+        print("-" * 90)
+        for algorithm, classes in io.items():
+            for name, row in classes.items():
+                print(f"{algorithm:<14} {name:<12} {row['count']:<7} {row['avg_burst_response']:<16.2f} "
+                      f"{row['avg_waiting']:<13.2f} {row['avg_turnaround']:<16.2f}")
+        print("=" * 90)
+        study = {'scaling': study, 'io': io}
+
+    if args.gantt:
+        for algorithm in args.algorithms:
+            for run in runs:
+                result = simulate_smp(processes, algorithm, **run, **options)
+                name = algorithm.lower().replace(' ', '_')
+                suffix = run.get('core_preference') or f"{result['cores']}cores"
+                plot_smp_gantt(result, f"{args.gantt}_{name}_{suffix}.png")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(study, f, indent=2)
+        logger.info(f"SMP study written to {args.json}")
+    return study
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(current_dir)
+
+# Cold start targets: the command run in a fresh interpreter, from the project root
+TARGETS = {
+    'app': ['-c', 'import app'],
+    'performance_analysis': ['-c', 'import Schedulers.performance_analysis'],
+    'monte_carlo CLI': [os.path.join('Schedulers', 'monte_carlo.py'), '--help'],
+    'quantum_sweep CLI': [os.path.join('Schedulers', 'quantum_sweep.py'), '--help'],
+    'quantum_optimizer CLI': [os.path.join('Schedulers', 'quantum_optimizer.py'), '--help'],
+    'smp CLI': [os.path.join('Schedulers', 'smp.py'), '--help'],
+    'benchmark CLI': [os.path.join('Schedulers', 'benchmark.py'), '--help']
+}
+
+# Modules whose presence in a cold start is reported
+HEAVY_MODULES = ['matplotlib', 'numpy', 'flask']
+
+def parse_importtime(stderr):
+    """
+    Cumulative import time in microseconds of every top-level package from `python -X importtime` output.
+    - A package is imported once per process, so its own line holds everything it pulled in, at
+      whatever depth it was first imported
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or line.count('|') != 2:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if not cumulative.strip().isdigit() or '.' in name:
+            continue
+        modules[name] = max(modules.get(name, 0), int(cumulative))
+    return modules
+
+def measure(command, repetitions=5, cwd=base_dir):
+    """
+    Wall-clock time of a command in fresh interpreters, plus its import profile.
+    - Every repetition starts a new process, so nothing is cached in sys.modules
+    - The OS file cache is warm after the first run; the first run is discarded
+    """
+    times = []
+    modules = {}
+    for i in range(repetitions + 1):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', *command], cwd=cwd,
+                                capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(command)} failed: {result.stderr.strip().splitlines()[-1:]}")
+        if i > 0:
+            times.append(elapsed)
+            modules = parse_importtime(result.stderr)
+    return {
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'imports': sorted(modules.items(), key=lambda item: item[1], reverse=True)[:8],
+        'heavy': [name for name in HEAVY_MODULES if name in modules]
+    }
+
+def run_startup_benchmark(targets=None, repetitions=5):
+    """Cold start time of every target; returns {target: measurement}."""
+    results = {}
+    for name in targets or TARGETS:
+        logger.info(f"Measuring {name}")
+        results[name] = measure(TARGETS[name], repetitions)
+    return results
+
+def print_startup_benchmark(results):
+    print(f"\n{'Target':<24} {'Median (ms)':>12} {'Min (ms)':>10}  Heavy imports")
+    print("-" * 72)
+    for name, row in results.items():
+        print(f"{name:<24} {row['median'] * 1000:>12.1f} {row['min'] * 1000:>10.1f}  {', '.join(row['heavy']) or '-'}")
+    for name, row in results.items():
+        print(f"\n{name}: slowest imports (cumulative ms)")
+        for module, micros in row['imports']:
+            print(f"  {module:<30} {micros / 1000:>8.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold start (import) time of the web app and the CLIs")
+    parser.add_argument('--targets', nargs='+', choices=list(TARGETS), help="targets to measure (default: all)")
+    parser.add_argument('--repetitions', type=int, default=5, help="fresh interpreters per target")
+    parser.add_argument('--json', help="write the measurements to a JSON file")
+    args = parser.parse_args()
+
+    results = run_startup_benchmark(args.targets, args.repetitions)
+    print_startup_benchmark(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        logger.info(f"Startup benchmark written to {args.json}")
+
+if __name__ == '__main__':
+    main()
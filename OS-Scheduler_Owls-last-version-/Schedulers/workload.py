@@ -0,0 +1,136 @@
+import os
+import random
+import argparse
+
+# Marks a missing optional column in processes.txt
+MISSING = '-'
+
+def parse_bursts(text):
+    """
+    Parse the optional Bursts column of processes.txt.
+    - CPU and I/O burst lengths alternate and are separated by '/', starting and ending
+      with a CPU burst: '3/4/2' is 3 units of CPU, 4 of I/O, then 2 of CPU
+    - Returns None for an empty or '-' column (the process is a single CPU burst)
+    """
+    if not text or text == MISSING:
+        return None
+    cycle = [float(x) for x in text.split('/')]
+    if len(cycle) % 2 == 0:
+        raise ValueError(f"Bursts must start and end with a CPU burst: {text}")
+    if any(x < 0 for x in cycle):
+        raise ValueError(f"Burst lengths must not be negative: {text}")
+    return cycle
+
+def format_bursts(cycle):
+    """Inverse of parse_bursts ('-' for a single CPU burst)."""
+    if not cycle or len(cycle) == 1:
+        return MISSING
+    return '/'.join(f"{x:g}" for x in cycle)
+
+def cpu_bursts(cycle):
+    """The CPU bursts of a CPU/I/O cycle."""
+    return cycle[0::2]
+
+def parse_deadline(text):
+    """
+    Parse the optional Deadline column of processes.txt.
+    - The deadline is relative to the arrival time: a process arriving at 4 with
+      deadline 10 must complete by time 14
+    - Returns None for an empty or '-' column (the process has no deadline)
+    """
+    if not text or text == MISSING:
+        return None
+    deadline = float(text)
+    if deadline < 0:
+        raise ValueError(f"Deadline must not be negative: {text}")
+    return deadline
+
+def format_deadline(deadline):
+    """Inverse of parse_deadline ('-' for no deadline)."""
+    return MISSING if deadline is None else f"{deadline:g}"
+
+def read_workload(file_path):
+    """
+    Read processes.txt as (pid, arrival, burst, priority, bursts, deadline) rows.
+    bursts is the CPU/I/O cycle of the optional Bursts column, or None; when it is
+    given, burst is the total CPU time of the cycle.
+    deadline is the relative deadline of the optional Deadline column, or None.
+    """
+    rows = []
+    try:
+        with open(file_path, 'r') as file:
+            # Skip the header line
+            next(file)
+            for line in file:
+                data = [x for x in line.strip().split() if x]
+                if len(data) >= 4:
+                    cycle = parse_bursts(data[4]) if len(data) >= 5 else None
+                    burst = sum(cpu_bursts(cycle)) if cycle else float(data[2])
+                    deadline = parse_deadline(data[5]) if len(data) >= 6 else None
+                    rows.append((data[0], float(data[1]), burst, int(data[3]), cycle, deadline))
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    return rows
+
+def generate_io_workload(seed=0, interactive=5, batch=3, max_arrival=15):
+    """
+    Generate a mix of interactive (I/O-bound) and batch (CPU-bound) processes.
+    - Interactive processes alternate short CPU bursts (1-3) with long I/O (5-15)
+    - Batch processes run long CPU bursts (10-25) with rare, short I/O (1-3)
+    Returns (pid, arrival, burst, priority, bursts) rows; interactive processes get
+    the better (lower) priorities.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(interactive + batch):
+        is_interactive = i < interactive
+        if is_interactive:
+            count = rng.randint(3, 6)
+            cycle = []
+            for n in range(count):
+                cycle.append(rng.randint(1, 3))
+                if n < count - 1:
+                    cycle.append(rng.randint(5, 15))
+            priority = rng.randint(1, 3)
+        else:
+            count = rng.randint(1, 3)
+            cycle = []
+            for n in range(count):
+                cycle.append(rng.randint(10, 25))
+                if n < count - 1:
+                    cycle.append(rng.randint(1, 3))
+            priority = rng.randint(4, 8)
+        rows.append((f"P{i + 1}", rng.randint(0, max_arrival), sum(cpu_bursts(cycle)), priority, cycle))
+    return rows
+
+def write_workload(rows, file_path):
+    """
+    Write (pid, arrival, burst, priority, bursts[, deadline]) rows in the processes.txt
+    format with a Bursts column, and a Deadline column when any row has a deadline.
+    """
+    with_deadlines = any(len(row) > 5 and row[5] is not None for row in rows)
+    with open(file_path, 'w') as f:
+        header = f"{'Process ID':<15}{'Arrival Time':<15}{'Burst Time':<15}{'Priority':<15}{'Bursts':<15}"
+        f.write(header + (f"{'Deadline':<15}" if with_deadlines else "") + "\n")
+        for pid, arrival, burst, priority, cycle, *deadline in rows:
+            line = f"{pid:<15}{arrival:<15g}{burst:<15g}{priority:<15}{format_bursts(cycle):<15}"
+            if with_deadlines:
+                line += f"{format_deadline(deadline[0] if deadline else None):<15}"
+            f.write(line + "\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a workload of alternating CPU and I/O bursts.")
+    parser.add_argument('--interactive', type=int, default=5, help="number of I/O-bound processes")
+    parser.add_argument('--batch', type=int, default=3, help="number of CPU-bound processes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                         "ProcessGeneratorModule", "io_processes.txt"))
+    args = parser.parse_args()
+
+    rows = generate_io_workload(args.seed, args.interactive, args.batch)
+    write_workload(rows, args.output)
+    print(f"Wrote {len(rows)} processes to {args.output}")
+
+if __name__ == "__main__":
+    main()
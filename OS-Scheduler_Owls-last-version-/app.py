@@ -1,20 +1,29 @@
-from flask import Flask, render_template, redirect, url_for, request, send_file
+from flask import Flask, render_template, redirect, url_for, request, send_file, g, abort
 import subprocess
 import os
 import time
 from functools import lru_cache
+from contextlib import nullcontext
 import sys
 import random
 import numpy as np
 import math
-from performance_analysis2 import plot_comparison
+from Schedulers.metrics import tail_summary, deadline_metrics
+from Schedulers.results_file import parse_results
+from Schedulers import profiling
+from Schedulers.profiling import phase
+from Schedulers.artifacts import default_store
+from Schedulers import registry as scheduler_registry
+from service_metrics import Registry, CacheInfoCollector, EventCounts, CallbackGauge
+from single_flight import SingleFlight
 from datetime import datetime
 import base64
 from io import BytesIO
-import matplotlib.pyplot as plt
 import logging
 import glob
-import shutil
+import json
+import hashlib
+import threading
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -23,32 +32,61 @@ logger = logging.getLogger(__name__)
 # Get the base directory path
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# SCHEDULER_PROFILE=1 collects phase timings for every run; ?profile=1 on a page profiles one run
+PROFILE_ENABLED = os.environ.get(profiling.ENV_ENABLE, '') not in ('', '0')
+# Charts and cProfile dumps, bounded by SCHEDULER_ARTIFACT_BUDGET with least recently used eviction
+ARTIFACTS = default_store()
+
+# Operational metrics served on /metrics in the Prometheus text format
+METRICS = Registry()
+REQUEST_LATENCY = METRICS.histogram('scheduler_http_request_duration_seconds',
+                                    'HTTP request latency by route, method and status',
+                                    ('route', 'method', 'status'))
+SCHEDULER_RUN_DURATION = METRICS.histogram('scheduler_run_duration_seconds',
+                                           'Scheduler runs (script subprocess and result parsing) by algorithm',
+                                           ('algorithm',), buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0))
+SCHEDULER_FAILURES = METRICS.counter('scheduler_run_failures',
+                                     'Failed scheduler runs and comparisons by algorithm and reason',
+                                     ('algorithm', 'reason'))
+CHART_RENDER = METRICS.histogram('scheduler_chart_render_seconds', 'Chart rendering time by chart', ('chart',),
+                                 buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0))
+# Hits and misses of caches that are not lru_cache functions (those are read at scrape time)
+CACHE_EVENTS = EventCounts()
+METRICS.register(CallbackGauge('scheduler_artifact_bytes', 'Size of the artifact store in bytes',
+                               lambda: ARTIFACTS.usage()[1]))
+METRICS.register(CallbackGauge('scheduler_artifact_budget_bytes', 'Byte budget of the artifact store',
+                               lambda: ARTIFACTS.budget))
+
+# Concurrent requests for the same run (workload, script or comparison, and parameters) share one computation
+IN_FLIGHT = SingleFlight()
+COALESCED_REQUESTS = METRICS.counter('scheduler_coalesced_requests',
+                                     'Requests served by joining an identical in-flight computation, by operation',
+                                     ('operation',))
+METRICS.register(CallbackGauge('scheduler_in_flight_computations', 'Scheduler runs and comparisons in flight',
+                               IN_FLIGHT.in_flight))
+# One lock per scheduler script (see script_lock)
+SCRIPT_LOCKS = {}
+SCRIPT_LOCKS_GUARD = threading.Lock()
+
 # Create Flask app
 app = Flask(__name__)
-app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0  # Disable caching for static files
+# Plain static URLs are revalidated on every use (ETag / Last-Modified, 304 when unchanged);
+# charts are linked through content-hashed /charts/ URLs that can be cached forever
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = None
+CHART_MAX_AGE = 365 * 24 * 3600
+
+# A Monte Carlo comparison runs in the request thread, so the web path gets far fewer workloads
+# than the CLI; early stopping usually ends it before this many
+WEB_MONTE_CARLO_MAX_RUNS = 200
 
 # Add static folder configuration
 app.static_folder = os.path.join(BASE_DIR, 'static')
 app.static_url_path = '/static'
 
-# Create a symbolic link from static/Schedulers to Schedulers directory
-schedulers_static_dir = os.path.join(app.static_folder, 'Schedulers')
-schedulers_dir = os.path.join(BASE_DIR, 'Schedulers')
-
 # Ensure static directory exists
 if not os.path.exists(app.static_folder):
     os.makedirs(app.static_folder)
 
-# Create symbolic link if it doesn't exist
-if not os.path.exists(schedulers_static_dir):
-    try:
-        os.symlink(schedulers_dir, schedulers_static_dir)
-    except Exception as e:
-        logger.warning(f"Could not create symbolic link: {e}")
-        # If symlink fails, try to copy the directory
-        if os.path.exists(schedulers_dir):
-            shutil.copytree(schedulers_dir, schedulers_static_dir)
-
 # Ensure required directories exist
 for dir_name in ['ProcessGeneratorModule', 'Schedulers', 'templates', 'static']:
     dir_path = os.path.join(BASE_DIR, dir_name)
@@ -56,6 +94,20 @@ for dir_name in ['ProcessGeneratorModule', 'Schedulers', 'templates', 'static']:
         logger.warning(f"Directory {dir_path} does not exist, creating it...")
         os.makedirs(dir_path, exist_ok=True)
 
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_latency(response):
+    start = g.pop('request_start', None)
+    if start is not None:
+        # The route pattern, not the path, keeps the number of label values bounded
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_LATENCY.observe(time.perf_counter() - start, route=route, method=request.method,
+                                status=response.status_code)
+    return response
+
 def generate_new_processes():
     """Generate new processes and write them directly to processes.txt"""
     try:
@@ -72,6 +124,10 @@ def generate_new_processes():
         lambda_priority = random.uniform(4, 10)
         priorities = np.random.poisson(lambda_priority, num_processes)
         priorities = [max(1, int(p)) for p in priorities]  # Ensure priorities are at least 1
+
+        # Relative deadlines of 1 to deadline_slack times the burst time
+        deadline_slack = random.uniform(1.5, 4)
+        deadlines = [round(b * random.uniform(1, deadline_slack), 1) for b in burst_times]
         
         # Calculate statistics
         arrival_mean = np.mean(arrival_times)
@@ -91,6 +147,7 @@ def generate_new_processes():
                 f.write(f"Mean and Standard Deviation for Arrival Time: ({arrival_mean:.1f}, {arrival_std:.1f})\n")
                 f.write(f"Mean and Standard Deviation for Burst Time: ({burst_mean:.1f}, {burst_std:.1f})\n")
                 f.write(f"Lambda Priority: {lambda_priority:.1f}\n")
+                f.write(f"Deadline Slack Factor: {deadline_slack:.1f}\n")
         except IOError as e:
             print(f'Error writing to input file: {e}')
             return False
@@ -99,9 +156,11 @@ def generate_new_processes():
         processes_file = os.path.join(process_dir, 'processes.txt')
         try:
             with open(processes_file, 'w') as f:
-                f.write(f"{'Process ID':<15}{'Arrival Time':<15}{'Burst Time':<15}{'Priority':<15}\n")
+                f.write(f"{'Process ID':<15}{'Arrival Time':<15}{'Burst Time':<15}{'Priority':<15}"
+                        f"{'Bursts':<15}{'Deadline':<15}\n")
                 for i in range(1, num_processes + 1):  # Start from 1 and go to num_processes
-                    f.write(f"P{i:<14}{arrival_times[i-1]:<15}{burst_times[i-1]:<15}{priorities[i-1]:<15}\n")
+                    f.write(f"P{i:<14}{arrival_times[i-1]:<15}{burst_times[i-1]:<15}{priorities[i-1]:<15}"
+                            f"{'-':<15}{deadlines[i-1]:<15}\n")
         except IOError as e:
             print(f'Error writing to processes file: {e}')
             return False
@@ -142,7 +201,9 @@ def read_processes():
                                 'process_id': data[0],
                                 'arrival_time': float(data[1]),
                                 'burst_time': float(data[2]),
-                                'priority': int(data[3])
+                                'priority': int(data[3]),
+                                # Optional relative deadline ('-' or missing for none)
+                                'deadline': float(data[5]) if len(data) >= 6 and data[5] != '-' else None
                             })
                         except (ValueError, IndexError) as e:
                             print(f'Error parsing process data: {e}')
@@ -158,7 +219,8 @@ def read_input_params():
         'processes_number': 'N/A',
         'arrival_time_stats': 'N/A',
         'burst_time_stats': 'N/A',
-        'lambda_priority': 'N/A'
+        'lambda_priority': 'N/A',
+        'deadline_slack': 'N/A'
     }
     
     # First try to get number of processes from processes.txt
@@ -195,122 +257,245 @@ def read_input_params():
                             default_params['burst_time_stats'] = line.split(':')[1].strip()
                         elif 'Lambda Priority:' in line:
                             default_params['lambda_priority'] = line.split(':')[1].strip()
+                        elif 'Deadline Slack Factor:' in line:
+                            default_params['deadline_slack'] = line.split(':')[1].strip()
     except Exception as e:
         print(f'Error reading input file: {e}')
         
     return default_params
 
-# Cache the scheduler results for 5 seconds
-@lru_cache(maxsize=4)
+def workload_version():
+    """Modification time and size of processes.txt, so runs on different workloads are never shared."""
+    try:
+        stat = os.stat(os.path.join(BASE_DIR, 'ProcessGeneratorModule', 'processes.txt'))
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def single_flight(operation, key, function, *args, **kwargs):
+    """
+    Call function(*args, **kwargs), or wait for the identical call already running and share its result.
+    - key must hold every parameter the result depends on besides the workload, which is added here
+    """
+    result, shared = IN_FLIGHT.do((operation, workload_version()) + tuple(key), function, *args, **kwargs)
+    if shared:
+        COALESCED_REQUESTS.inc(operation=operation)
+    return result
+
+# Cache the results of every scheduler page (plugins are registered by the time the app is imported)
+@lru_cache(maxsize=len(scheduler_registry.schedulers()))
 def run_scheduler(scheduler_name):
+    return shared_run(scheduler_name, 'profile' if PROFILE_ENABLED else 'plain')
+
+def scheduler_output(scheduler_name):
+    """The cached results of a scheduler page, or a fresh profiled run when it is opened with ?profile=1."""
+    if request.args.get('profile'):
+        return shared_run(scheduler_name, 'pstats')
+    return run_scheduler(scheduler_name)
+
+def shared_run(scheduler_name, mode):
+    """
+    The results of one scheduler from a run of its script, shared with concurrent requests for the same run.
+    - mode is 'plain', 'profile' (phase timers) or 'pstats' (phase timers and cProfile)
+    - Requests are coalesced per script and mode: SJF and Priority (NP) share a script, as do
+      Lottery and Stride, and one run returns the results of both
+    - Runs in different modes are not shared, but execute_scheduler never lets them overlap
+    """
+    scheduler = scheduler_registry.get(scheduler_name)
+    if mode == 'plain':
+        outputs = single_flight('scheduler', (scheduler.script, mode), execute_scheduler, scheduler.slug)
+    else:
+        outputs = single_flight('scheduler', (scheduler.script, mode), profile_scheduler, scheduler.slug,
+                                capture_pstats=mode == 'pstats')
+    return outputs.get(scheduler.slug) if outputs else None
+
+def profile_scheduler(scheduler_name, capture_pstats=False):
+    """
+    Run a scheduler with the phase timers on and attach them as results['profile'].
+    - Returns {slug: results} like execute_scheduler; every scheduler of the script gets the profile
+    - The script's own phases (parse, schedule, render, write) are reported from the
+      subprocess and listed under 'subprocess/'
+    - capture_pstats=True also runs the script under cProfile and keeps the dump
+    """
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    report_file = ARTIFACTS.path(f'profiles/{scheduler_name}_{stamp}.json')
+    stats_name = f'profiles/{scheduler_name}_{stamp}.prof'
+    stats_file = ARTIFACTS.path(stats_name) if capture_pstats else None
+
+    with profiling.collect() as timer:
+        outputs = execute_scheduler(scheduler_name, report_file=report_file, stats_file=stats_file)
+    if outputs is None:
+        return None
+
     try:
-        # Map scheduler names to their scripts and result files
-        scheduler_map = {
-            'fcfs': ('FCFS&SRTF', 'FCFS.py', 'FCFS&SRTF/fcfs_results.txt'),
-            'srtf': ('FCFS&SRTF', 'SRTF.py', 'FCFS&SRTF/srtf_results.txt'),
-            'priority': ('Priority&RoundRobin', 'priority.py', 'Priority&RoundRobin/priority_results.txt'),
-            'round_robin': ('Priority&RoundRobin', 'round_robin.py', 'Priority&RoundRobin/round_robin_results.txt')
-        }
-        
-        if scheduler_name not in scheduler_map:
+        with open(report_file) as f:
+            timer.merge(json.load(f), prefix='subprocess/')
+        os.remove(report_file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"No phase timings from the {scheduler_name} script: {e}")
+    profile = profile_summary(timer, scheduler_name)
+    if stats_file and os.path.exists(stats_file):
+        ARTIFACTS.add(stats_name)
+        profile['pstats_file'] = stats_file
+        profile['pstats'] = profiling.pstats_summary(stats_file)
+        logger.info(f"{scheduler_name} cProfile data written to {stats_file}")
+    for results in outputs.values():
+        if results is not None:
+            results['profile'] = profile
+    return outputs
+
+def request_profiler():
+    """Phase timer for the current request when profiling is on (SCHEDULER_PROFILE or ?profile=1)."""
+    if PROFILE_ENABLED or request.args.get('profile'):
+        return profiling.collect()
+    return nullcontext()
+
+def profile_summary(timer, label):
+    """Log a request's phase timings and return them in the form the templates show."""
+    if timer is None:
+        return None
+    report = timer.report()
+    logger.info(f"{label} phase timings:\n{profiling.format_report(report)}")
+    return {
+        'phases': [dict(stats, name=name) for name, stats in report['phases'].items()],
+        'counters': report['counters']
+    }
+
+def script_lock(scheduler_name):
+    """The lock that serializes every run of a scheduler's script, whatever scheduler or mode started it."""
+    try:
+        script = scheduler_registry.get(scheduler_name).script
+    except KeyError:
+        script = scheduler_name
+    with SCRIPT_LOCKS_GUARD:
+        return SCRIPT_LOCKS.setdefault(script, threading.Lock())
+
+def execute_scheduler(scheduler_name, report_file=None, stats_file=None):
+    """
+    Run a scheduler script in a subprocess and parse the results file of every scheduler it writes.
+    - Returns {slug: results} (None for a results file that could not be read), or None when the run failed
+    - report_file turns the script's phase timers on and receives them as JSON
+    - stats_file runs the script under cProfile and dumps the pstats data there
+    - Runs of the same script never overlap: it rewrites fixed results files
+    - The duration is recorded per algorithm and every failure is counted with its reason
+    """
+    with script_lock(scheduler_name), SCHEDULER_RUN_DURATION.time(algorithm=scheduler_name):
+        return _execute_scheduler(scheduler_name, report_file, stats_file)
+
+def _execute_scheduler(scheduler_name, report_file, stats_file):
+    try:
+        # The registry knows each scheduler's script and the results file it writes
+        try:
+            scheduler = scheduler_registry.get(scheduler_name)
+        except KeyError:
+            scheduler = None
+        if scheduler is None or scheduler.script is None:
             print(f'Error: Unknown scheduler {scheduler_name}')
+            SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='unknown_scheduler')
             return None
-            
-        scheduler_dir, script_name, result_file = scheduler_map[scheduler_name]
-        script_path = os.path.join(BASE_DIR, 'Schedulers', scheduler_dir, script_name)
-        result_path = os.path.join(BASE_DIR, 'Schedulers', result_file)
+
+        script_path = os.path.join(BASE_DIR, 'Schedulers', scheduler.script)
 
         # Check if scheduler script exists
         if not os.path.exists(script_path):
             print(f'Error: Scheduler script {script_path} not found')
+            SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='missing_script')
             return None
 
         # Check if processes.txt exists
         processes_file = os.path.join(BASE_DIR, 'ProcessGeneratorModule', 'processes.txt')
         if not os.path.exists(processes_file):
             print('Error: processes.txt not found')
+            SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='missing_processes')
             return None
 
+        command = [sys.executable, script_path]
+        env = None
+        if stats_file:
+            command = [sys.executable, '-m', 'cProfile', '-o', stats_file, script_path]
+        if report_file:
+            env = dict(os.environ, **{profiling.ENV_ENABLE: '1', profiling.ENV_OUTPUT: report_file})
+
         # Run the scheduler script with timeout
         try:
-            result = subprocess.run(
-                [sys.executable, script_path],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=5  # 5 second timeout
-            )
+            with phase('subprocess'):
+                result = subprocess.run(
+                    command,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=5,  # 5 second timeout
+                    env=env
+                )
             
             if result.returncode != 0:
                 print(f'Error running {scheduler_name}: {result.stderr}')
+                SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='error')
                 return None
                 
         except subprocess.TimeoutExpired:
             print(f'Error: {scheduler_name} execution timed out')
+            SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='timeout')
             return None
         except subprocess.CalledProcessError as e:
             print(f'Error running {scheduler_name}: {e}')
+            SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='error')
             return None
             
-        # Read and parse the results
-        if os.path.exists(result_path):
-            try:
-                with open(result_path, 'r') as f:
-                    lines = f.readlines()
-                    if not lines:
-                        print(f'Error: Result file {result_path} is empty')
-                        return None
-                    
-                    # Parse the results into a structured format
-                    results = {
-                        'processes': [],
-                        'averages': {
-                            'waiting': 0.0,
-                            'turnaround': 0.0
-                        }
-                    }
-                    
-                    # Skip header and separator lines
-                    for line in lines[2:]:
-                        line = line.strip()
-                        if not line:
-                            continue
-                            
-                        # Check if this is an average line
-                        if 'Average' in line:
-                            if 'Waiting Time:' in line:
-                                results['averages']['waiting'] = float(line.split(':')[1].strip())
-                            elif 'Turnaround Time:' in line:
-                                results['averages']['turnaround'] = float(line.split(':')[1].strip())
-                            continue
-                            
-                        # Parse process data
-                        data = line.split()
-                        if len(data) >= 6:  # Make sure we have all required fields
-                            try:
-                                process = {
-                                    'pid': data[0],
-                                    'arrival': float(data[1]),
-                                    'burst': float(data[2]),
-                                    'completion': float(data[3]),
-                                    'turnaround': float(data[4]),
-                                    'waiting': float(data[5])
-                                }
-                                results['processes'].append(process)
-                            except (ValueError, IndexError) as e:
-                                print(f'Error parsing process data: {e}')
-                                continue
-                    
-                    return results
-            except IOError as e:
-                print(f'Error reading result file: {e}')
-                return None
-        else:
-            print(f'Error: Result file {result_path} not found')
-            return None
-            
+        # The script may write the results of several schedulers (SJF and Priority (NP), Lottery and Stride)
+        return {sibling.slug: read_results(sibling.slug, os.path.join(BASE_DIR, 'Schedulers', sibling.results_file))
+                for sibling in scheduler_registry.schedulers() if sibling.script == scheduler.script}
+
     except Exception as e:
         print(f'Unexpected error in {scheduler_name}: {e}')
+        SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='exception')
+        return None
+
+def read_results(scheduler_name, result_path):
+    """Parse the results file a scheduler script wrote; None (counted as a failure) when it is missing or unreadable."""
+    # Read and parse the results
+    if os.path.exists(result_path):
+        try:
+            with phase('read results'), open(result_path, 'r') as f:
+                lines = f.readlines()
+                if not lines:
+                    print(f'Error: Result file {result_path} is empty')
+                    SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='empty_results')
+                    return None
+
+                # Parse the results into a structured format; the columns are found by their headings
+                processes, averages = parse_results(lines)
+                results = {
+                    'processes': processes,
+                    'averages': {
+                        'waiting': averages.get('waiting', 0.0),
+                        'turnaround': averages.get('turnaround', 0.0)
+                    }
+                }
+
+            # Tail latency, so starvation of long jobs is visible next to the averages
+            with phase('metrics'):
+                results['tail'] = {
+                    'waiting': tail_summary([p['waiting'] for p in results['processes']]),
+                    'turnaround': tail_summary([p['turnaround'] for p in results['processes']])
+                }
+                if results['processes'] and all('response' in p for p in results['processes']):
+                    results['tail']['response'] = tail_summary([p['response'] for p in results['processes']])
+
+                # Deadline misses and lateness when processes.txt has a Deadline column
+                deadlines = {p['process_id']: p['arrival_time'] + p['deadline']
+                             for p in read_processes() if p.get('deadline') is not None}
+                if deadlines:
+                    results['deadlines'] = deadline_metrics(results['processes'], deadlines)
+
+            return results
+        except (IOError, ValueError) as e:
+            print(f'Error reading result file: {e}')
+            SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='unreadable_results')
+            return None
+    else:
+        print(f'Error: Result file {result_path} not found')
+        SCHEDULER_FAILURES.inc(algorithm=scheduler_name, reason='missing_results')
         return None
 
 @app.route('/')
@@ -319,10 +504,8 @@ def index():
         # Get processes
         processes = read_processes()
         
-        # Get the comparison image from static directory
-        static_dir = os.path.join(BASE_DIR, 'static')
-        comparison_path = os.path.join(static_dir, 'scheduling_comparison.png')
-        has_comparison = os.path.exists(comparison_path)
+        # Get the comparison image from the artifact store
+        has_comparison = ARTIFACTS.find('scheduling_comparison.png') is not None
             
         # Get input parameters
         input_params = read_input_params()
@@ -331,120 +514,102 @@ def index():
                              processes=processes,
                              input_params=input_params,
                              has_comparison=has_comparison,
-                             timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"))
+                             schedulers=scheduler_pages(),
+                             page_style=page_style)
     except Exception as e:
         logger.error(f"Error in index route: {e}")
         return render_template('index.html', 
                              processes=[],
                              input_params=read_input_params(),
                              has_comparison=False,
-                             timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"),
+                             schedulers=scheduler_pages(),
+                             page_style=page_style,
                              error=str(e))
 
-@app.route('/fcfs')
-def fcfs():
-    try:
-        processes = read_processes()
-        if not processes:
-            return render_template('fcfs.html', processes=[], params={}, fcfs_output=None)
-            
-        params = read_input_params()
-        fcfs_output = run_scheduler('fcfs')
+# Icons and colours of the scheduler pages and their index buttons; other schedulers use DEFAULT_PAGE_STYLE
+DEFAULT_PAGE_STYLE = {'icon': 'bi-cpu', 'button': 'btn-outline-secondary', 'button_color': None, 'header': '#198754',
+                      'header_text': '#fff'}
+PAGE_STYLES = {
+    'fcfs': {'icon': 'bi-clock-history', 'button': 'btn-success', 'header': '#28a745'},
+    'srtf': {'icon': 'bi-lightning-charge', 'button': 'btn-warning', 'header': '#ffc107', 'header_text': '#000'},
+    'priority': {'icon': 'bi-list-ol', 'button': 'btn-info text-white', 'header': '#0d6efd'},
+    'round_robin': {'icon': 'bi-arrow-repeat', 'button': 'text-white', 'button_color': '#6f42c1'},
+    'mlfq': {'icon': 'bi-layers', 'button': 'btn-dark'},
+    'cfs': {'icon': 'bi-sliders', 'button': 'btn-danger'},
+    'sjf': {'icon': 'bi-sort-numeric-down', 'button': 'btn-outline-success'},
+    'priority_np': {'icon': 'bi-sort-down', 'button': 'btn-outline-info'},
+    'lottery': {'icon': 'bi-ticket-perforated', 'button': 'btn-outline-warning'},
+    'stride': {'icon': 'bi-signpost-split', 'button': 'btn-outline-danger'},
+    'edf': {'icon': 'bi-alarm', 'button': 'btn-outline-dark'},
+}
 
-        # Copy Gantt chart to static folder
-        src_path = os.path.join(BASE_DIR, 'Schedulers', 'FCFS&SRTF', 'fcfs_gantt.png')
-        dst_dir = os.path.join(BASE_DIR, 'static', 'Schedulers', 'FCFS&SRTF')
-        dst_path = os.path.join(dst_dir, 'fcfs_gantt.png')
-        
-        # Create static directory structure if it doesn't exist
-        os.makedirs(dst_dir, exist_ok=True)
-        
-        # Copy the file if it exists
-        if os.path.exists(src_path):
-            shutil.copy2(src_path, dst_path)
-            logger.info(f"FCFS Gantt chart copied from {src_path} to {dst_path}")
-        else:
-            logger.warning(f"FCFS Gantt chart not found at {src_path}")
-        
-        return render_template('fcfs.html', processes=processes, params=params, fcfs_output=fcfs_output)
-    except Exception as e:
-        logger.error(f'Error in fcfs route: {e}')
-        return render_template('fcfs.html', processes=[], params={}, fcfs_output=None)
+def page_style(scheduler):
+    return dict(DEFAULT_PAGE_STYLE, **PAGE_STYLES.get(scheduler.slug, {}))
 
-@app.route('/srtf')
-def srtf():
-    try:
-        processes = read_processes()
-        if not processes:
-            return render_template('srtf.html', processes=[], params={}, srtf_output=None)
-            
-        params = read_input_params()
-        srtf_output = run_scheduler('srtf')
+def scheduler_pages():
+    """The schedulers with a web page (those the app can run as a script), in registry order."""
+    return [scheduler for scheduler in scheduler_registry.schedulers() if scheduler.script]
 
-        # Copy Gantt chart to static folder
-        src_path = os.path.join(BASE_DIR, 'Schedulers', 'FCFS&SRTF', 'srtf_gantt.png')
-        dst_dir = os.path.join(BASE_DIR, 'static', 'Schedulers', 'FCFS&SRTF')
-        dst_path = os.path.join(dst_dir, 'srtf_gantt.png')
-        
-        # Create static directory structure if it doesn't exist
-        os.makedirs(dst_dir, exist_ok=True)
-        
-        # Copy the file if it exists
-        if os.path.exists(src_path):
-            shutil.copy2(src_path, dst_path)
-            logger.info(f"SRTF Gantt chart copied from {src_path} to {dst_path}")
-        else:
-            logger.warning(f"SRTF Gantt chart not found at {src_path}")
-
-        return render_template('srtf.html', processes=processes, params=params, srtf_output=srtf_output)
-    except Exception as e:
-        logger.error(f'Error in srtf route: {e}')
-        return render_template('srtf.html', processes=[], params={}, srtf_output=None)
+@app.route('/round-robin')
+def round_robin_redirect():
+    # The Round Robin page was served here before the pages were named after the registry slugs
+    return redirect(url_for('scheduler_page', slug='round_robin'), code=301)
 
-@app.route('/priority')
-def priority():
+@app.route('/<slug>')
+def scheduler_page(slug):
     try:
-        processes = read_processes()
-        if not processes:
-            return render_template('priority.html', processes=[], params={}, priority_output=None)
-            
-        params = read_input_params()
-        priority_output = run_scheduler('priority')
-        return render_template('priority.html', processes=processes, params=params, priority_output=priority_output)
-    except Exception as e:
-        print(f'Error in priority route: {e}')
-        return render_template('priority.html', processes=[], params={}, priority_output=None)
-
-@app.route('/round-robin')
-def round_robin():
+        scheduler = scheduler_registry.get(slug)
+    except KeyError:
+        abort(404)
+    if not scheduler.script:
+        abort(404)
+    style = page_style(scheduler)
     try:
         processes = read_processes()
         if not processes:
-            return render_template('round_robin.html', processes=[], params={}, round_robin_output=None)
-            
+            return render_template('scheduler.html', scheduler=scheduler, style=style, processes=[], params={},
+                                   output=None)
+
         params = read_input_params()
-        round_robin_output = run_scheduler('round_robin')
-        return render_template('round_robin.html', processes=processes, params=params, round_robin_output=round_robin_output)
+        output = scheduler_output(scheduler.slug)
+
+        # The script saves its chart into the artifact store, which the page links to
+        if scheduler.chart and ARTIFACTS.find(scheduler.chart) is None:
+            logger.warning(f"{scheduler.name} chart not found in {ARTIFACTS.root}")
+
+        return render_template('scheduler.html', scheduler=scheduler, style=style, processes=processes,
+                               params=params, output=output)
     except Exception as e:
-        print(f'Error in round-robin route: {e}')
-        return render_template('round_robin.html', processes=[], params={}, round_robin_output=None)
+        logger.error(f'Error in {scheduler.slug} route: {e}')
+        return render_template('scheduler.html', scheduler=scheduler, style=style, processes=[], params={},
+                               output=None)
 
 @app.route('/generate', methods=['POST'])
 def generate_processes():
+    with request_profiler() as timer:
+        response = _generate_processes()
+    profile_summary(timer, 'generate')
+    return response
+
+def _generate_processes():
     try:
-        success = generate_new_processes()
+        with phase('generate processes'):
+            success = generate_new_processes()
         if not success:
             logger.error('Failed to generate new processes')
             return redirect(url_for('index'))
             
         # Run all schedulers with the new processes
-        for scheduler in ['fcfs', 'srtf', 'priority', 'round_robin']:
-            run_scheduler(scheduler)
+        for scheduler in scheduler_registry.schedulers():
+            if scheduler.script:
+                with phase(f'run {scheduler.slug}'):
+                    run_scheduler(scheduler.slug)
             
         # Generate new comparison chart
         try:
             from Schedulers.performance_analysis import main as analyze_performance
-            plot_path = analyze_performance()
+            with phase('analyze performance'):
+                plot_path = analyze_performance()
             
             if not plot_path:
                 logger.error('Failed to generate comparison chart')
@@ -464,43 +629,81 @@ def generate_processes():
         logger.error(f'Error in generate route: {e}')
         return redirect(url_for('index'))
 
-def cleanup_old_comparison_files(static_dir, keep_latest=5):
-    """Clean up old comparison files, keeping only the latest ones"""
-    try:
-        if not os.path.exists(static_dir):
-            print(f"Warning: Static directory {static_dir} does not exist")
-            return
-            
-        # Get all comparison files
-        comparison_files = [f for f in os.listdir(static_dir) if f.startswith('scheduling_comparison_')]
-        
-        if not comparison_files:
-            print("No old comparison files to clean up")
-            return
-            
-        # Sort by creation time (newest first)
-        comparison_files.sort(key=lambda x: os.path.getctime(os.path.join(static_dir, x)), reverse=True)
+def compute_comparison(runs, seed, context_switch, cache_penalty, aging, prediction, schedulers):
+    """
+    The comparison chart and system metrics of /compare: over runs seeded workloads
+    (Monte Carlo) when runs is set, otherwise for processes.txt.
+    schedulers are the names of the registered schedulers to compare.
+    Returns (plot_path, system_results, monte_carlo); monte_carlo is None for a single workload.
+    """
+    # matplotlib and the schedulers are loaded by the first comparison, not at startup
+    import matplotlib.pyplot as plt
+    from performance_analysis2 import plot_comparison, plot_monte_carlo_comparison
+
+    # Clear matplotlib cache
+    plt.close('all')
+    
+    monte_carlo = None
+    if runs is not None:
+        from Schedulers.monte_carlo import run_monte_carlo
+        with phase('monte carlo'):
+            monte_carlo = run_monte_carlo(runs=runs, seed=seed, context_switch=context_switch,
+                                          cache_penalty=cache_penalty, aging=aging, prediction=prediction,
+                                          schedulers=schedulers)
+        with phase('render'), CHART_RENDER.time(chart='monte_carlo'):
+            plot_path = plot_monte_carlo_comparison(monte_carlo)
+        system_results = {algo: {metric: stats['mean'] for metric, stats in metrics.items()}
+                          for algo, metrics in monte_carlo['metrics'].items()}
+    else:
+        # Generate the comparison plot and get the output file path
+        with phase('render'), CHART_RENDER.time(chart='comparison'):
+            plot_path = plot_comparison(schedulers)
         
-        # Remove old files
-        for old_file in comparison_files[keep_latest:]:
-            try:
-                file_path = os.path.join(static_dir, old_file)
-                os.remove(file_path)
-                print(f"Removed old comparison file: {old_file}")
-            except Exception as e:
-                print(f"Error removing old file {old_file}: {e}")
-    except Exception as e:
-        print(f"Error during cleanup: {e}")
+        # Throughput, utilization, ... need the execution trace, so run the schedulers in-process
+        from Schedulers.performance_analysis import compare_algorithms as compare_schedulers
+        from Schedulers.performance_analysis import read_processes as read_process_objects
+        with phase('parse'):
+            process_objects = read_process_objects(os.path.join(BASE_DIR, 'ProcessGeneratorModule', 'processes.txt'))
+        with phase('schedule'):
+            system_results = compare_schedulers(process_objects, verbose=False, context_switch=context_switch,
+                                                cache_penalty=cache_penalty, aging=aging, prediction=prediction,
+                                                schedulers=schedulers)
+    return plot_path, system_results, monte_carlo
 
 @app.route('/compare')
 def compare_algorithms():
     """Compare all scheduling algorithms"""
+    with request_profiler() as timer:
+        return _compare_algorithms(timer)
+
+def _compare_algorithms(timer):
     try:
-        # Clear matplotlib cache
-        plt.close('all')
-        
-        # Generate the comparison plot and get the output file path
-        plot_path = plot_comparison()
+        # ?mode=monte-carlo compares the algorithms over many seeded workloads
+        runs = seed = None
+        if request.args.get('mode') == 'monte-carlo':
+            runs = min(max(request.args.get('runs', WEB_MONTE_CARLO_MAX_RUNS, type=int), 2), WEB_MONTE_CARLO_MAX_RUNS)
+            seed = request.args.get('seed', 0, type=int)
+        # Optional dispatch overhead for the preemptive schedulers
+        context_switch = max(request.args.get('context_switch', 0.0, type=float), 0.0)
+        cache_penalty = max(request.args.get('cache_penalty', 0.0, type=float), 0.0)
+        # Optional aging of the Priority scheduler (priority units per unit of waiting time)
+        aging = max(request.args.get('aging', 0.0, type=float), 0.0)
+        # ?alpha=... runs SJF and SRTF on exponentially averaged burst predictions
+        prediction = None
+        if request.args.get('alpha') is not None:
+            prediction = {
+                'alpha': min(max(request.args.get('alpha', 0.5, type=float), 0.0), 1.0),
+                'initial_tau': max(request.args.get('tau', 5.0, type=float), 0.0)
+            }
+        # ?schedulers=FCFS,round_robin,... compares a subset of the registered schedulers (names or slugs)
+        schedulers = scheduler_registry.select(request.args.get('schedulers'))
+
+        # Identical comparisons requested at the same time are computed once
+        key = (runs, seed, context_switch, cache_penalty, aging,
+               tuple(sorted(prediction.items())) if prediction else None, tuple(schedulers))
+        plot_path, system_results, monte_carlo = single_flight(
+            'compare', key, compute_comparison, runs, seed, context_switch, cache_penalty, aging, prediction,
+            schedulers)
         
         if plot_path is None:
             logger.warning("No valid results found for comparison")
@@ -509,42 +712,88 @@ def compare_algorithms():
                                 input_params=read_input_params(),
                                 error="No valid results found for comparison")
         
-        # Get the filename from the full path
-        filename = os.path.basename(plot_path)
-        
-        # Add timestamp to force browser refresh
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Name of the plot in the artifact store (linked through its content hash)
+        filename = os.path.relpath(plot_path, ARTIFACTS.root).replace(os.sep, '/')
         
         return render_template('compare.html', 
                             processes=read_processes(),
                             input_params=read_input_params(),
                             comparison_file=filename,
-                            timestamp=timestamp)
+                            monte_carlo=monte_carlo,
+                            system_results=system_results,
+                            context_switch=context_switch,
+                            cache_penalty=cache_penalty,
+                            aging=aging,
+                            prediction=prediction,
+                            profile=profile_summary(timer, 'compare'))
                             
     except Exception as e:
         logger.error(f"Error in compare_algorithms: {e}")
+        SCHEDULER_FAILURES.inc(algorithm='compare', reason='exception')
         return render_template('compare.html', 
                             processes=read_processes(),
                             input_params=read_input_params(),
                             error=str(e))
 
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    try:
-        file_path = os.path.join(BASE_DIR, 'static', filename)
-        if not os.path.exists(file_path):
-            return "File not found", 404
-            
-        response = send_file(file_path)
-        # Set headers to prevent caching
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
-        response.headers['Last-Modified'] = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-        return response
-    except Exception as e:
-        logger.error(f"Error serving static file {filename}: {e}")
-        return "Error serving file", 500
+METRICS.register(CacheInfoCollector(
+    'scheduler_cache_requests', 'Cache lookups by cache (workload, input_params, results, chart_digest) and result',
+    {'workload': read_processes, 'input_params': read_input_params, 'results': run_scheduler},
+    extra=CACHE_EVENTS))
+
+@app.route('/metrics')
+def metrics():
+    """Operational metrics in the Prometheus text exposition format"""
+    return app.response_class(METRICS.render(), content_type=Registry.CONTENT_TYPE)
+
+# Content hashes of the charts, keyed by path and checked against the file's size and mtime
+_chart_digests = {}
+
+def chart_digest(path):
+    """Content hash of a chart file, recomputed only when the file changes."""
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _chart_digests.get(path)
+    if cached is not None and cached[0] == version:
+        CACHE_EVENTS.record('chart_digest', 'hit')
+        return cached[1]
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    _chart_digests[path] = (version, digest)
+    CACHE_EVENTS.record('chart_digest', 'miss')
+    return digest
+
+@app.template_global()
+def chart_url(filename):
+    """
+    URL of a chart in the artifact store that changes whenever the chart does.
+    A chart that does not exist (yet) gets a URL that answers 404.
+    """
+    path = ARTIFACTS.find(filename)
+    if path is None:
+        return url_for('serve_chart', digest='missing', filename=filename)
+    # A page view counts as a use even when the browser serves the image from its cache
+    ARTIFACTS.touch(filename)
+    return url_for('serve_chart', digest=chart_digest(path), filename=filename)
+
+@app.route('/charts/<digest>/<path:filename>')
+def serve_chart(digest, filename):
+    """
+    Serve a chart under its content hash.
+    - The URL never changes meaning, so it is cached for a year and marked immutable
+    - The hash is also the strong ETag, so conditional requests get 304 Not Modified
+    - An outdated hash (the chart was regenerated) redirects to the current URL
+    """
+    path = ARTIFACTS.find(filename)
+    if path is None:
+        return "File not found", 404
+    ARTIFACTS.touch(filename)
+    current = chart_digest(path)
+    if digest != current:
+        return redirect(url_for('serve_chart', digest=current, filename=filename))
+    response = send_file(path, etag=current, max_age=CHART_MAX_AGE, conditional=True)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 if __name__ == '__main__':
     try:
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from Schedulers.performance_analysis import Process
+
+EPSILON = 1e-6
+
+def random_workload(seed, count=8, deadlines=False):
+    """A small random workload of Process objects (integer times, so ties between processes happen)."""
+    rng = random.Random(seed)
+    return [Process(f"P{i + 1}", rng.randint(0, 20), rng.randint(1, 12), rng.randint(1, 20),
+                    deadline=rng.randint(5, 40) if deadlines else None)
+            for i in range(count)]
+
+def check_schedule(result, processes, cores=1):
+    """
+    Check the invariants every schedule in the FCFS/SRTF result structure must hold.
+    - Every process completes, no earlier than arrival + burst, and turnaround and waiting agree
+    - The run slices of a process never start before its arrival and add up to its burst
+    - No two run slices overlap on the same core
+    """
+    by_pid = {p.pid: p for p in processes}
+    assert sorted(r['pid'] for r in result['processes']) == sorted(by_pid)
+    for r in result['processes']:
+        p = by_pid[r['pid']]
+        assert r['completion'] >= p.arrival_time + p.burst_time - EPSILON
+        assert r['turnaround'] == pytest.approx(r['completion'] - p.arrival_time)
+        assert r['waiting'] == pytest.approx(r['turnaround'] - p.burst_time)
+
+    work = [s for s in result['execution_history'] if s.get('kind', 'run') == 'run']
+    ran = {}
+    for s in work:
+        assert s['start'] >= by_pid[s['pid']].arrival_time - EPSILON
+        assert s['end'] >= s['start']
+        ran[s['pid']] = ran.get(s['pid'], 0.0) + s['end'] - s['start']
+    for pid, p in by_pid.items():
+        assert ran.get(pid, 0.0) == pytest.approx(p.burst_time)
+
+    for core in range(cores):
+        slices = sorted((s for s in result['execution_history'] if s.get('core', 0) == core),
+                        key=lambda s: (s['start'], s['end']))
+        for previous, s in zip(slices, slices[1:]):
+            assert s['start'] >= previous['end'] - EPSILON
+
+@pytest.fixture(params=range(10))
+def workload(request):
+    """One of ten seeded random workloads."""
+    return random_workload(request.param)
+
+@pytest.fixture(params=range(10))
+def deadline_workload(request):
+    """One of ten seeded random workloads whose processes all have deadlines."""
+    return random_workload(request.param, deadlines=True)
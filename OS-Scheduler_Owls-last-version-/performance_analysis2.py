@@ -1,222 +1,340 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import os
-import time
-from datetime import datetime
-import glob
-import logging
-
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-def validate_result_file(result_file):
-    """Validate that a result file exists and is readable"""
-    try:
-        if not os.path.exists(result_file):
-            logger.warning(f"Result file {result_file} does not exist")
-            return False
-            
-        if not os.access(result_file, os.R_OK):
-            logger.warning(f"Result file {result_file} is not readable")
-            return False
-            
-        if os.path.getsize(result_file) == 0:
-            logger.warning(f"Result file {result_file} is empty")
-            return False
-            
-        return True
-    except Exception as e:
-        logger.error(f"Error validating result file {result_file}: {e}")
-        return False
-
-def read_scheduler_results(result_file):
-    """Read scheduler results and extract waiting and turnaround times"""
-    try:
-        if not validate_result_file(result_file):
-            return None
-            
-        with open(result_file, 'r') as f:
-            lines = f.readlines()
-            waiting_times = []
-            turnaround_times = []
-            avg_waiting = 0
-            avg_turnaround = 0
-            process_count = 0
-            
-            for line in lines:
-                if line.strip() and not line.startswith('Process ID'):
-                    parts = line.split()
-                    if len(parts) >= 6:
-                        try:
-                            waiting_time = float(parts[5])
-                            turnaround_time = float(parts[4])
-                            
-                            # Validate the times are non-negative
-                            if waiting_time < 0 or turnaround_time < 0:
-                                logger.warning(f"Invalid time value in {result_file}: {line.strip()}")
-                                continue
-                                
-                            waiting_times.append(waiting_time)
-                            turnaround_times.append(turnaround_time)
-                            process_count += 1
-                        except (ValueError, IndexError) as e:
-                            logger.warning(f"Error parsing line in {result_file}: {line.strip()}")
-                            continue
-                elif 'Average Waiting Time:' in line:
-                    try:
-                        avg_waiting = float(line.split(':')[1].strip())
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Error parsing average waiting time in {result_file}")
-                elif 'Average Turnaround Time:' in line:
-                    try:
-                        avg_turnaround = float(line.split(':')[1].strip())
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Error parsing average turnaround time in {result_file}")
-            
-            if not waiting_times or not turnaround_times:
-                logger.warning(f"No valid process data found in {result_file}")
-                return None
-                
-            # Validate that averages match calculated values
-            calculated_avg_waiting = sum(waiting_times) / len(waiting_times)
-            calculated_avg_turnaround = sum(turnaround_times) / len(turnaround_times)
-            
-            if abs(calculated_avg_waiting - avg_waiting) > 0.01 or abs(calculated_avg_turnaround - avg_turnaround) > 0.01:
-                logger.warning(f"Average values in {result_file} do not match calculated values")
-                avg_waiting = calculated_avg_waiting
-                avg_turnaround = calculated_avg_turnaround
-                
-            return {
-                'waiting_times': waiting_times,
-                'turnaround_times': turnaround_times,
-                'avg_waiting': avg_waiting,
-                'avg_turnaround': avg_turnaround,
-                'process_count': process_count
-            }
-    except Exception as e:
-        logger.error(f"Error reading {result_file}: {e}")
-        return None
-
-def cleanup_old_comparison_files(static_dir, keep_latest=5):
-    """Clean up old comparison files, keeping only the latest ones"""
-    try:
-        if not os.path.exists(static_dir):
-            logger.warning(f"Static directory {static_dir} does not exist")
-            return
-            
-        comparison_files = glob.glob(os.path.join(static_dir, 'scheduling_comparison_*.png'))
-        
-        if not comparison_files:
-            logger.info("No old comparison files to clean up")
-            return
-            
-        comparison_files.sort(key=os.path.getmtime, reverse=True)
-        
-        for old_file in comparison_files[keep_latest:]:
-            try:
-                os.remove(old_file)
-                logger.info(f"Removed old comparison file: {old_file}")
-            except Exception as e:
-                logger.error(f"Error removing old file {old_file}: {e}")
-    except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
-
-def plot_comparison():
-    """Create a real-time comparison of scheduling algorithms"""
-    fig = None
-    try:
-        # Get the base directory path
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        
-        # Define result files with absolute paths
-        result_files = {
-            'FCFS': os.path.join(BASE_DIR, 'fcfs_results.txt'),
-            'SRTF': os.path.join(BASE_DIR, 'srtf_results.txt'),
-            'Priority': os.path.join(BASE_DIR, 'priority_results.txt'),
-            'Round Robin': os.path.join(BASE_DIR, 'round_robin_results.txt')
-        }
-        
-        # Read results from all files
-        results = {}
-        for name, file in result_files.items():
-            try:
-                if not os.path.exists(file):
-                    logger.warning(f"Result file {file} does not exist")
-                    continue
-                results[name] = read_scheduler_results(file)
-            except Exception as e:
-                logger.error(f"Error reading results for {name}: {e}")
-                results[name] = None
-        
-        # Filter out None results
-        valid_results = {k: v for k, v in results.items() if v is not None}
-        if not valid_results:
-            logger.error("No valid results found for any algorithm")
-            return None
-        
-        # Set style for better web display
-        plt.style.use('ggplot')
-        
-        # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-        
-        # Plot average waiting times
-        algorithms = list(valid_results.keys())
-        avg_waiting = [valid_results[algo]['avg_waiting'] for algo in algorithms]
-        avg_turnaround = [valid_results[algo]['avg_turnaround'] for algo in algorithms]
-        
-        # Bar width
-        width = 0.35
-        
-        # Plot waiting times
-        bars1 = ax1.bar(algorithms, avg_waiting, width, color='#3498db', label='Average Waiting Time')
-        ax1.set_ylabel('Time', fontsize=12)
-        ax1.set_title('Comparison of Average Waiting Times', fontsize=14, pad=20)
-        ax1.bar_label(bars1, padding=3, fontsize=10, fmt='%.1f')
-        ax1.grid(True, linestyle='--', alpha=0.7)
-        
-        # Plot turnaround times
-        bars2 = ax2.bar(algorithms, avg_turnaround, width, color='#2ecc71', label='Average Turnaround Time')
-        ax2.set_ylabel('Time', fontsize=12)
-        ax2.set_title('Comparison of Average Turnaround Times', fontsize=14, pad=20)
-        ax2.bar_label(bars2, padding=3, fontsize=10, fmt='%.1f')
-        ax2.grid(True, linestyle='--', alpha=0.7)
-        
-        # Add process details
-        process_details = []
-        for algo in algorithms:
-            if valid_results[algo]:
-                process_details.append(f"{algo}: {valid_results[algo]['process_count']} processes")
-        
-        # Add process details to the plot
-        plt.figtext(0.5, 0.01, '\n'.join(process_details), ha='center', fontsize=10, 
-                   bbox=dict(facecolor='white', edgecolor='gray', alpha=0.8))
-        
-        # Add timestamp to the plot
-        plt.figtext(0.5, 0.95, f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
-                    ha='center', fontsize=10, bbox=dict(facecolor='white', edgecolor='gray', alpha=0.8))
-        
-        # Adjust layout
-        plt.tight_layout()
-        
-        # Create static/Schedulers directory if it doesn't exist
-        static_dir = os.path.join(BASE_DIR, 'static', 'Schedulers')
-        os.makedirs(static_dir, exist_ok=True)
-        
-        # Save the figure with a fixed name, overwriting any existing file
-        output_file = os.path.join(static_dir, 'scheduling_comparison.png')
-        plt.savefig(output_file, bbox_inches='tight', dpi=100)
-        plt.close(fig)
-        
-        logger.info(f"Comparison plot saved to {output_file}")
-        return output_file
-        
-    except Exception as e:
-        logger.error(f"Error creating comparison plot: {e}")
-        if fig:
-            plt.close(fig)
-        return None
-
-if __name__ == "__main__":
+import matplotlib.pyplot as plt
+import numpy as np
+import os
+import time
+from datetime import datetime
+import logging
+from Schedulers.metrics import tail_summary
+from Schedulers.results_file import parse_results
+from Schedulers.artifacts import default_store
+from Schedulers import registry
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def validate_result_file(result_file):
+    """Validate that a result file exists and is readable"""
+    try:
+        if not os.path.exists(result_file):
+            logger.warning(f"Result file {result_file} does not exist")
+            return False
+            
+        if not os.access(result_file, os.R_OK):
+            logger.warning(f"Result file {result_file} is not readable")
+            return False
+            
+        if os.path.getsize(result_file) == 0:
+            logger.warning(f"Result file {result_file} is empty")
+            return False
+            
+        return True
+    except Exception as e:
+        logger.error(f"Error validating result file {result_file}: {e}")
+        return False
+
+def read_scheduler_results(result_file):
+    """Read scheduler results and extract waiting and turnaround times"""
+    try:
+        if not validate_result_file(result_file):
+            return None
+            
+        with open(result_file, 'r') as f:
+            # The columns are found by their headings (Priority writes Start and Finish Time columns)
+            processes, averages = parse_results(f.readlines())
+            avg_waiting = averages.get('waiting', 0)
+            avg_turnaround = averages.get('turnaround', 0)
+            waiting_times = []
+            turnaround_times = []
+            response_times = []
+            process_count = 0
+
+            for process in processes:
+                # Validate the times are non-negative
+                if process['waiting'] < 0 or process['turnaround'] < 0:
+                    logger.warning(f"Invalid time value in {result_file}: process {process['pid']}")
+                    continue
+
+                waiting_times.append(process['waiting'])
+                turnaround_times.append(process['turnaround'])
+                if 'response' in process:
+                    response_times.append(process['response'])
+                process_count += 1
+            
+            if not waiting_times or not turnaround_times:
+                logger.warning(f"No valid process data found in {result_file}")
+                return None
+                
+            # Validate that averages match calculated values
+            calculated_avg_waiting = sum(waiting_times) / len(waiting_times)
+            calculated_avg_turnaround = sum(turnaround_times) / len(turnaround_times)
+            
+            if abs(calculated_avg_waiting - avg_waiting) > 0.01 or abs(calculated_avg_turnaround - avg_turnaround) > 0.01:
+                logger.warning(f"Average values in {result_file} do not match calculated values")
+                avg_waiting = calculated_avg_waiting
+                avg_turnaround = calculated_avg_turnaround
+                
+            results = {
+                'waiting_times': waiting_times,
+                'turnaround_times': turnaround_times,
+                'avg_waiting': avg_waiting,
+                'avg_turnaround': avg_turnaround,
+                'waiting_tail': tail_summary(waiting_times),
+                'turnaround_tail': tail_summary(turnaround_times),
+                'process_count': process_count
+            }
+            # Response times need a First Response (or Start Time) column, which older FCFS/SRTF files lack
+            if len(response_times) == process_count:
+                results['response_times'] = response_times
+                results['avg_response'] = sum(response_times) / process_count
+                results['response_tail'] = tail_summary(response_times)
+            return results
+    except Exception as e:
+        logger.error(f"Error reading {result_file}: {e}")
+        return None
+
+def plot_comparison(schedulers=None):
+    """
+    Create a real-time comparison of scheduling algorithms from their result files.
+    schedulers selects them by name or slug (default: every registered scheduler with a results file).
+    """
+    fig = None
+    try:
+        # Get the base directory path
+        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+        
+        # The results file each selected scheduler's script writes, with absolute paths
+        result_files = {
+            name: os.path.join(BASE_DIR, 'Schedulers', registry.get(name).results_file)
+            for name in registry.select(schedulers) if registry.get(name).results_file
+        }
+        
+        # Read results from all files
+        results = {}
+        for name, file in result_files.items():
+            try:
+                if not os.path.exists(file):
+                    logger.warning(f"Result file {file} does not exist")
+                    continue
+                results[name] = read_scheduler_results(file)
+            except Exception as e:
+                logger.error(f"Error reading results for {name}: {e}")
+                results[name] = None
+        
+        # Filter out None results
+        valid_results = {k: v for k, v in results.items() if v is not None}
+        if not valid_results:
+            logger.error("No valid results found for any algorithm")
+            return None
+        
+        # Set style for better web display
+        plt.style.use('ggplot')
+        
+        # Create figure with three subplots
+        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 12))
+        
+        # Plot average waiting times
+        algorithms = list(valid_results.keys())
+        avg_waiting = [valid_results[algo]['avg_waiting'] for algo in algorithms]
+        avg_turnaround = [valid_results[algo]['avg_turnaround'] for algo in algorithms]
+        
+        # Bar width
+        width = 0.35
+        
+        # Plot waiting times
+        bars1 = ax1.bar(algorithms, avg_waiting, width, color='#3498db', label='Average Waiting Time')
+        ax1.set_ylabel('Time', fontsize=12)
+        ax1.set_title('Comparison of Average Waiting Times', fontsize=14, pad=20)
+        ax1.bar_label(bars1, padding=3, fontsize=10, fmt='%.1f')
+        ax1.grid(True, linestyle='--', alpha=0.7)
+        
+        # Plot turnaround times
+        bars2 = ax2.bar(algorithms, avg_turnaround, width, color='#2ecc71', label='Average Turnaround Time')
+        ax2.set_ylabel('Time', fontsize=12)
+        ax2.set_title('Comparison of Average Turnaround Times', fontsize=14, pad=20)
+        ax2.bar_label(bars2, padding=3, fontsize=10, fmt='%.1f')
+        ax2.grid(True, linestyle='--', alpha=0.7)
+        
+        # Plot tail latency: averages hide the starvation of long jobs
+        tail_series = [
+            ('P95 Waiting', 'waiting_tail', 'p95', '#3498db'),
+            ('Max Waiting', 'waiting_tail', 'max', '#1f618d'),
+            ('P95 Turnaround', 'turnaround_tail', 'p95', '#2ecc71'),
+            ('Max Turnaround', 'turnaround_tail', 'max', '#1e8449'),
+            ('P95 Response', 'response_tail', 'p95', '#e67e22'),
+            ('Max Response', 'response_tail', 'max', '#a04000')
+        ]
+        x = np.arange(len(algorithms))
+        tail_width = 0.8 / len(tail_series)
+        for i, (label, key, stat, color) in enumerate(tail_series):
+            bars = ax3.bar(x + (i - (len(tail_series) - 1) / 2) * tail_width,
+                           [valid_results[algo].get(key, {}).get(stat, 0) for algo in algorithms],
+                           tail_width, color=color, label=label)
+            ax3.bar_label(bars, padding=3, fontsize=8, fmt='%.1f')
+        ax3.set_xticks(x)
+        ax3.set_xticklabels(algorithms)
+        ax3.set_ylabel('Time', fontsize=12)
+        ax3.set_title('Tail Latency (P95 and Max)', fontsize=14, pad=20)
+        ax3.legend(fontsize=9)
+        ax3.grid(True, linestyle='--', alpha=0.7)
+        
+        # Add process details
+        process_details = []
+        for algo in algorithms:
+            if valid_results[algo]:
+                process_details.append(f"{algo}: {valid_results[algo]['process_count']} processes")
+        
+        # Add process details to the plot
+        plt.figtext(0.5, 0.01, '\n'.join(process_details), ha='center', fontsize=10, 
+                   bbox=dict(facecolor='white', edgecolor='gray', alpha=0.8))
+        
+        # Add timestamp to the plot
+        plt.figtext(0.5, 0.95, f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
+                    ha='center', fontsize=10, bbox=dict(facecolor='white', edgecolor='gray', alpha=0.8))
+        
+        # Adjust layout
+        plt.tight_layout()
+        
+        # Save the figure into the artifact store with a fixed name, overwriting any existing file
+        store = default_store()
+        output_file = store.path('compare/scheduling_comparison.png')
+        plt.savefig(output_file, bbox_inches='tight', dpi=100)
+        plt.close(fig)
+        store.add('compare/scheduling_comparison.png')
+        
+        logger.info(f"Comparison plot saved to {output_file}")
+        return output_file
+        
+    except Exception as e:
+        logger.error(f"Error creating comparison plot: {e}")
+        if fig:
+            plt.close(fig)
+        return None
+
+def plot_monte_carlo_comparison(result):
+    """Plot mean waiting/turnaround/response times with confidence intervals from run_monte_carlo"""
+    fig = None
+    try:
+        metrics = result['metrics']
+        algorithms = list(metrics.keys())
+        
+        plt.style.use('ggplot')
+        fig, axes = plt.subplots(3, 1, figsize=(12, 11))
+        
+        titles = [
+            ('avg_waiting', 'Average Waiting Time', '#3498db'),
+            ('avg_turnaround', 'Average Turnaround Time', '#2ecc71'),
+            ('avg_response', 'Average Response Time', '#e74c3c')
+        ]
+        for ax, (metric, title, color) in zip(axes, titles):
+            means = [metrics[algo][metric]['mean'] for algo in algorithms]
+            errors = [metrics[algo][metric]['half_width'] for algo in algorithms]
+            bars = ax.bar(algorithms, means, 0.35, yerr=errors, capsize=6, color=color)
+            ax.set_ylabel('Time', fontsize=12)
+            ax.set_title(f"{title} ({int(result['confidence'] * 100)}% CI)", fontsize=14, pad=20)
+            ax.bar_label(bars, labels=[f"{m:.1f} ± {e:.1f}" for m, e in zip(means, errors)],
+                         padding=3, fontsize=10)
+            ax.grid(True, linestyle='--', alpha=0.7)
+        
+        plt.figtext(0.5, 0.01, f"{result['runs']} seeded workloads (seeds {result['seeds'][0]}-{result['seeds'][-1]})",
+                    ha='center', fontsize=10, bbox=dict(facecolor='white', edgecolor='gray', alpha=0.8))
+        
+        plt.tight_layout()
+        
+        store = default_store()
+        output_file = store.path('compare/scheduling_comparison_monte_carlo.png')
+        plt.savefig(output_file, bbox_inches='tight', dpi=100)
+        plt.close(fig)
+        store.add('compare/scheduling_comparison_monte_carlo.png')
+        
+        logger.info(f"Monte Carlo comparison plot saved to {output_file}")
+        return output_file
+        
+    except Exception as e:
+        logger.error(f"Error creating Monte Carlo comparison plot: {e}")
+        if fig:
+            plt.close(fig)
+        return None
+
+def plot_benchmark_comparison(comparison):
+    """Plot the per-size speed change and throughput of two benchmark runs from benchmark_history.compare_runs"""
+    fig = None
+    try:
+        rows = comparison['rows']
+        if not rows:
+            logger.error("The benchmark runs have no engine and size in common")
+            return None
+        engines = list(dict.fromkeys(r['engine'] for r in rows))
+        sizes = sorted({r['size'] for r in rows})
+        
+        plt.style.use('ggplot')
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 11))
+        
+        # Change of the median time per engine and size, colored by significance
+        status_colors = {'slower': '#e74c3c', 'faster': '#2ecc71', 'unchanged': '#95a5a6'}
+        cells = {(r['engine'], r['size']): r for r in rows}
+        x = np.arange(len(engines))
+        width = 0.8 / len(sizes)
+        for i, size in enumerate(sizes):
+            offsets = x + (i - (len(sizes) - 1) / 2) * width
+            for j, engine in enumerate(engines):
+                cell = cells.get((engine, size))
+                if cell is None:
+                    continue
+                change = (cell['ratio'] - 1) * 100
+                bar = ax1.bar(offsets[j], change, width, color=status_colors[cell['status']])
+                ax1.bar_label(bar, labels=[f"{size:,}"], padding=2, fontsize=7, rotation=90)
+        ax1.axhline(0, color='black', linewidth=0.8)
+        for sign in (1, -1):
+            ax1.axhline(sign * comparison['threshold'] * 100, color='gray', linestyle=':', linewidth=0.8)
+        ax1.set_xticks(x)
+        ax1.set_xticklabels(engines, rotation=20, ha='right')
+        ax1.set_ylabel('Median time change (%)', fontsize=12)
+        ax1.set_title('Benchmark Change per Workload Size (bars labelled with the size)', fontsize=14, pad=20)
+        ax1.legend(handles=[plt.Rectangle((0, 0), 1, 1, color=c) for c in status_colors.values()],
+                   labels=['Significantly slower', 'Significantly faster', 'No significant change'], fontsize=9)
+        ax1.grid(True, linestyle='--', alpha=0.7)
+        
+        # Throughput at each engine's largest common size
+        largest = {}
+        for r in rows:
+            if r['size'] >= largest.get(r['engine'], {'size': -1})['size']:
+                largest[r['engine']] = r
+        before = [largest[e]['baseline_ops_per_sec'] for e in engines]
+        after = [largest[e]['candidate_ops_per_sec'] for e in engines]
+        bars1 = ax2.bar(x - 0.2, before, 0.4, color='#3498db', label='Baseline')
+        bars2 = ax2.bar(x + 0.2, after, 0.4, color='#e67e22', label='Candidate')
+        ax2.bar_label(bars1, padding=3, fontsize=8, fmt='%.0f')
+        ax2.bar_label(bars2, padding=3, fontsize=8, fmt='%.0f')
+        ax2.set_xticks(x)
+        ax2.set_xticklabels([f"{e}\n(n={largest[e]['size']:,})" for e in engines], rotation=20, ha='right')
+        ax2.set_ylabel('Processes per second', fontsize=12)
+        ax2.set_title('Throughput at the Largest Common Size', fontsize=14, pad=20)
+        ax2.legend(fontsize=9)
+        ax2.grid(True, linestyle='--', alpha=0.7)
+        
+        def name(run):
+            return run.get('label') or run.get('revision') or run.get('timestamp')
+        plt.figtext(0.5, 0.01, f"Baseline {name(comparison['baseline'])} vs candidate {name(comparison['candidate'])}: "
+                    f"{comparison['regressions']} significant slowdown(s), {comparison['improvements']} speedup(s)",
+                    ha='center', fontsize=10, bbox=dict(facecolor='white', edgecolor='gray', alpha=0.8))
+        
+        plt.tight_layout(rect=(0, 0.03, 1, 1))
+        
+        store = default_store()
+        output_file = store.path('compare/benchmark_comparison.png')
+        plt.savefig(output_file, bbox_inches='tight', dpi=100)
+        plt.close(fig)
+        store.add('compare/benchmark_comparison.png')
+        
+        logger.info(f"Benchmark comparison plot saved to {output_file}")
+        return output_file
+        
+    except Exception as e:
+        logger.error(f"Error creating benchmark comparison plot: {e}")
+        if fig:
+            plt.close(fig)
+        return None
+
+if __name__ == "__main__":
     plot_comparison() 
\ No newline at end of file
@@ -0,0 +1,55 @@
+import threading
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one execution.
+    - The first caller for a key runs the function; callers that arrive while it runs
+      wait for it and receive the same result (or the same exception)
+    - Nothing is cached: once the call returns the key is forgotten and the next caller
+      starts a new execution, so put everything the result depends on into the key
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        Run function(*args, **kwargs), or join the identical call already in flight.
+        Returns (result, shared); shared is True for callers that joined another one's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self):
+        """Number of keys with a call running."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from Schedulers.artifacts import ArtifactStore
+
+def write(store, name, size, used):
+    """Write an artifact of size bytes whose last use was at time used (seconds)."""
+    path = store.path(name)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    os.utime(path, ns=(used * 10**9, used * 10**9))
+
+def test_least_recently_used_are_evicted_first(tmp_path):
+    store = ArtifactStore(tmp_path, budget=250)
+    write(store, 'a.png', 100, used=1)
+    write(store, 'gantt/b.png', 100, used=2)
+    write(store, 'c.png', 100, used=3)
+    assert [name for name, _, _ in store.entries()] == ['a.png', 'gantt/b.png', 'c.png']
+    assert store.evict() == ['a.png']
+    assert store.usage() == (2, 200)
+
+def test_touch_records_a_use(tmp_path):
+    store = ArtifactStore(tmp_path, budget=250)
+    write(store, 'a.png', 100, used=1)
+    write(store, 'b.png', 100, used=2)
+    assert store.touch('a.png')
+    write(store, 'c.png', 100, used=3)
+    # a.png was used just now, after b.png and c.png were written
+    assert store.evict() == ['b.png']
+
+def test_add_never_evicts_the_new_artifact(tmp_path):
+    store = ArtifactStore(tmp_path, budget=50)
+    write(store, 'old.png', 40, used=1)
+    write(store, 'new.png', 100, used=0)
+    assert store.add('new.png') == ['old.png']
+    assert store.find('new.png') is not None
+    assert store.usage() == (1, 100)
+
+def test_names_outside_the_store_are_rejected(tmp_path):
+    store = ArtifactStore(tmp_path / 'store')
+    with pytest.raises(ValueError):
+        store.path('../escape.png')
+    assert store.find('../escape.png') is None
+    assert store.find('missing.png') is None
+    assert not store.touch('missing.png')
+
+def test_negative_budget_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ArtifactStore(tmp_path, budget=-1)
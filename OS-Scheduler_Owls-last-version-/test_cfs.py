@@ -0,0 +1,43 @@
+import pytest
+
+from Schedulers import registry
+from Schedulers.CFS.cfs import cfs_scheduling, priority_to_weight, NICE_0_PRIORITY
+from Schedulers.performance_analysis import Process
+from conftest import check_schedule
+
+def cpu_time(processes, until, **options):
+    _, execution_history = cfs_scheduling(processes, verbose=False, return_history=True, **options)
+    shares = {}
+    for s in execution_history:
+        if s.get('kind', 'run') == 'run' and s['start'] < until:
+            shares[s['pid']] = shares.get(s['pid'], 0.0) + min(s['end'], until) - s['start']
+    return shares
+
+def test_schedule_is_valid(workload):
+    check_schedule(registry.get('CFS').run(workload), workload)
+
+def test_weights_follow_nice_levels():
+    assert priority_to_weight(NICE_0_PRIORITY) == 1024
+    assert priority_to_weight(NICE_0_PRIORITY - 1) > 1024 > priority_to_weight(NICE_0_PRIORITY + 1)
+    # Clamped to nice -20..19
+    assert priority_to_weight(-100) == priority_to_weight(NICE_0_PRIORITY - 20)
+
+def test_equal_weights_share_equally():
+    shares = cpu_time([Process('P1', 0, 100, NICE_0_PRIORITY), Process('P2', 0, 100, NICE_0_PRIORITY)], 60)
+    assert shares['P1'] == pytest.approx(shares['P2'], abs=3)
+
+def test_shares_follow_weights():
+    high, low = NICE_0_PRIORITY - 5, NICE_0_PRIORITY
+    shares = cpu_time([Process('P1', 0, 500, high), Process('P2', 0, 500, low)], 300)
+    expected = priority_to_weight(high) / priority_to_weight(low)
+    assert shares['P1'] / shares['P2'] == pytest.approx(expected, rel=0.1)
+
+def test_late_arrival_does_not_claim_missed_time():
+    # A process arriving at t=50 starts at the minimum virtual runtime, so it shares the CPU
+    # from then on instead of running alone until it has caught up
+    shares = cpu_time([Process('P1', 0, 200, NICE_0_PRIORITY), Process('P2', 50, 200, NICE_0_PRIORITY)], 110)
+    assert shares['P2'] == pytest.approx(30, abs=3)
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        cfs_scheduling([Process('P1', 0, 5, 1)], target_latency=0, verbose=False)
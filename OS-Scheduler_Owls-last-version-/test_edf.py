@@ -0,0 +1,42 @@
+import pytest
+
+from Schedulers import registry
+from Schedulers.RealTime.edf import edf_scheduling
+from Schedulers.performance_analysis import Process
+from conftest import check_schedule
+
+def slices(processes, **options):
+    _, execution_history = edf_scheduling(processes, verbose=False, return_history=True, **options)
+    return [(s['pid'], s['start'], s['end']) for s in execution_history if s.get('kind', 'run') == 'run']
+
+def test_schedule_is_valid(deadline_workload):
+    result = registry.get('EDF').run(deadline_workload)
+    check_schedule(result, deadline_workload)
+
+def test_earlier_deadline_arrival_preempts():
+    assert slices([Process('P1', 0, 10, 1, deadline=20), Process('P2', 2, 3, 1, deadline=4)]) == [
+        ('P1', 0, 2), ('P2', 2, 5), ('P1', 5, 13)]
+
+def test_processes_without_deadline_run_last():
+    assert slices([Process('P1', 0, 5, 1), Process('P2', 1, 2, 1, deadline=50)]) == [
+        ('P1', 0, 1), ('P2', 1, 3), ('P1', 3, 7)]
+
+def test_feasible_set_meets_every_deadline():
+    # Utilization below 1 with deadlines at the end of each job's window: EDF misses none
+    processes = [Process('P1', 0, 3, 1, deadline=10), Process('P2', 0, 2, 1, deadline=4),
+                 Process('P3', 1, 4, 1, deadline=8), Process('P4', 5, 1, 1, deadline=2)]
+    results, _ = edf_scheduling(processes, verbose=False, return_history=True)
+    assert all(r['Lateness'] <= 0 for r in results)
+
+def test_lateness_is_measured_from_the_absolute_deadline(deadline_workload):
+    results, _ = edf_scheduling(deadline_workload, verbose=False, return_history=True)
+    by_pid = {p.pid: p for p in deadline_workload}
+    for r in results:
+        p = by_pid[r['Process ID']]
+        assert r['Deadline'] == p.arrival_time + p.deadline
+        assert r['Lateness'] == pytest.approx(r['Completion Time'] - r['Deadline'])
+
+def test_switch_costs_are_recorded():
+    _, execution_history = edf_scheduling([Process('P1', 0, 10, 1, deadline=20), Process('P2', 2, 3, 1, deadline=4)],
+                                          context_switch=1.0, verbose=False, return_history=True)
+    assert sum(1 for s in execution_history if s.get('kind') == 'switch') >= 2
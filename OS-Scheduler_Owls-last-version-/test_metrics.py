@@ -0,0 +1,85 @@
+import random
+
+import numpy as np
+import pytest
+
+from Schedulers.metrics import (P2Quantile, StreamingTailSummary, tail_summary, system_metrics, deadline_metrics,
+                                flatten_tail)
+
+def samples(distribution, n=20000, seed=0):
+    rng = random.Random(seed)
+    draw = {
+        'uniform': lambda: rng.uniform(0, 100),
+        'exponential': lambda: rng.expovariate(0.1),
+        'normal': lambda: rng.gauss(50, 10)
+    }[distribution]
+    return [draw() for _ in range(n)]
+
+@pytest.mark.parametrize('distribution', ['uniform', 'exponential', 'normal'])
+@pytest.mark.parametrize('quantile', [0.5, 0.9, 0.95, 0.99])
+def test_p2_matches_numpy(distribution, quantile):
+    values = samples(distribution)
+    estimator = P2Quantile(quantile)
+    for x in values:
+        estimator.add(x)
+    exact = np.percentile(values, quantile * 100)
+    spread = np.percentile(values, 99) - np.percentile(values, 1)
+    assert abs(estimator.value() - exact) <= 0.02 * spread
+
+def test_p2_with_few_values_is_exact():
+    estimator = P2Quantile(0.9)
+    assert estimator.value() == 0.0
+    for x in [5.0, 1.0, 3.0]:
+        estimator.add(x)
+    assert estimator.value() == pytest.approx(np.percentile([5.0, 1.0, 3.0], 90))
+
+def test_streaming_and_exact_summaries_agree():
+    values = samples('exponential', seed=3)
+    exact = tail_summary(values)
+    streaming = tail_summary(iter(values))
+    assert set(streaming) == set(exact) == {'p50', 'p90', 'p95', 'p99', 'max'}
+    assert streaming['max'] == exact['max'] == max(values)
+    for key in ('p50', 'p90', 'p95', 'p99'):
+        assert streaming[key] == pytest.approx(exact[key], rel=0.05)
+    assert tail_summary(values, streaming=True) == streaming
+
+def test_streaming_summary_tracks_the_maximum_of_negative_values():
+    tracker = StreamingTailSummary()
+    for x in [-5.0, -2.0, -9.0]:
+        tracker.add(x)
+    assert tracker.summary()['max'] == -2.0
+
+def test_empty_tail_summary():
+    assert tail_summary([]) == {'p50': 0.0, 'p90': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+    assert flatten_tail('waiting', {'p95': 1.0, 'max': 2.0}) == {'p95_waiting': 1.0, 'max_waiting': 2.0}
+
+def test_deadline_metrics():
+    processes = [{'pid': 'P1', 'completion': 10.0}, {'pid': 'P2', 'completion': 4.0},
+                 {'pid': 'P3', 'completion': 7.0}, {'pid': 'P4', 'completion': 3.0}]
+    metrics = deadline_metrics(processes, {'P1': 8.0, 'P2': 6.0, 'P3': 7.0, 'P4': None})
+    assert metrics == {
+        'deadline_misses': 1,
+        'deadline_miss_ratio': pytest.approx(1 / 3),
+        'avg_lateness': pytest.approx(0.0),
+        'max_lateness': 2.0,
+        'avg_tardiness': pytest.approx(2 / 3),
+        'max_tardiness': 2.0
+    }
+    assert deadline_metrics(processes, {}) == {}
+
+def test_system_metrics():
+    history = [{'pid': 'P1', 'start': 1.0, 'end': 3.0},
+               {'pid': 'P2', 'start': 3.0, 'end': 3.5, 'kind': 'switch'},
+               {'pid': 'P2', 'start': 3.5, 'end': 5.0},
+               {'pid': 'P1', 'start': 5.0, 'end': 6.0},
+               {'pid': 'P2', 'start': 8.0, 'end': 9.0}]
+    metrics = system_metrics(history, arrivals=[0.0, 2.0])
+    assert metrics['makespan'] == 9.0
+    assert metrics['busy_time'] == 5.5
+    assert metrics['switch_time'] == 0.5
+    assert metrics['idle_time'] == pytest.approx(3.0)
+    assert metrics['utilization'] == pytest.approx(5.5 / 9.0)
+    assert metrics['throughput'] == pytest.approx(2 / 9.0)
+    assert metrics['context_switches'] == 3
+    assert metrics['preemptions'] == 2
+    assert metrics['migrations'] == 0
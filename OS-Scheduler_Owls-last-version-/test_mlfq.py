@@ -0,0 +1,35 @@
+import pytest
+
+from Schedulers import registry
+from Schedulers.MLFQ.mlfq import mlfq_scheduling
+from Schedulers.performance_analysis import Process
+from conftest import check_schedule
+
+def history(processes, **options):
+    _, execution_history = mlfq_scheduling(processes, verbose=False, return_history=True, **options)
+    return [(s['pid'], s['start'], s['end'], s['level']) for s in execution_history if s.get('kind', 'run') == 'run']
+
+def test_schedule_is_valid(workload):
+    check_schedule(registry.get('MLFQ').run(workload), workload)
+
+def test_schedule_is_valid_with_switch_costs(workload):
+    _, execution_history = mlfq_scheduling(workload, context_switch=0.5, cache_penalty=0.25, verbose=False,
+                                           return_history=True)
+    assert all(s['end'] - s['start'] == pytest.approx(0.5) or s['end'] - s['start'] == pytest.approx(0.75)
+               for s in execution_history if s.get('kind') == 'switch')
+
+def test_full_quantum_demotes():
+    assert history([Process('P1', 0, 30, 1)], boost_interval=None) == [
+        ('P1', 0, 4, 0), ('P1', 4, 12, 1), ('P1', 12, 28, 2), ('P1', 28, 30, 2)]
+
+def test_arrival_at_a_higher_level_preempts():
+    slices = history([Process('P1', 0, 20, 1), Process('P2', 6, 2, 1)], boost_interval=None)
+    assert slices[:3] == [('P1', 0, 4, 0), ('P1', 4, 6, 1), ('P2', 6, 8, 0)]
+
+def test_boost_moves_everything_back_to_the_top():
+    slices = history([Process('P1', 0, 40, 1)], boost_interval=10)
+    assert any(level == 0 and start >= 10 for _, start, _, level in slices)
+
+def test_invalid_quanta():
+    with pytest.raises(ValueError):
+        mlfq_scheduling([Process('P1', 0, 5, 1)], quanta=(4.0, 0.0), verbose=False)
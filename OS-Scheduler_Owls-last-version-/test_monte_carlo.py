@@ -0,0 +1,12 @@
+import pytest
+
+from Schedulers.monte_carlo import _t_critical
+
+# Two-sided critical values from the Student t table
+TABLE = [(1, 0.95, 12.706), (2, 0.95, 4.303), (5, 0.95, 2.571), (10, 0.95, 2.228), (29, 0.95, 2.045),
+         (30, 0.95, 2.042), (60, 0.95, 2.000), (120, 0.95, 1.980), (1, 0.99, 63.657), (5, 0.99, 4.032),
+         (20, 0.99, 2.845), (3, 0.90, 2.353), (40, 0.90, 1.684)]
+
+@pytest.mark.parametrize('df, confidence, expected', TABLE)
+def test_t_critical_matches_the_table(df, confidence, expected):
+    assert _t_critical(df, confidence) == pytest.approx(expected, abs=2e-3)
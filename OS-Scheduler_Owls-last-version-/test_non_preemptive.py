@@ -0,0 +1,25 @@
+import pytest
+
+from Schedulers import registry
+from Schedulers.NonPreemptive.non_preemptive import sjf_scheduling, priority_np_scheduling
+from Schedulers.performance_analysis import Process
+from conftest import check_schedule
+
+def order(scheduling, processes):
+    _, execution_history = scheduling(processes, verbose=False, return_history=True)
+    return [s['pid'] for s in execution_history if s.get('kind', 'run') == 'run']
+
+@pytest.mark.parametrize('name', ['SJF', 'Priority (NP)'])
+def test_schedule_is_valid(workload, name):
+    result = registry.get(name).run(workload)
+    check_schedule(result, workload)
+    # Never preempted: one slice per process
+    assert len([s for s in result['execution_history'] if s.get('kind', 'run') == 'run']) == len(workload)
+
+def test_sjf_runs_the_shortest_ready_job():
+    processes = [Process('P1', 0, 5, 1), Process('P2', 1, 8, 1), Process('P3', 2, 2, 1), Process('P4', 2, 2, 1)]
+    assert order(sjf_scheduling, processes) == ['P1', 'P3', 'P4', 'P2']
+
+def test_priority_waits_for_the_running_process():
+    processes = [Process('P1', 0, 5, 9), Process('P2', 1, 3, 1), Process('P3', 1, 3, 5)]
+    assert order(priority_np_scheduling, processes) == ['P1', 'P2', 'P3']
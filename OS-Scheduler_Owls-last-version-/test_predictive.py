@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from Schedulers import registry
+from Schedulers.Predictive.predictive import predictive_scheduling, prediction_error, split_bursts
+from Schedulers.performance_analysis import Process
+from conftest import check_schedule
+
+@pytest.mark.parametrize('count', [1, 2, 4, 7])
+def test_split_bursts_adds_up(count):
+    bursts = split_bursts(13.0, count, rng=random.Random(count))
+    assert len(bursts) == count
+    assert sum(bursts) == pytest.approx(13.0)
+    assert all(b > 0 for b in bursts)
+
+def test_predictions_are_the_exponential_average():
+    # CPU bursts 4, 8 and 2 (the I/O bursts in between are not predicted)
+    process = Process('P1', 0, 14, 1, bursts=[4, 1, 8, 1, 2])
+    results = predictive_scheduling([process], alpha=0.5, initial_tau=5.0, verbose=False)
+    assert results[0]['Predictions'] == [(5.0, 4), (4.5, 8), (6.25, 2)]
+
+def test_prediction_error():
+    results = [{'Predictions': [(5.0, 4.0), (4.0, 8.0)]}, {'Predictions': [(2.0, 0.0)]}]
+    error = prediction_error(results)
+    assert error['mae'] == pytest.approx((1 + 4 + 2) / 3)
+    assert error['mape'] == pytest.approx((0.25 + 0.5) / 2)
+    assert error['bias'] == pytest.approx((1 - 4 + 2) / 3)
+    assert error['bursts'] == 3
+    assert prediction_error([]) == {'mae': 0.0, 'mape': 0.0, 'bias': 0.0, 'bursts': 0}
+
+@pytest.mark.parametrize('name', ['SJF', 'SRTF'])
+@pytest.mark.parametrize('oracle', [False, True])
+def test_schedule_is_valid(workload, name, oracle):
+    result = registry.get(name).run(workload, prediction={'oracle': oracle})
+    check_schedule(result, workload)
+    assert result['prediction']['bursts'] == 4 * len(workload)
+
+def test_oracle_is_no_worse_than_predictions():
+    # Ordering by the real bursts minimizes the average waiting time of non-preemptive SJF
+    # on one arrival batch, so the predictor can only match it
+    processes = [Process(f"P{i}", 0, burst, 1) for i, burst in enumerate([3, 17, 8, 1, 12, 6])]
+    def waiting(oracle):
+        results = predictive_scheduling(processes, bursts_per_process=1, oracle=oracle, verbose=False)
+        return sum(r['Waiting Time'] for r in results)
+    assert waiting(True) <= waiting(False)
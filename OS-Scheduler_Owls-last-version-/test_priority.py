@@ -0,0 +1,36 @@
+import pytest
+
+from Schedulers import registry
+from Schedulers.priority import highest_priority_first, PREEMPT_MARGIN
+from conftest import check_schedule
+
+def slices(processes, **options):
+    _, history = highest_priority_first(processes, verbose=False, return_history=True, **options)
+    return [(s['pid'], s['start'], s['end']) for s in history if s.get('kind', 'run') == 'run']
+
+def row(pid, arrival, burst, priority):
+    return {'pid': pid, 'arrival': arrival, 'burst': burst, 'priority': priority}
+
+@pytest.mark.parametrize('aging', [0.0, 0.5, 1.0])
+def test_schedule_is_valid(workload, aging):
+    check_schedule(registry.get('Priority').run(workload, aging=aging), workload)
+
+def test_higher_priority_arrival_preempts():
+    assert slices([row('P1', 0, 10, 5), row('P2', 1, 10, 4)]) == [('P1', 0, 1), ('P2', 1, 11), ('P1', 11, 20)]
+
+def test_aging_does_not_depend_on_unrelated_arrivals():
+    # An unrelated low priority arrival used to be the only moment aging could preempt
+    alone = slices([row('P1', 0, 10, 5), row('P2', 0, 10, 5)], aging=1.0)
+    with_p3 = slices([row('P1', 0, 10, 5), row('P2', 0, 10, 5), row('P3', 3, 1, 99)], aging=1.0)
+    assert [s for s in with_p3 if s[0] != 'P3'] == alone
+
+def test_aged_process_takes_the_cpu_back():
+    history = slices([row('P1', 0, 10, 5), row('P2', 1, 10, 4)], aging=1.0)
+    assert history[:2] == [('P1', 0, 1), ('P2', 1, 3)]
+    # P1 aged while P2 ran and preempts it before P2 finishes
+    assert history[2][0] == 'P1' and history[2][1] < 11
+
+def test_preemption_happens_when_priorities_cross():
+    # P2 waits from 0 and reaches P1's priority minus the margin after (1 + PREEMPT_MARGIN) time units
+    history = slices([row('P1', 0, 10, 5), row('P2', 0, 10, 6)], aging=1.0)
+    assert history[0] == ('P1', 0, pytest.approx(1 + PREEMPT_MARGIN))
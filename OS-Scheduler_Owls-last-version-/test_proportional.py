@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from Schedulers import registry
+from Schedulers.performance_analysis import Process
+from Schedulers.Proportional.proportional import (FenwickTree, lottery_scheduling, stride_scheduling,
+                                                  priority_to_tickets)
+from conftest import check_schedule
+
+def linear_find(counts, k):
+    """The slot holding the k-th ticket, by a scan."""
+    for slot, count in enumerate(counts):
+        if k < count:
+            return slot
+        k -= count
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 8, 9, 33])
+def test_fenwick_find_matches_a_linear_scan(size):
+    rng = random.Random(size)
+    counts = [0] * size
+    tree = FenwickTree(size)
+    for _ in range(200):
+        slot = rng.randrange(size)
+        delta = rng.randint(-counts[slot], 20)
+        counts[slot] += delta
+        tree.add(slot, delta)
+        assert tree.total == sum(counts)
+        for k in range(tree.total):
+            assert tree.find(k) == linear_find(counts, k)
+
+def cpu_time(history, until):
+    """CPU time of every process in the slices before until."""
+    shares = {}
+    for s in history:
+        if s.get('kind', 'run') == 'run' and s['start'] < until:
+            shares[s['pid']] = shares.get(s['pid'], 0.0) + min(s['end'], until) - s['start']
+    return shares
+
+def competing():
+    # Priority 1 holds twice the tickets of priority 11, and both are busy for the whole window
+    assert priority_to_tickets(1) == 2 * priority_to_tickets(11)
+    return [Process('P1', 0, 2000, 1), Process('P2', 0, 2000, 11)]
+
+def test_stride_shares_follow_tickets():
+    _, history = stride_scheduling(competing(), verbose=False, return_history=True)
+    shares = cpu_time(history, 240)
+    assert shares['P1'] == pytest.approx(2 * shares['P2'], abs=4)
+
+def test_lottery_shares_follow_tickets_on_average():
+    _, history = lottery_scheduling(competing(), seed=1, verbose=False, return_history=True)
+    shares = cpu_time(history, 3000)
+    assert shares['P1'] / shares['P2'] == pytest.approx(2, rel=0.15)
+
+def test_lottery_is_reproducible(workload):
+    first = lottery_scheduling(workload, seed=7, verbose=False, return_history=True)
+    assert lottery_scheduling(workload, seed=7, verbose=False, return_history=True) == first
+
+@pytest.mark.parametrize('name', ['Lottery', 'Stride'])
+@pytest.mark.parametrize('time_quantum', [1.0, 4.0])
+def test_schedule_is_valid(workload, name, time_quantum):
+    check_schedule(registry.get(name).run(workload, time_quantum=time_quantum), workload)
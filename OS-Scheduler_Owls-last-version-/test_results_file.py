@@ -0,0 +1,46 @@
+import os
+import glob
+
+import pytest
+
+from Schedulers.results_file import parse_results
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILES = sorted(glob.glob(os.path.join(BASE_DIR, 'Schedulers', '*', '*_results.txt')))
+
+def read(path):
+    with open(path) as f:
+        return f.readlines()
+
+@pytest.mark.parametrize('path', RESULTS_FILES, ids=os.path.basename)
+def test_committed_results_are_consistent(path):
+    # Read by position, the Priority file gave its Priority and Start Time columns as completion and turnaround
+    processes, averages = parse_results(read(path))
+    assert processes
+    for p in processes:
+        assert p['turnaround'] == pytest.approx(p['completion'] - p['arrival'], abs=0.01)
+        assert p['waiting'] == pytest.approx(p['turnaround'] - p['burst'], abs=0.01)
+        assert -0.01 <= p['response'] <= p['waiting'] + 0.01
+    assert averages['waiting'] == pytest.approx(sum(p['waiting'] for p in processes) / len(processes), abs=0.01)
+
+def test_priority_columns():
+    lines = ["Process ID   Arrival Time   Burst Time   Priority   Start Time   Finish Time  Turnaround   Waiting\n",
+             "-" * 100 + "\n",
+             "P1           2.00           3.00         7          4.00         9.00         7.00         4.00\n",
+             "\n",
+             "Average Waiting Time: 4.00\n"]
+    processes, averages = parse_results(lines)
+    assert processes == [{'pid': 'P1', 'arrival': 2.0, 'burst': 3.0, 'priority': 7.0, 'completion': 9.0,
+                          'turnaround': 7.0, 'waiting': 4.0, 'response': 2.0}]
+    assert averages == {'waiting': 4.0}
+
+def test_unknown_columns_are_skipped():
+    lines = ["Process ID   Arrival Time   Burst Time   Completion   Turnaround   Waiting      First Response   "
+             "Bursts   Pred. Error\n",
+             "P1           0.00           5.00         8.00         8.00         3.00         1.00             3        0.50\n"]
+    processes, _ = parse_results(lines)
+    assert processes[0]['completion'] == 8.0 and processes[0]['response'] == 1.0
+
+def test_missing_column_is_an_error():
+    with pytest.raises(ValueError):
+        parse_results(["Process ID   Arrival Time   Burst Time   Completion\n"])
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from single_flight import SingleFlight
+
+class CountingEvent(threading.Event):
+    """An Event that counts the threads waiting on it."""
+    def __init__(self):
+        super().__init__()
+        self.waiting = threading.Semaphore(0)
+
+    def wait(self, timeout=None):
+        self.waiting.release()
+        return super().wait(timeout)
+
+def test_concurrent_calls_are_coalesced():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def work(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value * 2
+
+    results = []
+    def call():
+        results.append(flight.do('key', work, 21))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert started.wait(5)
+    # Count the callers that join the leader's call before letting it finish
+    done = flight._calls['key'].done = CountingEvent()
+    followers = [threading.Thread(target=call) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    for _ in followers:
+        assert done.waiting.acquire(timeout=5)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert calls == [21]
+    assert sorted(results) == [(42, False)] + [(42, True)] * 4
+    assert flight.in_flight() == 0
+
+def test_errors_are_shared():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise RuntimeError('boom')
+
+    errors = []
+    def call():
+        try:
+            flight.do('key', fail)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call)]
+    threads[0].start()
+    assert started.wait(5)
+    done = flight._calls['key'].done = CountingEvent()
+    threads.append(threading.Thread(target=call))
+    threads[1].start()
+    assert done.waiting.acquire(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    # The caller that joined gets the leader's exception
+    assert len(errors) == 2 and errors[0] is errors[1]
+
+def test_results_are_not_cached():
+    flight = SingleFlight()
+    counter = iter(range(10))
+    assert flight.do('key', next, counter) == (0, False)
+    assert flight.do('key', next, counter) == (1, False)
+    with pytest.raises(ZeroDivisionError):
+        flight.do('key', lambda: 1 / 0)
+    assert flight.in_flight() == 0
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do('a', str.upper, 'x') == ('X', False)
+    assert flight.do('b', str.upper, 'y') == ('Y', False)
@@ -0,0 +1,43 @@
+import pytest
+
+from Schedulers import registry, smp
+from conftest import check_schedule, random_workload
+
+# On one core these give exactly the single-core schedule; CFS and Stride can break ties
+# between equal virtual runtimes (passes) differently, and Lottery draws its own tickets
+EXACT = ['FCFS', 'SRTF', 'Priority', 'Round Robin', 'MLFQ', 'SJF', 'Priority (NP)', 'EDF']
+
+@pytest.mark.parametrize('algorithm', EXACT)
+@pytest.mark.parametrize('seed', range(10))
+def test_one_core_matches_the_single_core_engine(algorithm, seed):
+    processes = random_workload(seed, deadlines=True)
+    expected = registry.get(algorithm).run(processes)
+    result = smp.simulate_smp(processes, algorithm=algorithm, cores=1)
+    completion = {p['pid']: p['completion'] for p in expected['processes']}
+    assert {p['pid']: p['completion'] for p in result['processes']} == pytest.approx(completion)
+    assert result['averages']['waiting'] == pytest.approx(expected['averages']['waiting'])
+
+@pytest.mark.parametrize('algorithm', smp.ALGORITHMS)
+@pytest.mark.parametrize('placement', smp.PLACEMENTS)
+@pytest.mark.parametrize('cores', [1, 2, 4])
+def test_schedule_is_valid(algorithm, placement, cores):
+    processes = random_workload(cores, count=12, deadlines=True)
+    result = smp.simulate_smp(processes, algorithm=algorithm, cores=cores, placement=placement)
+    check_schedule(result, processes, cores=cores)
+    assert sum(core['busy_time'] for core in result['per_core']) == pytest.approx(sum(p.burst_time for p in processes))
+
+def test_more_cores_finish_sooner():
+    processes = random_workload(3, count=12)
+    makespans = [smp.simulate_smp(processes, cores=cores)['system']['makespan'] for cores in (1, 2, 4)]
+    assert makespans[0] > makespans[1] > makespans[2]
+
+def test_invalid_configuration():
+    processes = random_workload(0)
+    with pytest.raises(ValueError):
+        smp.simulate_smp(processes, cores=0)
+    with pytest.raises(ValueError):
+        smp.simulate_smp(processes, speeds=[1.0, 0.0])
+    with pytest.raises(ValueError):
+        smp.simulate_smp(processes, placement='nowhere')
+    with pytest.raises(ValueError):
+        smp.make_policy('Unknown')